@@ -14,6 +14,7 @@ project's repository at https://github.com/leonhard-s/auraxium.
 
 from . import census, errors, event, ps2
 from .base import Cached, Named, Ps2Object
+from ._cache import ResponseCache
 from ._client import Client
 from .event import EventClient, Trigger
 from ._proxy import InstanceProxy, SequenceProxy
@@ -29,6 +30,7 @@ __all__ = [
     'Named',
     'ps2',
     'Ps2Object',
+    'ResponseCache',
     'SequenceProxy',
     'Trigger'
 ]
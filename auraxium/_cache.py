@@ -3,17 +3,27 @@
 This defines a generic cache that can be used to keep local copies of
 remote data. This is especially useful for small but expensive queries
 like character name resolution.
+
+It also defines the optional cache for raw API responses used by the
+REST client.
 """
 
 import dataclasses
 import datetime
 import logging
+import pickle
 import sys
+import time
 from collections import OrderedDict
 from collections.abc import Hashable, Iterable, Iterator
 from typing import Generic, TypeVar
 
+import yarl
+
+from .types import CensusData
+
 __all__ = [
+    'ResponseCache',
     'TLRUCache'
 ]
 
@@ -22,7 +32,7 @@ _V = TypeVar('_V')
 log = logging.getLogger('auraxium.cache')
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class _CacheItem(Generic[_V]):
     """Small dataclass for cache items.
 
@@ -127,8 +137,9 @@ class TLRUCache(Generic[_K, _V]):
 
         """
         now = datetime.datetime.now()
-        log.debug('%s: Adding %s instance under key %d',
-                  self.name, item.__class__.__name__, key)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('%s: Adding %s instance under key %s',
+                      self.name, item.__class__.__name__, key)
         self.free(count=1)
         self._data[key] = _CacheItem(item, 0, now, now)
 
@@ -216,24 +227,29 @@ class TLRUCache(Generic[_K, _V]):
            exceeds the TTU set for the cache).
         """
         now = datetime.datetime.now()
+        debug = log.isEnabledFor(logging.DEBUG)
         try:
             item = self._data[key]
         except KeyError:
-            log.debug('%s: Key %s not found', self.name, key)
+            if debug:
+                log.debug('%s: Key %s not found', self.name, key)
             return None
         item.access_counter += 1
         if self.ttu > 0:
             age = now - item.first_added
             if age.total_seconds() > self.ttu:
-                log.debug(
-                    '%s: Key %d expired, age: %.1f sec. (max: %.1f sec.)',
-                    self.name, key, age.total_seconds(), self.ttu)
+                if debug:
+                    log.debug(
+                        '%s: Key %s expired, age: %.1f sec. '
+                        '(max: %.1f sec.)',
+                        self.name, key, age.total_seconds(), self.ttu)
                 del self._data[key]
                 return None
-        else:
+        elif debug:
             log.debug('%s: Skipping expiration check (TTU %d)',
                       self.name, self.ttu)
-        log.debug('%s: Key %d found, moving to top', self.name, key)
+        if debug:
+            log.debug('%s: Key %s found, moving to top', self.name, key)
         self._data.move_to_end(key, last=True)
         item.last_accessed = now
         self._data[key] = item
@@ -293,7 +309,9 @@ class TLRUCache(Generic[_K, _V]):
                 keys_to_remove.append(key)
         _ = [self._data.pop(k) for k in keys_to_remove]
         count = len(keys_to_remove)
-        log.debug('%s: Removed %d expired items', self.name, count)
+        # This runs for every insertion, so only non-empty removals are logged
+        if count and log.isEnabledFor(logging.DEBUG):
+            log.debug('%s: Removed %d expired items', self.name, count)
         return count
 
     def remove_lru(self, count: int = 1) -> None:
@@ -325,3 +343,183 @@ class TLRUCache(Generic[_K, _V]):
         :return: A list of all items in the cache.
         """
         return [v.value for v in self._data.values()]
+
+
+class ResponseCache:
+    """Cache for raw REST API responses.
+
+    Responses are keyed by their request URL, with the service ID
+    removed. Every response is kept for the lifetime configured for
+    its collection and query verb via :meth:`set_ttl`, falling back
+    to the default :attr:`ttl`. A lifetime of zero or less disables
+    caching for matching requests.
+
+    Once :attr:`size` responses are cached, the least recently used
+    response is discarded.
+
+    .. code-block:: python3
+
+       cache = auraxium.ResponseCache(size=500, ttl=0.0)
+       cache.set_ttl(30.0, collection='leaderboard')
+       cache.set_ttl(10.0, collection='world_event')
+       cache.set_ttl(300.0, verb='count')
+
+       async with auraxium.Client(response_cache=cache) as client:
+           ...
+
+    Responses are stored in serialised form. Every cache hit returns
+    a new copy of the response, so callers may modify it freely.
+
+    .. attribute:: size
+       :type: int
+
+       The maximum number of responses to keep.
+
+    .. attribute:: ttl
+       :type: float
+
+       The default lifetime of cached responses in seconds.
+    """
+
+    def __init__(self, size: int = 1000, ttl: float = 30.0) -> None:
+        """Create a new, empty response cache.
+
+        :param int size: The maximum number of responses to keep.
+        :param float ttl: The default lifetime of cached responses in
+           seconds.
+        :raises ValueError: Raised if `size` is less than 1.
+        """
+        if size < 1:
+            raise ValueError(f'{size} is not a valid cache size')
+        self.size: int = size
+        self.ttl: float = ttl
+        self._data: 'OrderedDict[str, tuple[float, bytes]]' = OrderedDict()
+        self._ttls: dict[tuple[str | None, str | None], float] = {}
+
+    def __contains__(self, url: yarl.URL) -> bool:
+        """Return whether a valid response for the URL is cached."""
+        item = self._data.get(self.key(url))
+        return item is not None and item[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        """Return the number of responses in the cache.
+
+        This includes expired responses that have not been removed yet.
+        """
+        return len(self._data)
+
+    def add(self, url: yarl.URL, data: CensusData) -> None:
+        """Add a response to the cache.
+
+        Responses whose lifetime is zero or less are ignored.
+
+        :param yarl.URL url: The URL of the request.
+        :param auraxium.types.CensusData data: The response received.
+        """
+        if (ttl := self.lifetime(url)) <= 0.0:
+            return
+        key = self.key(url)
+        self._data[key] = (time.monotonic() + ttl,
+                           pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+        self._data.move_to_end(key)
+        while len(self._data) > self.size:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all responses from the cache."""
+        self._data.clear()
+
+    def get(self, url: yarl.URL) -> CensusData | None:
+        """Return a copy of the cached response for a URL.
+
+        :param yarl.URL url: The URL of the request.
+        :return: The cached response, or :obj:`None` if no response is
+           cached or it has expired.
+        """
+        key = self.key(url)
+        if (item := self._data.get(key)) is None:
+            return None
+        expires, data = item
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        response: CensusData = pickle.loads(data)
+        return response
+
+    def lifetime(self, url: yarl.URL) -> float:
+        """Return the lifetime of responses for the given URL.
+
+        The lifetime is looked up by collection and verb, then by
+        collection, then by verb, before falling back to :attr:`ttl`.
+
+        :param yarl.URL url: The URL of the request.
+        :return: The lifetime of the response in seconds.
+        """
+        verb, collection = _components(url)
+        ttls = self._ttls
+        for key in ((collection, verb), (collection, None), (None, verb)):
+            if (ttl := ttls.get(key)) is not None:
+                return ttl
+        return self.ttl
+
+    def remove_expired(self) -> int:
+        """Remove any expired responses from the cache.
+
+        :return: The number of responses removed.
+        """
+        now = time.monotonic()
+        expired = [k for k, (t, _) in self._data.items() if t <= now]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def set_ttl(self, ttl: float, collection: str | None = None,
+                verb: str | None = None) -> None:
+        """Set the lifetime of responses for a collection or verb.
+
+        Lifetimes set for both a collection and verb take precedence
+        over those only set for a collection, which in turn take
+        precedence over those only set for a verb.
+
+        :param float ttl: The lifetime of matching responses in
+           seconds. Set to zero or less to disable caching.
+        :param collection: The collection to configure, e.g.
+           ``'character'``.
+        :type collection: str | None
+        :param verb: The query verb to configure, e.g. ``'count'``.
+        :type verb: str | None
+        :raises ValueError: Raised if neither a collection nor a verb
+           is given. Set :attr:`ttl` to change the default lifetime.
+        """
+        if collection is None and verb is None:
+            raise ValueError('A collection or verb is required')
+        self._ttls[collection, verb] = ttl
+
+    @staticmethod
+    def key(url: yarl.URL) -> str:
+        """Return the cache key for a URL.
+
+        This is the URL with its service ID removed, if any.
+
+        :param yarl.URL url: The URL of the request.
+        :return: The canonical URL used as the cache key.
+        """
+        string = str(url)
+        path = url.raw_path
+        if path.startswith('/s:'):
+            end = path.find('/', 1)
+            string = string.replace(path[:end] if end > 0 else path, '', 1)
+        return string
+
+
+def _components(url: yarl.URL) -> tuple[str, str | None]:
+    """Return the query verb and collection of a REST API URL."""
+    parts = url.raw_path.split('/')[1:]
+    if parts and parts[0].startswith('s:'):
+        parts.pop(0)
+    if parts and parts[0] in ('xml', 'json'):
+        parts.pop(0)
+    verb = parts[0] if parts else ''
+    collection = parts[2] if len(parts) > 2 and parts[2] else None
+    return verb, collection
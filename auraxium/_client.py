@@ -41,6 +41,12 @@ class Client(RequestClient):
 
        The :mod:`asyncio` event loop used by the client.
 
+    .. attribute:: response_cache
+       :type: auraxium.ResponseCache | None
+
+       The cache for raw API responses, if any. Set via the
+       ``response_cache`` argument.
+
     .. attribute:: service_id
        :type: str
 
@@ -102,8 +108,8 @@ class Client(RequestClient):
             query.offset(offset)
         query.exact_match_first(promote_exact).case(check_case)
         matches = await self.request(query)
-        return [type_(i, client=self) for i in extract_payload(
-            matches, type_.collection)]
+        return type_.from_payloads(
+            extract_payload(matches, type_.collection), client=self)
 
     async def get(self, type_: type[_Ps2ObjectT], check_case: bool = True,
                   **kwargs: Any) -> _Ps2ObjectT | None:
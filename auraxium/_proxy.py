@@ -3,12 +3,13 @@
 import asyncio
 import copy
 import datetime
+import functools
 import warnings
 from collections.abc import Awaitable, Generator
 from typing import Any, Generic, TypeVar
 
 from .base import Ps2Object
-from .census import JoinedQuery, Query
+from .census import BoundQuery, JoinedQuery, PreparedQuery, Query
 from ._rest import RequestClient, extract_payload
 from .types import CensusData
 
@@ -21,6 +22,12 @@ __all__ = [
 _Ps2ObjectT = TypeVar('_Ps2ObjectT', bound=Ps2Object)
 
 
+@functools.cache
+def _by_id(type_: type[Ps2Object]) -> PreparedQuery:
+    """Return a prepared query retrieving an object by its ID."""
+    return PreparedQuery(Query(type_.collection), id=type_.id_field)
+
+
 class Proxy(Generic[_Ps2ObjectT]):
     """Base class for any proxy objects.
 
@@ -33,10 +40,13 @@ class Proxy(Generic[_Ps2ObjectT]):
     .. attribute:: query
        :type: auraxium.census.Query
 
-       The API query used to populate the proxy object.
+       The API query used to populate the proxy object. Proxies
+       created from a :class:`~auraxium.census.BoundQuery` only create
+       this query when it is first accessed; any changes made to it
+       then apply to all subsequent requests made by the proxy.
     """
 
-    def __init__(self, type_: type[_Ps2ObjectT], query: Query,
+    def __init__(self, type_: type[_Ps2ObjectT], query: Query | BoundQuery,
                  client: RequestClient, lifetime: float = 60.0) -> None:
         """Initialise the proxy.
 
@@ -45,12 +55,12 @@ class Proxy(Generic[_Ps2ObjectT]):
 
         :param type_: The object type represented by the proxy.
         :type type_: type[auraxium.base.Ps2Object]
-        :param auraxium.census.Query query: The query used to retrieve
-           the data.
+        :param query: The query used to retrieve the data.
+        :type query: auraxium.census.Query | auraxium.census.BoundQuery
         :param float lifetime: The time-to-use of the retrieved data.
         """
         self._type = type_
-        self.query: Query = query
+        self._query = query
         self._client = client
         self._ttu = lifetime
         self._data: list[_Ps2ObjectT]
@@ -62,6 +72,20 @@ class Proxy(Generic[_Ps2ObjectT]):
             datetime.timezone.utc) - self._last_fetched
         assert self._ttu < max_age.total_seconds()
 
+    @property
+    def query(self) -> Query:
+        """Return the API query used to populate the proxy object."""
+        if isinstance(self._query, BoundQuery):
+            query = self._query.query()
+            query.data.service_id = self._client.service_id
+            self._query = query
+        return self._query
+
+    @query.setter
+    def query(self, value: Query) -> None:
+        """Replace the API query used to populate the proxy object."""
+        self._query = value
+
     async def _poll(self) -> None:
         """Query the API, retrieving the data.
 
@@ -69,9 +93,9 @@ class Proxy(Generic[_Ps2ObjectT]):
         same object multiple times.
         """
         async with self._lock:
-            payload = await self._client.request(self.query)
+            payload = await self._client.request(self._query)
             list_ = self._resolve_nested_payload(payload)
-            self._data = [self._type(d, client=self._client) for d in list_]
+            self._data = self._type.from_payloads(list_, client=self._client)
             self._last_fetched = datetime.datetime.now(datetime.timezone.utc)
 
     def _resolve_nested_payload(self, payload: CensusData) -> list[CensusData]:
@@ -115,16 +139,19 @@ class Proxy(Generic[_Ps2ObjectT]):
                     data.extend(resolve_join(inner, parent))
             return data
 
-        # Main query
-        assert self.query.data.collection is not None
-        data = extract_payload(payload, self.query.data.collection)
+        # Main query; the terms of bound queries are not needed here
+        query = self._query
+        if isinstance(query, BoundQuery):
+            query = query.prepared.query
+        assert query.data.collection is not None
+        data = extract_payload(payload, query.data.collection)
         # Resolve any joins
-        if self.query.joins:
+        if query.joins:
             parent = copy.copy(data)
             # If any joins were defined, resolve each of the joins and merge
             # their outputs before returning
             data.clear()
-            for join in self.query.joins:
+            for join in query.joins:
                 data.extend(resolve_join(join, parent))
         return data
 
@@ -178,6 +205,22 @@ class InstanceProxy(Proxy[_Ps2ObjectT]):
     def __await__(self) -> Generator[Any, None, _Ps2ObjectT | None]:
         return self.resolve().__await__()
 
+    @classmethod
+    def by_id(cls, type_: type[_Ps2ObjectT], id_: int, client: RequestClient,
+              lifetime: float = 60.0) -> 'InstanceProxy[_Ps2ObjectT]':
+        """Create a proxy for the object with the given ID.
+
+        The query used is prepared once per object type and shared
+        between all proxies created through this method.
+
+        :param type_: The object type represented by the proxy.
+        :type type_: type[auraxium.base.Ps2Object]
+        :param int id_: The unique ID of the object.
+        :param float lifetime: The time-to-use of the retrieved data.
+        :return: A proxy for the object.
+        """
+        return cls(type_, _by_id(type_).bind(id=id_), client, lifetime)
+
     async def resolve(self) -> _Ps2ObjectT | None:
         """Return the proxy object.
 
@@ -24,7 +24,8 @@ import aiohttp
 import yarl
 
 import auraxium._backoff as backoff
-from .census import Query
+from ._cache import ResponseCache
+from .census import BoundQuery, Query
 from .endpoints import defaults as default_endpoints
 from .errors import (PayloadError, BadRequestSyntaxError, CensusError,
                      InvalidSearchTermError, InvalidServiceIDError,
@@ -52,7 +53,7 @@ class RequestClient:
     def __init__(self, loop: asyncio.AbstractEventLoop | None = None,
                  service_id: str = 's:example', profiling: bool = False,
                  endpoints: yarl.URL | str | list[yarl.URL] | list[str] | None = None,
-                 ) -> None:
+                 response_cache: ResponseCache | None = None) -> None:
 
         self.endpoints: list[yarl.URL] = []
         if endpoints is None:
@@ -66,8 +67,10 @@ class RequestClient:
             loop = asyncio.get_running_loop()
         self.loop: asyncio.AbstractEventLoop = loop
         self.profiling: bool = profiling
+        self.response_cache: ResponseCache | None = response_cache
         self.service_id: str = service_id
         self.session: aiohttp.ClientSession = aiohttp.ClientSession()
+        self._pending: dict[str, asyncio.Task[CensusData]] = {}
         self._timing_cache: list[float] = []
         _log.addFilter(RedactingFilter(self.service_id))
 
@@ -130,16 +133,35 @@ class RequestClient:
         # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
         await asyncio.sleep(0.250)
 
-    async def request(self, query: Query, verb: str = 'get') -> CensusData:
+    async def request(self, query: Query | BoundQuery,
+                      verb: str = 'get') -> CensusData:
         """Perform a REST API request.
 
         This performs the query and performs error checking to ensure
         the query is valid.
 
-        :param auraxium.census.Query query: The query to perform.
+        Bound queries are always sent using the client's service ID.
+
+        If the client has a :attr:`response_cache`, cached responses
+        are returned without sending a request, and identical requests
+        made while a response is pending share that response. The cache
+        is not used while :attr:`profiling` is enabled.
+
+        :param query: The query to perform.
+        :type query: auraxium.census.Query | auraxium.census.BoundQuery
         :param str verb: The query verb to utilise.
         :return: The API response payload received.
         """
+        if self.response_cache is not None and not self.profiling:
+            url = _query_url(query, self.endpoints, verb, self.service_id)
+            return await self._request_cached(url, self.response_cache, verb)
+        if isinstance(query, BoundQuery):
+            if not self.profiling:
+                return await run_query(
+                    query, verb=verb, session=self.session,
+                    endpoints=self.endpoints, service_id=self.service_id)
+            query = query.query()
+            query.data.service_id = self.service_id
         if self.profiling:
             # Create a copy of the query before modifying it
             query = copy.copy(query)
@@ -148,7 +170,7 @@ class RequestClient:
                                endpoints=self.endpoints)
         if self.profiling and verb == 'get':
             timing = cast(CensusData, data.pop('timing'))
-            if _log.level <= logging.DEBUG:  # pragma: no cover
+            if _log.isEnabledFor(logging.DEBUG):  # pragma: no cover
                 url = query.url()
                 _log.debug('Query times for "%s?%s": %s',
                            '/'.join(url.parts[-2:]), url.query_string,
@@ -156,6 +178,32 @@ class RequestClient:
             self._timing_cache.append(float(str(timing['total-ms'])))
         return data
 
+    async def _request_cached(self, url: yarl.URL, cache: ResponseCache,
+                              verb: str) -> CensusData:
+        """Perform a request through the response cache."""
+        if cache.lifetime(url) <= 0.0:
+            return await _fetch(url, self.session, verb)
+        if (data := cache.get(url)) is not None:
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug('Restored %s response from cache: %s',
+                           verb.upper(), url)
+            return data
+        key = cache.key(url)
+        if (task := self._pending.get(key)) is None:
+            task = self.loop.create_task(_fetch(url, self.session, verb))
+            self._pending[key] = task
+
+            def on_done(task: asyncio.Task[CensusData]) -> None:
+                del self._pending[key]
+                if not task.cancelled() and task.exception() is None:
+                    cache.add(url, task.result())
+
+            task.add_done_callback(on_done)
+        # Shielded so that cancelling one caller does not cancel the others
+        data = await asyncio.shield(task)
+        # Callers must not share the response instance
+        return cache.get(url) or copy.deepcopy(data)
+
 
 def get_components(url: yarl.URL) -> tuple[str, str | None]:
     """Return the namespace and collection of a given query.
@@ -415,25 +463,54 @@ def _process_invalid_search_term(msg: str, url: yarl.URL) -> None:
             url, namespace, collection, f'c:{method}')
 
 
-async def run_query(query: Query, session: aiohttp.ClientSession,
-                    endpoints: list[yarl.URL], verb: str = 'get'
-                    ) -> CensusData:
+async def run_query(query: Query | BoundQuery,
+                    session: aiohttp.ClientSession,
+                    endpoints: list[yarl.URL], verb: str = 'get',
+                    service_id: str | None = None) -> CensusData:
     """Perform a top-level Query using the provided HTTP session.
 
     This will handle check both the HTTP response and JSON contents for
     errors before returning.
 
-    :param auraxium.census.Query query: The query to run.
+    :param query: The query to run.
+    :type query: auraxium.census.Query | auraxium.census.BoundQuery
     :param aiohttp.ClientSession session: The session to use for the
        request.
     :param str verb: The query verb to pass.
+    :param service_id: The service ID to use for bound queries.
+       Defaults to that of the prepared query.
+    :type service_id: str | None
     :raises ResponseError: Raised if the HTTP response contained error
        codes or could not be parsed.
     :return: The response dictionary received.
     """
+    url = _query_url(query, endpoints, verb, service_id)
+    return await _fetch(url, session, verb)
+
+
+def _query_url(query: Query | BoundQuery, endpoints: list[yarl.URL],
+               verb: str, service_id: str | None = None) -> yarl.URL:
+    """Return the URL to request for a query."""
+    # TODO: Support multiple endpoints
+    if isinstance(query, BoundQuery):
+        return query.url(verb, service_id=service_id, endpoint=endpoints[0])
     query = copy.copy(query)
-    query.endpoint = endpoints[0]  # TODO: Support multiple endpoints
-    url = query.url(verb=verb)
+    query.endpoint = endpoints[0]
+    return query.url(verb=verb)
+
+
+async def _fetch(url: yarl.URL, session: aiohttp.ClientSession,
+                 verb: str = 'get') -> CensusData:
+    """Request a URL and check the response for errors.
+
+    :param yarl.URL url: The URL to request.
+    :param aiohttp.ClientSession session: The session to use for the
+       request.
+    :param str verb: The query verb used, for logging.
+    :raises ResponseError: Raised if the HTTP response contained error
+       codes or could not be parsed.
+    :return: The response dictionary received.
+    """
     _log.debug('Performing %s request: %s', verb.upper(), url)
 
     def on_success(details: backoff.Details) -> None:  # pragma: no cover
@@ -6,8 +6,11 @@ throughout the PlanetSide 2 object model.
 """
 
 import abc
+import functools
 import logging
-from typing import Any, ClassVar, TypeVar, cast
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Annotated, Any, ClassVar, TypeVar, cast, get_args
 
 import pydantic
 
@@ -25,12 +28,169 @@ __all__ = [
     'Named'
 ]
 
+_T = TypeVar('_T')
 CachedT = TypeVar('CachedT', bound='Cached')
 NamedT = TypeVar('NamedT', bound='Named')
 Ps2ObjectT = TypeVar('Ps2ObjectT', bound='Ps2Object')
 
 _log = logging.getLogger('auraxium.ps2')
 
+# Canonical instances of interned values, least recently used first. See
+# Ps2Object.set_interning()
+_INTERNED: 'OrderedDict[tuple[Any, ...], Any]' = OrderedDict()
+# The maximum number of interned values to keep
+_INTERN_LIMIT = 65_536
+
+
+@functools.cache
+def _list_adapter(model: type[RESTPayload]) -> pydantic.TypeAdapter[Any]:
+    """Return a type adapter validating lists of the given model.
+
+    Building an adapter is comparatively expensive, so one adapter is
+    created and reused for each model.
+
+    :param model: The model to validate lists of.
+    :type model: type[auraxium.models.base.RESTPayload]
+    :return: The type adapter for lists of the model.
+    """
+    return pydantic.TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+@functools.cache
+def _field_adapter(model: type[RESTPayload],
+                   name: str) -> pydantic.TypeAdapter[Any]:
+    """Return a type adapter validating a single field of a model.
+
+    :param model: The model the field belongs to.
+    :type model: type[auraxium.models.base.RESTPayload]
+    :param str name: The name of the field.
+    :return: The type adapter for values of the field.
+    """
+    field = model.model_fields[name]
+    type_: Any = field.annotation
+    if field.metadata:
+        type_ = Annotated[tuple([type_, *field.metadata])]
+    return pydantic.TypeAdapter(type_)
+
+
+def _is_localized(annotation: Any) -> bool:
+    """Return whether a field annotation refers to a localised string.
+
+    :param typing.Any annotation: The annotation of the field.
+    :return: Whether the field holds a ``LocalizedString`` model.
+    """
+    return any(getattr(t, '__name__', None) == 'LocalizedString'
+               for t in (annotation, *get_args(annotation)))
+
+
+def _intern(key: tuple[Any, ...], factory: Callable[[], _T]) -> _T:
+    """Return the canonical instance of a value.
+
+    If no value is interned for the given key yet, one is created
+    using `factory`. Once more than :data:`_INTERN_LIMIT` values are
+    interned, the least recently used ones are discarded.
+
+    :param tuple[typing.Any, ...] key: The key identifying the value.
+    :param factory: Callable creating the value if it is not interned.
+    :type factory: collections.abc.Callable[[], typing.Any]
+    :return: The interned instance of the value.
+    """
+    if (interned := _INTERNED.get(key)) is not None:
+        _INTERNED.move_to_end(key)
+        return cast(_T, interned)
+    interned = _INTERNED[key] = factory()
+    if len(_INTERNED) > _INTERN_LIMIT:
+        _INTERNED.popitem(last=False)
+    return interned
+
+
+def _intern_payload(model: type[RESTPayload], localized: Sequence[str],
+                    data: CensusData) -> CensusData:
+    """Replace the localised strings of a payload with interned ones.
+
+    The localised strings are validated on their own and shared by all
+    payloads with identical values. Validating the returned payload
+    keeps these instances as is.
+
+    :param model: The model the payload is validated against.
+    :type model: type[auraxium.models.base.RESTPayload]
+    :param localized: The names of the model's localised fields.
+    :type localized: collections.abc.Sequence[str]
+    :param auraxium.types.CensusData data: The payload to process.
+    :raises pydantic.ValidationError: Raised if a localised string is
+       invalid.
+    :return: A copy of the payload, or the payload itself if it does
+       not contain any localised strings.
+    """
+    interned: dict[str, Any] | None = None
+    for name in localized:
+        key = model.model_fields[name].alias or name
+        if not isinstance(value := data.get(key), dict):
+            continue
+        if interned is None:
+            interned = dict(data)
+        adapter = _field_adapter(model, name)
+        interned[key] = _intern(
+            (model, name, *sorted(value.items())),
+            functools.partial(adapter.validate_python, value))
+    return data if interned is None else interned
+
+
+def _to_locale_data(value: Any, intern: bool = False) -> Any:
+    """Convert ``LocalizedString`` instances to :class:`LocaleData`.
+
+    Other values are returned as is.
+
+    :param typing.Any value: The value to convert.
+    :param bool intern: Whether to return an interned instance.
+    :return: The converted value.
+    """
+    # HACK: Workaround for pydantic creating duplicate models
+    # for each type using "LocalizedString"
+    if value.__class__.__name__ == 'LocalizedString':
+        fields = dict(value)
+        if intern:
+            return _intern((LocaleData, *fields.items()),
+                           functools.partial(LocaleData, **fields))
+        return LocaleData(**fields)
+    return value
+
+
+class _DataField:
+    """Descriptor providing access to a field of an object's data class.
+
+    These are generated for every field of a :class:`Ps2Object`
+    subclass's data class, see :meth:`Ps2Object.__init_subclass__`.
+    Localised strings are converted to :class:`LocaleData` on first
+    access and stored with the instance.
+    """
+
+    __slots__ = ('localized', 'name')
+
+    def __init__(self, name: str, localized: bool) -> None:
+        self.localized = localized
+        self.name = name
+
+    def __get__(self, instance: 'Ps2Object | None',
+                owner: type['Ps2Object'] | None = None) -> Any:
+        if instance is None:
+            return self
+        # pylint: disable=protected-access
+        fields = instance._fields
+        if fields is not None and self.name in fields:
+            return fields[self.name]
+        if instance._raw is not None:
+            if instance._partial:
+                return instance._validate_field(self.name)
+            instance._validate()
+        value = getattr(instance.data, self.name)
+        if self.localized and value is not None:
+            value = _to_locale_data(value, instance._interning)
+            if fields is None:
+                fields = instance._fields = {}
+            fields[self.name] = value
+        return value
+
 
 class Ps2Object(metaclass=abc.ABCMeta):
     """Common base class for all PS2 object representations.
@@ -56,8 +216,17 @@ class Ps2Object(metaclass=abc.ABCMeta):
           custom names. This attribute provides support for the latter.
     """
 
+    # Instances do not have a __dict__; subclasses must declare their own
+    # (usually empty) __slots__ to retain this.
+    __slots__ = ('_client', '_fields', '_raw', 'data', 'id')
+
     collection: ClassVar[str] = 'bogus'
+    _interning: ClassVar[bool] = False
+    _lazy: ClassVar[bool] = False
+    # Names of the data class fields containing localised strings
+    _localized: ClassVar[tuple[str, ...]] = ()
     _model: ClassVar[type[RESTPayload]]
+    _partial: ClassVar[bool] = False
     id_field: ClassVar[str] = 'bogus_id'
 
     def __init__(self, data: CensusData, client: RequestClient) -> None:
@@ -66,6 +235,10 @@ class Ps2Object(metaclass=abc.ABCMeta):
         This sets the object's :attr:`id` attribute and populates the
         instance using the provided payload.
 
+        If lazy validation is enabled for the class, the payload is
+        only validated once it is first used, see
+        :meth:`set_lazy_validation`.
+
         :param auraxium.types.CensusData data: The census response
            dictionary to populate the object with.
         :param auraxium.Client client: The client object to use for
@@ -76,12 +249,25 @@ class Ps2Object(metaclass=abc.ABCMeta):
         except KeyError as err:
             raise PayloadError(
                 f'Missing field "{self.id_field}"', data) from err
-        _log.debug('Instantiating <%s:%d> using payload: %s',
-                   self.__class__.__name__, id_, data)
+        # Payloads are not logged as formatting them is expensive; invalid
+        # payloads are included in the PayloadError raised instead.
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug('Instantiating <%s:%d>', self.__class__.__name__, id_)
         self.id: int = id_
         self._client = client
+        # Converted values of localised fields, or validated fields of
+        # partially validated objects
+        self._fields: dict[str, Any] | None = None
+        # The payload of lazily validated objects until validated
+        self._raw: CensusData | None = None
+        if self._lazy:
+            self._raw = data
+            return
         try:
-            self.data: Any = self._model(**data)
+            payload = data
+            if self._interning:
+                payload = _intern_payload(self._model, self._localized, data)
+            self.data: Any = self._model(**payload)
         except pydantic.ValidationError as err:
             raise PayloadError(
                 f'Unable to instantiate {self.__class__.__name__} instance '
@@ -101,22 +287,46 @@ class Ps2Object(metaclass=abc.ABCMeta):
         If the attribute cannot be found there either, an
         :exc:`AttributeError` is raised as normal.
         """
-        # Re-raising or propagating the inner exception would only clutter up
-        # the exception traceback, so we raise one "from scratch" instead.
+        if name in Ps2Object.__slots__:
+            # Only reached for unset slots, such as the data of lazily
+            # validated objects
+            if name == 'data' and getattr(self, '_raw', None) is not None:
+                return self._validate()
+            raise AttributeError(name)
+        if name.startswith('__'):
+            # Special names like __dict__ or __getstate__ must not be
+            # taken from the data class
+            raise AttributeError(name)
+        # Fields of the data class are provided by descriptors, this only
+        # handles any other attributes of the data class.
         if hasattr(self.data, name):
-            value = getattr(self.data, name)
-
-            # HACK: Workaround for pydantic creating duplicate models
-            # for each type using "LocalizedString"
-            if value.__class__.__name__ == 'LocalizedString':
-                return LocaleData(**value.__dict__)
-
-            return value
+            return _to_locale_data(getattr(self.data, name))
+        # Re-raising or propagating the inner exception would only clutter
+        # up the exception traceback, so we raise one "from scratch" instead.
         raise AttributeError(name)
 
     def __hash__(self) -> int:
         return hash((self.__class__, self.id))
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Generate attribute descriptors for the subclass.
+
+        Every field of the subclass's data class that is not shadowed
+        by an attribute of the subclass itself is made available as an
+        attribute of its instances.
+        """
+        super().__init_subclass__(**kwargs)
+        if (model := cls.__dict__.get('_model')) is None:
+            return
+        localized: list[str] = []
+        for name, field in model.model_fields.items():
+            if is_localized := _is_localized(field.annotation):
+                localized.append(name)
+            existing = getattr(cls, name, None)
+            if existing is None or isinstance(existing, _DataField):
+                setattr(cls, name, _DataField(name, is_localized))
+        cls._localized = tuple(localized)
+
     def __repr__(self) -> str:
         """Return the unique string representation of this object.
 
@@ -125,6 +335,202 @@ class Ps2Object(metaclass=abc.ABCMeta):
         """
         return f'<{self.__class__.__name__}:{self.id}>'
 
+    @classmethod
+    def from_payloads(cls: type[Ps2ObjectT], data: Sequence[CensusData],
+                      client: RequestClient) -> list[Ps2ObjectT]:
+        """Instantiate multiple objects from a list of payloads.
+
+        This is equivalent to instantiating each object individually,
+        but validates all payloads at once, which is considerably
+        faster for large lists.
+
+        :param data: The census response dictionaries to populate the
+           objects with.
+        :type data: collections.abc.Sequence[auraxium.types.CensusData]
+        :param auraxium.Client client: The client object to use for
+           requests performed via these objects.
+        :raises PayloadError: Raised if any of the payloads is invalid.
+        :return: The instantiated objects, in order.
+        """
+        if (instances := cls._bulk_create(data, client)) is None:
+            return [cls(d, client=client) for d in data]
+        return instances
+
+    @classmethod
+    def _bulk_create(cls: type[Ps2ObjectT], data: Sequence[CensusData],
+                     client: RequestClient) -> list[Ps2ObjectT] | None:
+        """Instantiate multiple objects without calling the initialiser.
+
+        :param data: The census response dictionaries to populate the
+           objects with.
+        :type data: collections.abc.Sequence[auraxium.types.CensusData]
+        :param auraxium.Client client: The client object to use for
+           requests performed via these objects.
+        :return: The instantiated objects, or :obj:`None` if they must
+           be instantiated individually instead.
+        """
+        # Subclasses with custom initialisers must be created one by one
+        if cls.__init__ not in (Ps2Object.__init__, Cached.__init__,
+                                Named.__init__):
+            return None
+        try:
+            ids = [int(str(d[cls.id_field])) for d in data]
+            if cls._lazy:
+                return cls._bulk_create_lazy(ids, data, client)
+            if cls._interning:
+                data = [_intern_payload(cls._model, cls._localized, d)
+                        for d in data]
+            models = _list_adapter(cls._model).validate_python(data)
+        except (KeyError, ValueError):
+            # NOTE: pydantic.ValidationError is a subclass of ValueError.
+            # Instantiating the objects individually raises the appropriate
+            # error for the first invalid payload.
+            return None
+        _log.debug('Instantiating %d %s instances', len(ids), cls.__name__)
+        instances: list[Ps2ObjectT] = []
+        for id_, model in zip(ids, models):
+            instance = cls.__new__(cls)
+            instance.id = id_
+            instance._client = client  # pylint: disable=protected-access
+            instance.data = model
+            instance._fields = instance._raw = None
+            instances.append(instance)
+        return instances
+
+    @classmethod
+    def _bulk_create_lazy(cls: type[Ps2ObjectT], ids: list[int],
+                          data: Sequence[CensusData],
+                          client: RequestClient) -> list[Ps2ObjectT]:
+        """Instantiate multiple lazily validated objects.
+
+        :param list[int] ids: The IDs of the objects.
+        :param data: The census response dictionaries to populate the
+           objects with.
+        :type data: collections.abc.Sequence[auraxium.types.CensusData]
+        :param auraxium.Client client: The client object to use for
+           requests performed via these objects.
+        :return: The instantiated objects.
+        """
+        instances: list[Ps2ObjectT] = []
+        # pylint: disable=protected-access
+        for id_, payload in zip(ids, data):
+            instance = cls.__new__(cls)
+            instance.id = id_
+            instance._client = client
+            instance._raw = payload
+            instance._fields = None
+            instances.append(instance)
+        return instances
+
+    @classmethod
+    def set_lazy_validation(cls, enabled: bool = True,
+                            partial: bool = False) -> None:
+        """Defer validation of the payload until it is first used.
+
+        By default, the payload of an object is validated in full as
+        soon as the object is created. For lazily validated objects,
+        the raw payload is kept instead and only validated once an
+        attribute of the underlying data class is first accessed. This
+        makes instantiating large numbers of objects considerably
+        faster when only few of them are inspected, such as when
+        listing search results by ID.
+
+        If `partial` is true, accessing a field only validates that
+        field, and the rest of the payload is never validated unless
+        :attr:`data` is accessed directly.
+
+        Note that invalid payloads are only reported once they are
+        used; the :exc:`~auraxium.errors.PayloadError` is then raised
+        on attribute access rather than during instantiation.
+
+        This setting applies to the current class and its subclasses.
+        Calling it on :class:`Ps2Object` therefore changes the default
+        for all object types.
+
+        :param bool enabled: Whether to validate payloads lazily.
+        :param bool partial: Whether to only validate the fields that
+           are accessed.
+        """
+        cls._lazy = enabled
+        cls._partial = enabled and partial
+
+    @classmethod
+    def set_interning(cls, enabled: bool = True) -> None:
+        """Share identical localised strings between objects.
+
+        Localised names and descriptions, like the name of an item
+        category or faction, are often identical across many objects.
+        When interning is enabled, identical values share a single
+        instance in both the data class and the
+        :class:`~auraxium.types.LocaleData` returned on attribute
+        access, reducing the memory used by large numbers of objects.
+
+        Localised strings are interned before the payload is
+        validated, so interning also saves validating repeated values.
+        Interned values are kept in a table shared by all types. To
+        bound its size, the least recently used values are discarded
+        once it contains more than 65536 distinct values.
+
+        This setting applies to the current class and its subclasses
+        and only affects objects created afterwards.
+
+        :param bool enabled: Whether to intern localised strings.
+        """
+        cls._interning = enabled
+
+    def _validate(self) -> Any:
+        """Validate the raw payload of a lazily validated object.
+
+        :raises PayloadError: Raised if the payload is invalid.
+        :return: The validated data class instance.
+        """
+        raw = cast(CensusData, self._raw)
+        try:
+            payload = raw
+            if self._interning:
+                payload = _intern_payload(self._model, self._localized, raw)
+            self.data = self._model(**payload)
+        except pydantic.ValidationError as err:
+            raise PayloadError(
+                f'Unable to instantiate {self.__class__.__name__} instance '
+                f'from given payload: {err}', raw) from err
+        self._raw = None
+        return self.data
+
+    def _validate_field(self, name: str) -> Any:
+        """Validate a single field of the raw payload.
+
+        :param str name: The name of the field to validate.
+        :raises PayloadError: Raised if the field is missing or its
+           value is invalid.
+        :return: The validated value of the field.
+        """
+        raw = cast(CensusData, self._raw)
+        if self._fields is None:
+            self._fields = {}
+        elif name in self._fields:
+            return self._fields[name]
+        field = self._model.model_fields[name]
+        key = field.alias or name
+        if key not in raw:
+            if field.is_required():
+                raise PayloadError(f'Missing field "{key}"', raw)
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = raw[key]
+            if value == 'NULL':
+                value = None
+            try:
+                value = _field_adapter(
+                    self._model, name).validate_python(value)
+            except pydantic.ValidationError as err:
+                raise PayloadError(
+                    f'Unable to validate field "{name}" of '
+                    f'{self.__class__.__name__} instance: {err}',
+                    raw) from err
+        value = self._fields[name] = _to_locale_data(value, self._interning)
+        return value
+
     def query(self) -> Query:
         """Return a query from the current object.
 
@@ -156,6 +562,8 @@ class Cached(Ps2Object, metaclass=abc.ABCMeta):
     too far out of date.
     """
 
+    __slots__ = ()
+
     _cache: ClassVar[TLRUCache[int, Any]]
 
     def __init__(self, data: CensusData, client: RequestClient) -> None:
@@ -172,6 +580,30 @@ class Cached(Ps2Object, metaclass=abc.ABCMeta):
         super().__init__(data=data, client=client)
         self._cache.add(self.id, self)
 
+    @classmethod
+    def from_payloads(cls: type[CachedT], data: Sequence[CensusData],
+                      client: RequestClient) -> list[CachedT]:
+        """Instantiate multiple objects from a list of payloads.
+
+        This is equivalent to instantiating each object individually,
+        but validates all payloads at once and adds the resulting
+        objects to the cache in a single step.
+
+        :param data: The census response dictionaries to populate the
+           objects with.
+        :type data: collections.abc.Sequence[auraxium.types.CensusData]
+        :param auraxium.Client client: The client object to use for
+           requests performed via these objects.
+        :raises PayloadError: Raised if any of the payloads is invalid.
+        :return: The instantiated objects, in order.
+        """
+        if (instances := cls._bulk_create(data, client)) is None:
+            return [cls(d, client=client) for d in data]
+        # Only the most recent objects fit into the cache
+        if (size := cls._cache.size) > 0:
+            cls._cache.add_many((i.id, i) for i in instances[-size:])
+        return instances
+
     @classmethod
     def __init_subclass__(
             cls, cache_size: int, cache_ttu: float = 0.0) -> None:
@@ -223,6 +655,8 @@ class Named(Cached, cache_size=0, cache_ttu=0.0, metaclass=abc.ABCMeta):
     locale used for the request.
     """
 
+    __slots__ = ()
+
     _cache: ClassVar[TLRUCache[int | str, Any]]  # type: ignore
 
     def __init__(self, *args: Any, locale: str | None = None,
@@ -267,6 +701,8 @@ class Named(Cached, cache_size=0, cache_ttu=0.0, metaclass=abc.ABCMeta):
 class ImageMixin(Ps2Object, metaclass=abc.ABCMeta):
     """A mixin class for types supporting image access."""
 
+    __slots__ = ()
+
     def image(self) -> str:
         """Return the default image for this type."""
         image_id = cast(int, getattr(self.data, 'image_id', 0))
@@ -51,20 +51,25 @@ would generally pass to your HTTP library of choice, rather than
 printing it.
 """
 
+from ._prepared import BoundQuery, PreparedQuery
 from ._query import JoinedQuery, Query, QueryBase
 from ._support import (CensusValue, JoinedQueryData, QueryBaseData, QueryData,
                        SearchModifier, SearchTerm)
+from ._urlgen import URLTemplate
 
 __all__ = [
+    'BoundQuery',
     'CensusValue',
     'JoinedQuery',
     'JoinedQueryData',
+    'PreparedQuery',
     'Query',
     'QueryData',
     'QueryBase',
     'QueryBaseData',
     'SearchModifier',
-    'SearchTerm'
+    'SearchTerm',
+    'URLTemplate'
 ]
 
 __version__ = '0.3.0'
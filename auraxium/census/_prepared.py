@@ -0,0 +1,196 @@
+"""Prepared queries with placeholder terms."""
+
+import copy
+import dataclasses
+
+import yarl
+
+from ._query import Query
+from ._support import CensusValue, SearchModifier, SearchTerm
+from ._urlgen import URLTemplate
+
+__all__ = [
+    'BoundQuery',
+    'PreparedQuery'
+]
+
+
+class PreparedQuery:
+    """A query with named placeholders for some of its term values.
+
+    Prepared queries are defined once and then bound to values for
+    their placeholders via :meth:`bind`. Everything but the values of
+    these placeholder terms is serialised only once per query verb,
+    service ID and endpoint, which makes binding and URL generation
+    considerably cheaper than building a new :class:`Query` each time.
+
+    .. code-block:: python3
+
+       from auraxium import census
+
+       query = census.Query('characters_item').limit(5000)
+       query.create_join('item').set_fields('item_id')
+       items = census.PreparedQuery(query, id='character_id')
+
+       url = items.bind(id=5428072203494645969).url()
+
+    The query passed is copied; changes made to it afterwards do not
+    affect the prepared query.
+
+    .. attribute:: query
+       :type: Query
+
+       The query being prepared, without any of the placeholder terms.
+       This must not be modified once the prepared query is in use.
+
+    .. attribute:: placeholders
+       :type: dict[str, tuple[str, SearchModifier]]
+
+       The field and search modifier of each placeholder, keyed by
+       placeholder name.
+    """
+
+    def __init__(self, query: Query, **placeholders: str) -> None:
+        """Prepare a query with the given placeholders.
+
+        :param Query query: The query to prepare.
+        :param placeholders: The placeholder names and the fields they
+           provide values for. Use :meth:`add_placeholder` to specify a
+           search modifier.
+        :type placeholders: str
+        """
+        self.query: Query = copy.deepcopy(query)
+        self.placeholders: dict[str, tuple[str, SearchModifier]] = {}
+        self._templates: dict[tuple[str, str, yarl.URL], URLTemplate] = {}
+        for name, field in placeholders.items():
+            self.add_placeholder(name, field)
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__}:{self.query.data.collection}:'
+                f'{",".join(self.placeholders)}>')
+
+    def add_placeholder(self, name: str, field: str,
+                        modifier: SearchModifier = SearchModifier.EQUAL_TO
+                        ) -> 'PreparedQuery':
+        """Add a new placeholder term to the query.
+
+        :param str name: The name of the placeholder, as passed to
+           :meth:`bind`.
+        :param str field: The field to filter by.
+        :param SearchModifier modifier: The search modifier to use.
+        :raises ValueError: Raised if a placeholder of the same name
+           already exists.
+        :return: The current prepared query instance.
+        """
+        if name in self.placeholders:
+            raise ValueError(f'Duplicate placeholder name: {name}')
+        self.placeholders[name] = field, modifier
+        return self
+
+    def bind(self, **values: CensusValue) -> 'BoundQuery':
+        """Bind values to the query's placeholders.
+
+        :param values: The value for each placeholder, keyed by
+           placeholder name.
+        :type values: float | int | str
+        :raises ValueError: Raised if a value is missing for any
+           placeholder, or if a value is given for an unknown one.
+        :return: The bound query.
+        """
+        if values.keys() != self.placeholders.keys():
+            if missing := self.placeholders.keys() - values.keys():
+                raise ValueError('Missing values for placeholders: '
+                                 f'{", ".join(sorted(missing))}')
+            raise ValueError(
+                'Unknown placeholders: '
+                f'{", ".join(sorted(values.keys() - self.placeholders))}')
+        return BoundQuery(self, tuple(values[n] for n in self.placeholders))
+
+    def template(self, verb: str = 'get', service_id: str | None = None,
+                 endpoint: yarl.URL | None = None) -> URLTemplate:
+        """Return the URL template for the query.
+
+        Templates are created on first use and reused afterwards.
+
+        :param str verb: The query verb to use.
+        :param service_id: The service ID to use. Defaults to that of
+           :attr:`query`.
+        :type service_id: str | None
+        :param endpoint: The API endpoint to use. Defaults to that of
+           :attr:`query`.
+        :type endpoint: yarl.URL | None
+        :return: The URL template for the given arguments.
+        """
+        service_id = service_id or self.query.data.service_id
+        endpoint = endpoint or self.query.endpoint
+        key = verb, service_id, endpoint
+        if (template := self._templates.get(key)) is None:
+            query = copy.deepcopy(self.query)
+            query.data.service_id = service_id
+            query.endpoint = endpoint
+            template = self._templates[key] = query.url_template(verb)
+        return template
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BoundQuery:
+    """A prepared query with values bound to all of its placeholders.
+
+    Bound queries are created via :meth:`PreparedQuery.bind`. They are
+    immutable and hashable, with two bound queries comparing equal if
+    they were bound from the same prepared query with the same values.
+    This allows their use as keys for caching or request deduplication.
+
+    Bound queries may be passed to
+    :meth:`auraxium.Client.request() <auraxium.Client.request>` like
+    regular queries, in which case the client's service ID and
+    endpoint are used.
+
+    .. attribute:: prepared
+       :type: PreparedQuery
+
+       The prepared query this query was bound from.
+
+    .. attribute:: values
+       :type: tuple[float | int | str, ...]
+
+       The values of the placeholders, in the order they were added to
+       the prepared query.
+    """
+
+    prepared: PreparedQuery
+    values: tuple[CensusValue, ...]
+
+    def terms(self) -> list[SearchTerm]:
+        """Return the search terms for the bound placeholders.
+
+        :return: A search term for each placeholder.
+        """
+        return [SearchTerm(field, value, modifier)
+                for (field, modifier), value in zip(
+                    self.prepared.placeholders.values(), self.values)]
+
+    def query(self) -> Query:
+        """Return an equivalent, independent :class:`Query` instance.
+
+        :return: A copy of the prepared query with the bound terms.
+        """
+        query = copy.deepcopy(self.prepared.query)
+        query.data.terms.extend(self.terms())
+        return query
+
+    def url(self, verb: str = 'get', service_id: str | None = None,
+            endpoint: yarl.URL | None = None) -> yarl.URL:
+        """Generate the URL representing this query.
+
+        :param str verb: The query verb to use.
+        :param service_id: The service ID to use. Defaults to that of
+           the prepared query.
+        :type service_id: str | None
+        :param endpoint: The API endpoint to use. Defaults to that of
+           the prepared query.
+        :type endpoint: yarl.URL | None
+        :return: A :class:`yarl.URL` instance representing the query.
+        """
+        return self.prepared.template(verb, service_id, endpoint).url(
+            *self.terms())
@@ -12,7 +12,7 @@ import yarl
 from ..endpoints import defaults as default_endpoints
 from ._support import (CensusValue, JoinedQueryData, QueryBaseData, QueryData,
                        SearchModifier, SearchTerm)
-from ._urlgen import generate_url
+from ._urlgen import URLTemplate, generate_url
 
 __all__ = [
     'JoinedQuery',
@@ -650,6 +650,26 @@ class Query(QueryBase):
         return generate_url(self.data, verb, validate=not skip_checks,
                             endpoint=self.endpoint)
 
+    def url_template(self, verb: str = 'get',
+                     skip_checks: bool = False) -> URLTemplate:
+        """Serialise the query for repeated URL generation.
+
+        The returned template stores the serialised path, terms and
+        query commands of the query, including any joins. Its
+        :meth:`URLTemplate.url` method accepts additional terms and
+        is considerably faster than calling :meth:`url` repeatedly
+        for queries that only differ in their term values.
+
+        :param str verb: The query verb to use.
+        :param bool skip_checks: By default, the URL generator will
+           perform a number of checks to validate the query. Enabling
+           this flag will skip these checks.
+        :return: A template for URLs of this query.
+        """
+        self.data.joins = [j.serialise() for j in self.joins]
+        return URLTemplate(self.data, verb, validate=not skip_checks,
+                           endpoint=self.endpoint)
+
 
 class JoinedQuery(QueryBase):
     """A sub-query to be joined to an existing query.
@@ -192,14 +192,14 @@ class SearchTerm:
     def as_tuple(self) -> tuple[str, str]:
         """Return a key/value pair representing the search term.
 
-        This is a helper function that calls
-        :meth:`SearchTerm.serialise` and then splits the returned
-        string at the equal sign.
+        This contains the same information as the string returned by
+        :meth:`SearchTerm.serialise`, with the field and value kept
+        separate for use in URL query strings.
 
-        :return: A key/value pair representing teh search term.
+        :return: A key/value pair representing the search term.
         """
-        key, value = self.serialise().split('=', 1)
-        return key, value
+        return (self.field,
+                f'{SearchModifier.serialise(self.modifier)}{self.value}')
 
     @classmethod
     def infer(cls, field: str, value: CensusValue) -> 'SearchTerm':
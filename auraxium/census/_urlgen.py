@@ -1,18 +1,25 @@
 """URL generation and validation utility."""
 
+import re
 import warnings
 from collections.abc import Iterable
+from urllib.parse import quote_plus
 
 import yarl
 
 from ..endpoints import defaults as default_endpoints
-from ._support import JoinedQueryData, QueryData
+from ._support import CensusValue, JoinedQueryData, QueryData, SearchTerm
 
 __all__ = [
     'generate_url',
     'process_join',
+    'URLTemplate'
 ]
 
+# Characters not escaped in query strings, matching yarl.URL.with_query
+_QUERY_SAFE = '!$\'()*,/:?@'
+_QUERY_SAFE_RE = re.compile(r'[\w.~!$\'()*,/:?@-]*', re.ASCII)
+
 
 def generate_url(query: QueryData, verb: str, validate: bool = True,
                  endpoint: yarl.URL | None = None) -> yarl.URL:
@@ -32,26 +39,126 @@ def generate_url(query: QueryData, verb: str, validate: bool = True,
     :type endpoint: :class:`yarl.URL` | :obj:`None`
     :return: A :class:`yarl.URL` representing the query.
     """
-    # NOTE: The yarl.URL object uses the division operator to chain URI
-    # components.
+    return URLTemplate(query, verb, validate=validate, endpoint=endpoint).url()
+
+
+class URLTemplate:
+    """A pre-serialised query accepting additional search terms.
+
+    Generating a URL involves serialising the query's path, terms,
+    query commands and any joins. For queries that are sent repeatedly
+    with only their term values changing, such as a look-up by ID, this
+    work can be done once when creating the template. Each call to
+    :meth:`url` then only encodes the terms passed to it.
+
+    Templates are created via :meth:`Query.url_template`. They capture
+    the state of the query at the time of their creation; later changes
+    to the query are not reflected in existing templates.
+
+    .. code-block:: python3
+
+       template = census.Query('character').show('name').url_template()
+       for id_ in ids:
+           url = template.url(character_id=id_)
+
+    The URLs returned are identical to those generated by
+    :meth:`Query.url` for the same query with the given terms appended.
+    """
+
+    __slots__ = ('_base', '_commands', '_terms')
+
+    def __init__(self, query: QueryData, verb: str, validate: bool = True,
+                 endpoint: yarl.URL | None = None) -> None:
+        """Serialise the static parts of a query.
+
+        :param QueryData query: The top level query to process. Any
+           joins must already have been serialised.
+        :param str verb: The query verb to use for the query.
+        :param bool validate: Whether to perform checks on the query
+           and warn the user about bad arguments.
+        :param endpoint: The API endpoint to use. If not set, will
+           default to the official API endpoint.
+        :type endpoint: :class:`yarl.URL` | :obj:`None`
+        """
+        self._base = str(_process_path(query, verb, validate, endpoint))
+        self._terms = _encode_query(t.as_tuple() for t in query.terms)
+        self._commands = _encode_query(
+            _process_query_commands(query, validate=validate).items())
+
+    def url(self, *terms: SearchTerm, **kwargs: CensusValue) -> yarl.URL:
+        """Generate a URL for the template with the given terms.
+
+        :param terms: Additional search terms to add to the query.
+        :type terms: SearchTerm
+        :param kwargs: Key-value pairs to add to the query. These are
+           processed like the keyword arguments of :class:`Query`.
+        :type kwargs: float | int | str
+        :return: A :class:`yarl.URL` representing the query.
+        """
+        query = self._terms
+        if terms or kwargs:
+            pairs = [t.as_tuple() for t in terms]
+            pairs.extend(SearchTerm.infer(k.replace('__', '.'), v).as_tuple()
+                         for k, v in kwargs.items())
+            query = f'{query}&{_encode_query(pairs)}' if query else (
+                _encode_query(pairs))
+        if self._commands:
+            query = f'{query}&{self._commands}' if query else self._commands
+        if not query:
+            return yarl.URL(self._base, encoded=True)
+        return yarl.URL(f'{self._base}?{query}', encoded=True)
+
 
+def _encode_query(pairs: Iterable[tuple[str, str]]) -> str:
+    """Encode key/value pairs into a URL query string.
+
+    The encoding used matches that of :meth:`yarl.URL.with_query`, so
+    that the resulting URLs compare equal.
+
+    :param pairs: The key/value pairs to encode.
+    :type pairs: collections.abc.Iterable[tuple[str, str]]
+    :return: The encoded query string, without leading question mark.
+    """
+    return '&'.join(f'{_quote(k)}={_quote(v)}' for k, v in pairs)
+
+
+def _quote(value: str) -> str:
+    """Percent-encode a key or value for use in a URL query string."""
+    # Most keys and values do not require escaping
+    if _QUERY_SAFE_RE.fullmatch(value):
+        return value
+    return quote_plus(value, _QUERY_SAFE)
+
+
+def _process_path(query: QueryData, verb: str, validate: bool = True,
+                  endpoint: yarl.URL | None = None) -> yarl.URL:
+    """Return the URL of the given query without its query string.
+
+    :param QueryData query: The top level query to process.
+    :param str verb: The query verb to use for the query.
+    :param bool validate: Whether to perform checks on the query and
+       warn the user about bad arguments.
+    :param endpoint: The API endpoint to use. If not set, will default
+       to the official API endpoint.
+    :type endpoint: :class:`yarl.URL` | :obj:`None`
+    :return: The URL of the query's collection.
+    """
     # Census endpoint
     default = default_endpoints()[0]
     url = yarl.URL(endpoint or default)
+    segments: list[str] = []
     # Service ID
     if url == default:
-        url /= query.service_id
+        segments.append(query.service_id)
     if validate and endpoint == default and query.service_id == 's:example':
         warnings.warn('The default service ID is heavily rate-limited. '
                       'Consider applying for your own service ID at '
                       'https://census.daybreakgames.com/#devSignup')
-    # Query verb
-    url /= verb
-    # Namespace
-    url /= query.namespace
+    # Query verb and namespace
+    segments.extend((verb, query.namespace))
     # Collection
     if (collection := query.collection) is not None:
-        url /= collection
+        segments.append(collection)
     elif validate:
         if query.terms:
             warnings.warn(f'No collection specified, but {len(query.terms)} '
@@ -59,11 +166,7 @@ def generate_url(query: QueryData, verb: str, validate: bool = True,
         elif query.joins:
             warnings.warn(f'No collection specified, but {len(query.joins)} '
                           'joined queries provided')
-    # Top-level query terms
-    url = url.with_query([t.as_tuple() for t in query.terms])
-    # Process query commands
-    url = url.update_query(_process_query_commands(query, validate=validate))
-    return url
+    return url.joinpath(*segments)
 
 
 def process_join(data: JoinedQueryData, verbose: bool) -> str:
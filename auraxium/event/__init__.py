@@ -6,7 +6,16 @@ provides a trigger system used to respond to in-game events.
 """
 
 from ._client import EventClient
-from ._trigger import Trigger
+from ._connection import Connection, ShardKey
+from ._correlate import Correlator
+from ._dedup import Deduplicator
+from ._enrich import DEFAULT_FIELDS, Enricher
+from ._metrics import Metrics, MetricsSnapshot
+from ._replay import Recorder, read_frames, replay
+from ._sink import ColumnarSink, read_chunks
+from ._trigger import (BatchTrigger, FieldFilter, OverflowPolicy, Trigger,
+                       TriggerStats)
+from ._window import SlidingWindow, TumblingWindow, WindowResult
 from ..models import (AchievementAdded, BattleRankUp, Death, Event,
                       FacilityControl, GainExperience, ItemAdded,
                       MetagameEvent, PlayerFacilityCapture,
@@ -14,9 +23,29 @@ from ..models import (AchievementAdded, BattleRankUp, Death, Event,
                       SkillAdded, VehicleDestroy, ContinentLock)
 
 __all__ = [
+    'BatchTrigger',
+    'ColumnarSink',
+    'Connection',
+    'Correlator',
+    'DEFAULT_FIELDS',
+    'Deduplicator',
+    'Enricher',
     'Event',
     'EventClient',
+    'FieldFilter',
+    'Metrics',
+    'MetricsSnapshot',
+    'OverflowPolicy',
+    'Recorder',
+    'ShardKey',
+    'SlidingWindow',
     'Trigger',
+    'TriggerStats',
+    'TumblingWindow',
+    'WindowResult',
+    'read_chunks',
+    'read_frames',
+    'replay',
 
     # Event subclasses
     'AchievementAdded',
@@ -0,0 +1,207 @@
+"""Recovery of events missed while a websocket was disconnected.
+
+The REST API keeps a history of some of the events broadcast through
+the event stream. This module converts the subscriptions affected by a
+disconnect into the matching REST queries and converts the results
+back into :class:`~auraxium.event.Event` instances.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any, cast
+
+import pydantic
+
+from ..census import Query
+from .._rest import RequestClient, extract_payload
+from ..models import Death, Event, FacilityControl, VehicleDestroy
+from ..types import CensusData
+
+__all__ = [
+    'BACKFILL_EVENTS',
+    'backfill',
+    'backfill_key',
+    'convert_payload'
+]
+
+# ESS event names that can be recovered, mapped to the REST event types to
+# request. The character-centric "DEATH" type only covers the victim, so the
+# matching "KILL" type is requested as well.
+BACKFILL_EVENTS: dict[str, tuple[str, ...]] = {
+    'Death': ('DEATH', 'KILL'),
+    'VehicleDestroy': ('VEHICLE_DESTROY',),
+    'FacilityControl': ('FACILITY',),
+}
+
+# Event fields provided by the REST API that identify a recovered event, in
+# addition to its name, timestamp and world
+_KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    'Death': ('character_id', 'attacker_character_id'),
+    'VehicleDestroy': ('character_id', 'attacker_character_id'),
+    'FacilityControl': ('facility_id',),
+}
+
+# The maximum number of results returned per request
+_PAGE_SIZE = 1000
+# The maximum number of requests per query, to bound the cost of long gaps
+_MAX_PAGES = 10
+# The number of character IDs to include per request
+_CHARACTER_CHUNK = 50
+
+_log = logging.getLogger('auraxium.ess')
+
+
+async def backfill(client: RequestClient,
+                   subscriptions: Iterable[dict[str, Any]],
+                   start: float, end: float) -> list[Event]:
+    """Retrieve events missed during the given time window.
+
+    Only the events listed in :data:`BACKFILL_EVENTS` can be recovered.
+    Character-centric events additionally require the subscription to
+    specify the characters to recover events for.
+
+    :param auraxium.Client client: The client to use for requests.
+    :param subscriptions: The subscription messages to recover events
+       for.
+    :type subscriptions: collections.abc.Iterable[dict[str, typing.Any]]
+    :param float start: The UTC timestamp of the start of the gap.
+    :param float end: The UTC timestamp of the end of the gap.
+    :return: The recovered events, sorted by timestamp.
+    """
+    character_types: set[str] = set()
+    characters: set[str] = set()
+    world_types: set[str] = set()
+    worlds: set[str] = set()
+    for sub in subscriptions:
+        names: list[str] = sub.get('eventNames', [])
+        if 'all' in names:
+            names = list(BACKFILL_EVENTS)
+        for name in names:
+            if name == 'FacilityControl':
+                world_types.update(BACKFILL_EVENTS[name])
+                worlds.update(sub.get('worlds', ['all']))
+            elif name in BACKFILL_EVENTS:
+                subscribed = sub.get('characters', ['all'])
+                if 'all' in subscribed:
+                    _log.debug('Unable to backfill %s events for all '
+                               'characters', name)
+                    continue
+                character_types.update(BACKFILL_EVENTS[name])
+                characters.update(subscribed)
+    # NOTE: The REST API filters by timestamp with second precision; the
+    # window is widened slightly to not miss events at its edges.
+    after, before = int(start) - 1, int(end) + 1
+    payloads: list[CensusData] = []
+    if character_types and characters:
+        ids = sorted(characters)
+        for i in range(0, len(ids), _CHARACTER_CHUNK):
+            query = Query('characters_event', service_id=client.service_id)
+            query.add_term('character_id', ','.join(ids[i:i+_CHARACTER_CHUNK]))
+            query.add_term('type', ','.join(sorted(character_types)))
+            payloads.extend(await _paginate(client, query, after, before))
+    if world_types:
+        query = Query('world_event', service_id=client.service_id)
+        if 'all' not in worlds:
+            query.add_term('world_id', ','.join(sorted(worlds)))
+        query.add_term('type', ','.join(sorted(world_types)))
+        payloads.extend(await _paginate(client, query, after, before))
+    # Kills between two tracked characters are returned for both of them
+    events: dict[tuple[Any, ...], Event] = {}
+    for payload in payloads:
+        if (event := convert_payload(payload)) is not None:
+            key = tuple(sorted(event.model_dump().items()))
+            events.setdefault(key, event)
+    _log.info('Recovered %d events missed between %d and %d',
+              len(events), after, before)
+    return sorted(events.values(), key=lambda e: e.timestamp)
+
+
+def backfill_key(event: Event) -> tuple[Any, ...]:
+    """Return the key used to match recovered events to live ones.
+
+    Events recovered via the REST API lack some of the fields of their
+    event stream counterparts, so only the fields provided by both are
+    considered.
+
+    :param auraxium.event.Event event: The event to identify.
+    :return: A hashable key identifying the event.
+    """
+    return (event.event_name, int(event.timestamp.timestamp()),
+            getattr(event, 'world_id', None),
+            *(getattr(event, f) for f in _KEY_FIELDS.get(
+                event.event_name, ())))
+
+
+def convert_payload(payload: CensusData) -> Event | None:
+    """Convert a REST event payload into its event stream counterpart.
+
+    Fields not provided by the REST API, like the team IDs of a
+    :class:`~auraxium.event.Death`, are set to zero.
+
+    :param payload: A ``characters_event`` or ``world_event`` payload.
+    :type payload: auraxium.types.CensusData
+    :return: The converted event, or :obj:`None` if the payload's event
+       type is not supported or it could not be converted.
+    """
+    table = payload.get('table_type')
+    data: dict[str, Any]
+    type_: type[Event]
+    if table == 'deaths':
+        type_ = Death
+        data = {'attacker_loadout_id': 0, 'attacker_team_id': 0,
+                'team_id': 0, 'is_headshot': False}
+        data.update(payload)
+    elif table == 'vehicle_destroy':
+        type_ = VehicleDestroy
+        data = {'attacker_loadout_id': 0, 'attacker_team_id': 0,
+                'team_id': 0, 'facility_id': 0, 'faction_id': 0}
+        data.update(payload)
+        data.setdefault('vehicle_id', payload.get('vehicle_definition_id'))
+    elif table == 'facility_control':
+        type_ = FacilityControl
+        data = {'duration_held': 0, 'outfit_id': 0}
+        data.update(payload)
+        data['new_faction_id'] = payload.get('faction_new')
+        data['old_faction_id'] = payload.get('faction_old')
+    else:
+        return None
+    data['event_name'] = type_.__name__
+    try:
+        return type_(**data)
+    except pydantic.ValidationError as err:
+        _log.warning('Unable to convert REST event payload: %s\n'
+                     'Payload: %s', err, payload)
+        return None
+
+
+async def _paginate(client: RequestClient, query: Query,
+                    after: int, before: int) -> list[CensusData]:
+    """Retrieve all results of an event query within the given window.
+
+    Results are returned newest first, so the upper bound of the
+    window is moved back until a page is not full.
+
+    :param auraxium.Client client: The client to use for requests.
+    :param auraxium.census.Query query: The query to run.
+    :param int after: The exclusive lower bound of the window.
+    :param int before: The exclusive upper bound of the window.
+    :return: The payloads of all events in the window.
+    """
+    collection = cast(str, query.data.collection)
+    query.limit(_PAGE_SIZE)
+    query.add_term('after', after)
+    results: list[CensusData] = []
+    for _ in range(_MAX_PAGES):
+        page = Query.copy(query, deep_copy=True)
+        page.add_term('before', before)
+        payload = extract_payload(await client.request(page), collection)
+        results.extend(payload)
+        if len(payload) < _PAGE_SIZE:
+            break
+        # NOTE: Events sharing the oldest timestamp of a full page will be
+        # returned again on the next page, they are deduplicated later.
+        before = min(int(str(p['timestamp'])) for p in payload) + 1
+    else:  # pragma: no cover
+        _log.warning('Backfill of %s truncated after %d pages',
+                     collection, _MAX_PAGES)
+    return results
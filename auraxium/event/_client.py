@@ -1,8 +1,11 @@
 import asyncio
+import collections
 import contextlib
+import functools
 import json
 import logging
-from collections.abc import Callable, Coroutine
+import time
+from collections.abc import Callable, Coroutine, Iterable
 from typing import Any, TypeVar, cast, overload
 
 import pydantic
@@ -14,16 +17,31 @@ from .._log import RedactingFilter
 from ..endpoints import defaults as default_endpoints
 from ..models import Event
 from ..types import CensusData
-from ._trigger import Trigger
+from ._backfill import BACKFILL_EVENTS, backfill_key
+from ._backfill import backfill as backfill_events
+from ._connection import (Connection, ShardKey, SubscriptionUnion,
+                          split_subscription)
+from ._dedup import Deduplicator
+from ._enrich import Enricher
+from ._metrics import Metrics
+from ._replay import Recorder
+from ._trigger import BatchTrigger, OverflowPolicy, Trigger
 
 __all__ = [
     'EventClient'
 ]
 
+_Job = Callable[[], Coroutine[Any, Any, None]]
 _EventT = TypeVar('_EventT', bound=Event)
 _EventT2 = TypeVar('_EventT2', bound=Event)
 _CallbackT = (Callable[[_EventT], None]
               | Callable[[_EventT], Coroutine[Any, Any, None]])
+_BatchCallbackT = (Callable[[list[_EventT]], None]
+                   | Callable[[list[_EventT]], Coroutine[Any, Any, None]])
+
+# The time in seconds for which recoverable live events are remembered to
+# avoid delivering them again when backfilling the gap after a disconnect
+_RECENT_WINDOW = 5
 
 _log = logging.getLogger('auraxium.ess')
 
@@ -45,44 +63,177 @@ class EventClient(Client):
     Refer to the :class:`~auraxium.event.Trigger` class's documentation
     for details on how to use triggers and respond to events.
 
+    By default, all subscriptions share a single WebSocket connection.
+    Use the `shards` argument to instead split subscriptions across
+    multiple connections; this limits the impact of a slow or dropped
+    connection to the subscriptions carried by it. The subscription
+    field used to distribute subscriptions is set via `shard_by`.
+    Events received through any connection are dispatched by the same
+    client. Since subscriptions that cannot be split are carried by
+    the first shard, events may be received through several shards;
+    deduplication is therefore enabled by default when sharding.
+
+    For redundancy, each shard may also be carried by multiple
+    connections to different endpoints via the `redundancy` argument.
+    Events received through more than one of these connections are
+    only dispatched once, see :class:`~auraxium.event.Deduplicator`.
+
+    Events sent while a connection is down are lost. If `backfill` is
+    enabled, any :class:`~auraxium.event.Death`,
+    :class:`~auraxium.event.VehicleDestroy` and
+    :class:`~auraxium.event.FacilityControl` events missed during the
+    outage are instead retrieved via the REST API after reconnecting.
+
+    If `enrich` is enabled, the objects referenced by incoming events,
+    such as the characters involved or the weapon used, are resolved
+    in batches before the events are dispatched and made available via
+    :attr:`Event.refs <auraxium.event.Event.refs>`. See
+    :class:`~auraxium.event.Enricher` for details.
+
+    .. attribute:: backfill
+       :type: bool
+
+       Whether to recover events missed while a connection was down.
+
+    .. attribute:: connections
+       :type: list[auraxium.event.Connection]
+
+       The WebSocket connections used by the client. There is one
+       connection per shard and replica.
+
+    .. attribute:: deduplicator
+       :type: auraxium.event.Deduplicator | None
+
+       The filter used to discard duplicate events received through
+       multiple connections. :obj:`None` if deduplication is
+       disabled.
+
+    .. attribute:: enricher
+       :type: auraxium.event.Enricher | None
+
+       The enrichment stage resolving the objects referenced by
+       events before dispatch. :obj:`None` if enrichment is disabled.
+
     .. attribute:: ess_endpoint
        :type: yarl.URL
 
        The URL of the event streaming service endpoint. If not set,
-       defaults to the daybreak games streaming endpoint.
+       defaults to the daybreak games streaming endpoint. If multiple
+       endpoints were specified, this is the first.
+
+    .. attribute:: ess_endpoints
+       :type: list[yarl.URL]
+
+       All event streaming service endpoints used by the client.
+       Shards are assigned to these endpoints in a round-robin
+       fashion, with redundant replicas of a shard using the
+       subsequent endpoints.
+
+    .. attribute:: metrics
+       :type: auraxium.event.Metrics
+
+       Throughput, latency and queue depth metrics for the client's
+       event processing.
+
+    .. attribute:: recorder
+       :type: auraxium.event.Recorder | None
+
+       If set, all messages received through the client's connections
+       are written to this recorder. Messages fed to the client via
+       :func:`~auraxium.event.replay` are not recorded.
+
+    .. attribute:: shard_by
+       :type: auraxium.event.ShardKey
+
+       The subscription field used to distribute subscriptions across
+       shards.
 
     .. attribute:: triggers
        :type: list[auraxium.event.Trigger]
 
        The list of :class:`Triggers <auraxium.event.Trigger>`
        registered for the client.
-
-    .. attribute:: websocket
-       :type: websockets.asyncio.client.ClientConnection | None
-
-       The websocket client used for the real-time event stream. This
-       will be automatically opened and closed by the client as event
-       triggers are added and removed.
     """
 
     def __init__(self, *args: Any,
-                 ess_endpoint: yarl.URL | str | None = None,
+                 ess_endpoint: (yarl.URL | str | list[yarl.URL] | list[str]
+                                | None) = None,
+                 shards: int = 1, shard_by: ShardKey = ShardKey.WORLD,
+                 redundancy: int = 1, dedup_window: float | None = None,
+                 backfill: bool = False, enrich: bool = False,
                  **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-
-        self.ess_endpoint: yarl.URL
+        """Initialise a new event client.
+
+        Any positional or keyword arguments not listed here are
+        forwarded to the :class:`auraxium.Client` initialiser.
+
+        :param ess_endpoint: The event streaming endpoint(s) to use.
+        :type ess_endpoint: yarl.URL | str | list[yarl.URL] | list[str] | None
+        :param int shards: The number of shards to split subscriptions
+           across.
+        :param ShardKey shard_by: The subscription field used to
+           distribute subscriptions across shards.
+        :param int redundancy: The number of connections carrying each
+           shard.
+        :param dedup_window: The time in seconds for which received
+           events are remembered to discard duplicates. Defaults to 30
+           seconds if `shards` or `redundancy` are greater than 1, and
+           disabled otherwise. Set to zero to disable deduplication.
+        :type dedup_window: float | None
+        :param bool backfill: Whether to recover events missed while a
+           connection was down via the REST API.
+        :param bool enrich: Whether to resolve the objects referenced
+           by events before dispatching them.
+        :raises ValueError: Raised if no endpoints are given, or if
+           `shards` or `redundancy` are less than 1.
+        """
+        ess_endpoints: list[yarl.URL]
         if ess_endpoint is None:
-            self.ess_endpoint = default_endpoints()[1]
-        elif isinstance(ess_endpoint, yarl.URL):
-            self.ess_endpoint = ess_endpoint
+            ess_endpoints = [default_endpoints()[1]]
+        elif isinstance(ess_endpoint, (str, yarl.URL)):
+            ess_endpoints = [yarl.URL(ess_endpoint)]
         else:
-            self.ess_endpoint = yarl.URL(ess_endpoint)
+            ess_endpoints = [yarl.URL(e) for e in ess_endpoint]
+        if not ess_endpoints:
+            raise ValueError('At least one ESS endpoint is required')
+        if shards < 1:
+            raise ValueError(f'{shards} is not a valid number of shards')
+        if redundancy < 1:
+            raise ValueError(f'{redundancy} is not a valid redundancy')
+        super().__init__(*args, **kwargs)
 
+        self.backfill: bool = backfill
+        self.ess_endpoints: list[yarl.URL] = ess_endpoints
+        self.ess_endpoint: yarl.URL = ess_endpoints[0]
+        self.metrics: Metrics = Metrics(self)
+        self.recorder: Recorder | None = None
+        self.shard_by: ShardKey = shard_by
+
+        self.connections: list[Connection] = [
+            Connection(ess_endpoints[(i + r) % len(ess_endpoints)],
+                       self.service_id, self._process_payload,
+                       self._on_reconnect, shard=i)
+            for i in range(shards) for r in range(redundancy)]
+        if dedup_window is None:
+            dedup_window = 30.0 if shards > 1 or redundancy > 1 else 0.0
+        self.deduplicator: Deduplicator | None = None
+        if dedup_window > 0.0:
+            self.deduplicator = Deduplicator(window=dedup_window)
+        self.enricher: Enricher | None = None
+        if enrich:
+            self.enricher = Enricher(self, callback=self.dispatch)
         self.triggers: list[Trigger] = []
-        self.websocket: websockets.ClientConnection | None = None
+        self._subscriptions: dict[int, SubscriptionUnion] = {
+            i: SubscriptionUnion() for i in range(shards)}
+        self._trigger_subscriptions: dict[
+            Trigger, dict[int, dict[str, Any]]] = {}
+        self._backfilling: dict[int, list[Event]] = {}
+        self._recent: dict[int, collections.deque[
+            tuple[int, tuple[Any, ...]]]] = {}
+        self._batch_timers: dict[BatchTrigger, asyncio.TimerHandle] = {}
         self._endpoint_status: dict[str, bool] = {}
-        self._send_queue: list[str] = []
         self._open: bool = False
+        self._tasks: set[asyncio.Task[None]] = set()
         _log.addFilter(RedactingFilter(self.service_id))
 
     @property
@@ -95,12 +246,44 @@ class EventClient(Client):
         """
         return self._endpoint_status
 
+    @property
+    def websocket(self) -> websockets.ClientConnection | None:
+        """Return the websocket of the first connection.
+
+        The websocket client used for the real-time event stream. This
+        will be automatically opened and closed by the client as event
+        triggers are added and removed.
+
+        If the client uses multiple shards, refer to
+        :attr:`connections` for the websockets of the other shards.
+
+        .. versionchanged:: 0.5
+
+           This is now a property forwarding to the first of the
+           client's :attr:`connections`; assigning to it replaces the
+           websocket of that connection. The private ``_send_queue``
+           and ``_connection_handler`` members were replaced by
+           :meth:`Connection.send() <auraxium.event.Connection.send>`
+           and :meth:`Connection.run() <auraxium.event.Connection.run>`.
+        """
+        return self.connections[0].websocket
+
+    @websocket.setter
+    def websocket(self, value: websockets.ClientConnection | None) -> None:
+        """Replace the websocket of the first connection."""
+        self.connections[0].websocket = value
+
     def add_trigger(self, trigger: Trigger) -> None:
         """Add a new event trigger to the client.
 
         If there is currently no active websocket connection to the
         event streaming service, one will be created for this trigger.
 
+        Only the parts of the trigger's subscription not already
+        covered by other triggers are sent to the event streaming
+        service. Changes made in quick succession are combined into a
+        single subscription message.
+
         .. note::
 
            As this is a synchronous method, the WebSocket will not be
@@ -112,8 +295,7 @@ class EventClient(Client):
         """
         _log.debug('Adding trigger %s', trigger)
         self.triggers.append(trigger)
-        subscription = trigger.generate_subscription()
-        self._send_queue.append(subscription)
+        self._subscribe(trigger)
         # Only queue the connect() method if it is not already running
         if not self._open:
             _log.debug('Websocket not connected, scheduling connection')
@@ -140,6 +322,9 @@ class EventClient(Client):
         You can either provide the trigger instance to remove, or
         specify the name of the trigger instead.
 
+        Any events, characters or worlds no longer required by the
+        remaining triggers are unsubscribed from.
+
         By default, the underlying websocket connection will be closed
         if this was the only trigger registered. Use the
         `keep_websocket_alive` flag to prevent this, for example if you
@@ -163,18 +348,123 @@ class EventClient(Client):
         except ValueError as err:  # pragma: no cover
             raise RuntimeError('The given trigger is not registered for '
                                'this client') from err
+        self._unsubscribe(trigger)
+        # Deliver any events still buffered for the removed trigger
+        if isinstance(trigger, BatchTrigger):
+            self._flush_batch(trigger)
         # If this was the only trigger registered, close the websocket
         if not keep_websocket_alive and not self.triggers:
             _log.info('All triggers have been removed, closing websocket')
             self.loop.create_task(self.close())
 
-    def _subscribe_all(self) -> None:
-        """Add subscription messages for every registered trigger.
+    def _subscribe(self, trigger: Trigger) -> None:
+        """Add a trigger's subscription to the client's subscriptions.
+
+        The trigger's subscription is split across the client's shards
+        and each part is added to the subscriptions of its shard.
 
-        This will add a subscription message for every trigger currently registered with the client.
-        Useful for resubscribing to all events after a disconnect.
+        :param Trigger trigger: The trigger to subscribe to.
         """
-        self._send_queue.extend([trigger.generate_subscription() for trigger in self.triggers])
+        parts = self._split(trigger)
+        self._trigger_subscriptions[trigger] = parts
+        for shard, part in parts.items():
+            self._subscriptions[shard].add(part)
+        self._update_subscriptions(parts)
+
+    def _unsubscribe(self, trigger: Trigger) -> None:
+        """Remove a trigger's subscription from the client's subscriptions.
+
+        :param Trigger trigger: The trigger to unsubscribe from.
+        """
+        parts = self._trigger_subscriptions.pop(trigger, {})
+        for shard, part in parts.items():
+            self._subscriptions[shard].remove(part)
+        self._update_subscriptions(parts)
+
+    def _update_subscriptions(self, shards: Iterable[int]) -> None:
+        """Update the subscriptions of the connections of some shards.
+
+        :param shards: The shards whose subscriptions have changed.
+        :type shards: collections.abc.Iterable[int]
+        """
+        shards = set(shards)
+        for connection in self.connections:
+            if connection.shard in shards:
+                union = self._subscriptions[connection.shard]
+                connection.subscribe(union.values(), union.logical_and)
+
+    def _split(self, trigger: Trigger) -> dict[int, dict[str, Any]]:
+        """Split a trigger's subscription across the client's shards.
+
+        :param Trigger trigger: The trigger to split.
+        :return: A mapping of shard indices to subscription messages.
+        """
+        data = json.loads(trigger.generate_subscription())
+        return split_subscription(
+            data, self.shard_by, len(self._subscriptions))
+
+    def _on_reconnect(self, connection: Connection) -> None:
+        """Handle a re-established connection.
+
+        The connection restores its subscription by itself. If enabled,
+        this starts recovering the events missed in the meantime.
+
+        :param Connection connection: The connection that reconnected.
+        """
+        _log.info('%r reconnected, resubscribing', connection)
+        if not self.backfill or connection.last_gap is None:
+            return
+        shard = connection.shard
+        # Redundant connections carrying the same shard did not miss anything
+        if shard in self._backfilling or any(
+                c.shard == shard and c.is_ready for c in self.connections
+                if c is not connection):
+            return
+        self._backfilling[shard] = []
+        task = self.loop.create_task(
+            self._backfill_gap(shard, *connection.last_gap))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _backfill_gap(self, shard: int, start: float, end: float
+                            ) -> None:
+        """Recover and dispatch events missed by a shard.
+
+        Events received live through the shard while the missed events
+        are retrieved are held back, then dispatched along with the
+        recovered events in timestamp order. Since the recovery window
+        includes the seconds at either edge of the gap, recovered
+        events matching a held back or recently dispatched live event
+        are discarded.
+
+        :param int shard: The shard whose connection was down.
+        :param float start: The UTC timestamp of the start of the gap.
+        :param float end: The UTC timestamp of the end of the gap.
+        """
+        _log.info('Recovering events missed by shard %d', shard)
+        subscriptions = [p[shard]
+                         for p in self._trigger_subscriptions.values()
+                         if shard in p]
+        events: list[Event] = []
+        try:
+            events = await backfill_events(self, subscriptions, start, end)
+        except Exception as err:  # pylint: disable=broad-except
+            _log.warning('Unable to recover missed events: %s', err)
+        finally:
+            held = self._backfilling.pop(shard, [])
+        # Live events carry more fields than recovered ones; keep those
+        seen = collections.Counter(k for _, k in self._recent.get(shard, ()))
+        seen.update(backfill_key(e) for e in held)
+        for event in events:
+            key = backfill_key(event)
+            if seen[key] > 0:
+                seen[key] -= 1
+            else:
+                held.append(event)
+        held.sort(key=lambda e: e.timestamp)
+        for event in held:
+            self._remember(shard, event)
+            self._deliver(event)
 
     async def close(self) -> None:
         """Gracefully shut down the client.
@@ -184,6 +474,13 @@ class EventClient(Client):
 
         Call this to clean up before the client object is destroyed.
         """
+        self.metrics.stop()
+        if self.enricher is not None:
+            await self.enricher.flush()
+        # Single-shot triggers remove themselves when flushed
+        for trigger in list(self.triggers):
+            if isinstance(trigger, BatchTrigger):
+                self._flush_batch(trigger)
         await self.disconnect()
         await super().close()
 
@@ -204,7 +501,7 @@ class EventClient(Client):
             _log.debug('Websocket already running')
             return
         self._open = True
-        await self._connection_handler()
+        await asyncio.gather(*(c.run() for c in self.connections))
 
     async def disconnect(self) -> None:
         """Disconnect the WebSocket.
@@ -216,9 +513,7 @@ class EventClient(Client):
             return
         self._open = False
         _log.info('Closing websocket connection')
-        if (self.websocket is not None
-                and self.websocket.state == websockets.State.OPEN):
-            await self.websocket.close()
+        await asyncio.gather(*(c.close() for c in self.connections))
 
     def dispatch(self, event: Event) -> None:
         """Dispatch an event to the appropriate event triggers.
@@ -230,7 +525,10 @@ class EventClient(Client):
 
         The call-backs for the matching triggers will be scheduled for
         execution in the current event loop using
-        :meth:`asyncio.loop.create_task`.
+        :meth:`asyncio.loop.create_task`. Triggers with a
+        :attr:`~auraxium.event.Trigger.max_running` limit only start
+        as many call-backs as allowed, adding any others to their
+        :attr:`~auraxium.event.Trigger.backlog`.
 
         If a trigger's
         :attr:`single_shot <auraxium.event.Trigger.single_shot>`
@@ -240,84 +538,158 @@ class EventClient(Client):
         single-shot trigger runs, the associated trigger will no longer
         be registered for the client.
 
+        Events matching a :class:`~auraxium.event.BatchTrigger` are
+        buffered instead; its call-back is scheduled once per batch.
+
         :param auraxium.event.Event event: An event received through
            the event stream.
         """
+        # Checked once per event as formatting triggers is expensive
+        debug = _log.isEnabledFor(logging.DEBUG)
         for trigger in self.triggers:
-            _log.debug('Checking trigger %s', trigger)
+            if debug:
+                _log.debug('Checking trigger %s', trigger)
             if trigger.check(event):
-                _log.debug('Scheduling trigger %s', trigger)
-                self.loop.create_task(trigger.run(event))
+                if isinstance(trigger, BatchTrigger):
+                    self._buffer_event(trigger, event)
+                    continue
+                if debug:
+                    _log.debug('Scheduling trigger %s', trigger)
+                self._submit(trigger, functools.partial(trigger.run, event))
                 # Single-shot triggers self-unload as soon as their call-back
                 # is scheduled
                 if trigger.single_shot:
                     _log.info('Removing single-shot trigger %s', trigger)
                     self.remove_trigger(trigger)
 
-    async def _connection_handler(self) -> None:
-        """Internal WebSocket connection handler.
+    def _remember(self, shard: int, event: Event) -> None:
+        """Remember a recoverable event dispatched through a shard.
 
-        This worker is designed to fail internally and be restarted by
-        the :meth:`connect` method as per its reconnect policy.
+        Only the events from the last few seconds before the shard's
+        most recent event are kept.
 
-        This should therefore only be called through that method.
-        """
-        _log.info('Connecting to WebSocket endpoint...')
-        url = self.ess_endpoint.with_query(
-            {'environment': 'ps2', 'service-id': self.service_id})
-
-        # NOTE: The following "async for" loop will cleanly restart the
-        # connection should it go down. Invoking "continue" manually may be
-        # used to manually force a reconnect if needed.
-        connection_failed = False
-        async for websocket in websockets.connect(str(url)):
-            _log.info('Connected to %s', url)
-            if connection_failed:
-                self._subscribe_all()
-                connection_failed = False
-            self.websocket = websocket
-
-            try:
-                while self._open:
-                    await self._handle_websocket()
-
-            except websockets.exceptions.ConnectionClosed:
-                _log.info('Connection closed, restarting...')
-                connection_failed = True
-                continue
-
-            if not self._open:
-                break
-
-        self.websocket = None
-        _log.info('Disconnected from WebSocket endpoint')
-
-    async def _handle_websocket(self, timeout: float = 0.1) -> None:
-        """Main loop handling the WebSocket connection.
-
-        This method processes event payloads and sends messages added
-        to :attr:`EventClient._send_queue`.
+        :param int shard: The shard the event was received through.
+        :param auraxium.event.Event event: The event dispatched.
         """
-        if self.websocket is None:  # pragma: no cover
+        if event.event_name not in BACKFILL_EVENTS:
             return
-        try:
-            response = str(await asyncio.wait_for(
-                self.websocket.recv(), timeout=timeout))
-        except asyncio.TimeoutError:
-            # NOTE: This inner timeout try block is used to ensure the
-            # websocket will regularly check for messages in the client's
-            # ``_send_queue`` even when no messages are received. Without this,
-            # awaiting ``self.websocket.recv()`` would block subscriptions from
-            # being sent until a heartbeat message is received, causing random
-            # delays.
-            pass
+        key = backfill_key(event)
+        if (recent := self._recent.get(shard)) is None:
+            recent = self._recent[shard] = collections.deque()
+        recent.append((key[1], key))
+        while recent[0][0] < key[1] - _RECENT_WINDOW:
+            recent.popleft()
+
+    def _deliver(self, event: Event) -> None:
+        """Dispatch an event, passing it through enrichment first.
+
+        :param auraxium.event.Event event: The event to deliver.
+        """
+        if self.enricher is not None:
+            self.enricher.submit(event)
         else:
-            self._process_payload(response)
-        finally:
-            if self._send_queue:
-                msg = self._send_queue.pop(0)
-                _log.info('Sending message: %s', msg)
-                await self.websocket.send(msg)
+            self.dispatch(event)
+
+    def _buffer_event(self, trigger: BatchTrigger, event: Event) -> None:
+        """Add an event to a batch trigger's buffer.
+
+        The batch is flushed immediately if it is full. Otherwise, the
+        first event of a new batch starts the trigger's batch window.
+
+        :param BatchTrigger trigger: The trigger to buffer the event
+           for.
+        :param auraxium.event.Event event: The matching event.
+        """
+        if trigger.add(event):
+            self._flush_batch(trigger)
+        elif trigger.batch_window > 0.0 and trigger not in self._batch_timers:
+            self._batch_timers[trigger] = self.loop.call_later(
+                trigger.batch_window, self._flush_batch, trigger)
+
+    def _flush_batch(self, trigger: BatchTrigger) -> None:
+        """Schedule the call-back of a batch trigger.
+
+        This cancels any pending batch window timer for the trigger and
+        schedules its call-back with the currently buffered events. If
+        the buffer is empty, this does nothing.
+
+        :param BatchTrigger trigger: The trigger to flush.
+        """
+        if (timer := self._batch_timers.pop(trigger, None)) is not None:
+            timer.cancel()
+        events = trigger.flush()
+        if not events:
+            return
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug('Scheduling trigger %s with batch of %d events',
+                       trigger, len(events))
+        self._submit(trigger, functools.partial(trigger.run_batch, events))
+        if trigger.single_shot and trigger in self.triggers:
+            _log.info('Removing single-shot trigger %s', trigger)
+            self.remove_trigger(trigger)
+
+    def _submit(self, trigger: Trigger, job: _Job) -> None:
+        """Run or enqueue a trigger call-back.
+
+        If the trigger has a free slot, the call-back is started right
+        away. Otherwise, it is added to the trigger's backlog, applying
+        the trigger's overflow policy if the backlog is full.
+
+        :param Trigger trigger: The trigger the call-back belongs to.
+        :param job: A callable returning the call-back coroutine.
+        """
+        stats = trigger.stats
+        if trigger.max_running is None or stats.running < trigger.max_running:
+            self._start(trigger, job)
+            return
+        if (trigger.max_queued is not None
+                and len(trigger.backlog) >= trigger.max_queued):
+            stats.dropped += 1
+            if (trigger.overflow is OverflowPolicy.DROP_NEWEST
+                    or not trigger.backlog):
+                if _log.isEnabledFor(logging.DEBUG):
+                    _log.debug('Backlog of trigger %s full, dropping event',
+                               trigger)
+                return
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug('Backlog of trigger %s full, dropping oldest '
+                           'event', trigger)
+            trigger.backlog.popleft()
+        trigger.backlog.append(job)
+        stats.queued = len(trigger.backlog)
+
+    def _start(self, trigger: Trigger, job: _Job) -> None:
+        """Start a trigger call-back as a new task.
+
+        :param Trigger trigger: The trigger the call-back belongs to.
+        :param job: A callable returning the call-back coroutine.
+        """
+        trigger.stats.running += 1
+        task = self.loop.create_task(job())
+        # NOTE: The event loop only keeps weak references to tasks, so a
+        # strong reference is kept until the call-back has finished.
+        self._tasks.add(task)
+        task.add_done_callback(functools.partial(
+            self._on_done, trigger, time.perf_counter()))
+
+    def _on_done(self, trigger: Trigger, started: float,
+                 task: asyncio.Task[None]) -> None:
+        """Update trigger stats and start the next queued call-back.
+
+        :param Trigger trigger: The trigger the call-back belongs to.
+        :param float started: The :func:`time.perf_counter` value at
+           the start of the call-back.
+        :param asyncio.Task task: The finished call-back task.
+        """
+        self._tasks.discard(task)
+        self.metrics.record_callback(trigger, time.perf_counter() - started)
+        stats = trigger.stats
+        stats.running -= 1
+        stats.completed += 1
+        if trigger.backlog and (trigger.max_running is None
+                                or stats.running < trigger.max_running):
+            self._start(trigger, trigger.backlog.popleft())
+            stats.queued = len(trigger.backlog)
 
     @overload
     def trigger(self, event: type[_EventT], *, name: str | None = None,
@@ -378,37 +750,104 @@ class EventClient(Client):
 
         return wrapper
 
-    def _process_payload(self, response: str) -> None:
+    def batch_trigger(self, event: str | type[Event],
+                      *args: str | type[Event], name: str | None = None,
+                      batch_size: int = 100, batch_window: float = 1.0,
+                      **kwargs: Any
+                      ) -> Callable[[_BatchCallbackT[Event]], None]:
+        """Create and add a batch trigger for the given action.
+
+        Like :meth:`trigger`, but creates a
+        :class:`~auraxium.event.BatchTrigger` whose call-back receives
+        a list of events rather than a single event.
+
+        :param event: The event to trigger on.
+        :type event: str | type[auraxium.event.Event]
+        :param args: Additional events that also trigger the action.
+        :type args: str | type[auraxium.event.Event]
+        :param name: The name to assign to the trigger. If not
+           specified, the decorated function's name will be used.
+        :type name: str | None
+        :param int batch_size: The maximum number of events per batch.
+        :param float batch_window: The maximum time in seconds to wait
+           before flushing a non-empty batch.
+        :raises KeyError: Raised if a trigger with the given name
+           already exists.
+        """
+        trigger = BatchTrigger(event, *args, name=name, batch_size=batch_size,
+                               batch_window=batch_window, **kwargs)
+
+        def wrapper(func: _BatchCallbackT[Event]) -> None:
+            trigger.action = func
+            if trigger.name is None:
+                trigger.name = func.__name__
+            if any(t.name == trigger.name for t in self.triggers):
+                raise KeyError(f'The trigger "{trigger.name}" already exists')
+            self.add_trigger(trigger)
+
+        return wrapper
+
+    def _process_payload(self, response: str,
+                         source: Connection | None = None) -> None:
         """Process a response payload received through the WebSocket.
 
         This method filters out any non-event messages (such as service
         messages, connection heartbeats or subscription echoes) before
         passing any event payloads on to :meth:`dispatch`.
 
+        If deduplication is enabled, events already received through
+        another connection are discarded before being decoded.
+
         :param str response: The plain text response received through
            the ESS.
+        :param source: The connection the response was received
+           through, if any.
+        :type source: Connection | None
         """
-        _log.debug('Received response: %s', response)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug('Received response: %s', response)
+        self.metrics.messages += 1
+        if self.recorder is not None and source is not None:
+            self.recorder.write(response)
         data: CensusData = json.loads(response)
         service = data.get('service')
         # Event messages
         if service == 'event':
             if data['type'] == 'serviceMessage':
+                payload = cast(CensusData, data['payload'])
+                if (self.deduplicator is not None
+                        and not self.deduplicator.accept(payload, source)):
+                    if debug:
+                        _log.debug('Discarding duplicate event: %s', payload)
+                    return
+                start = time.perf_counter()
                 try:
-                    event = _event_factory(cast(CensusData, data['payload']))
+                    event = _event_factory(payload)
                 except pydantic.ValidationError as err:  # pragma: no cover
                     _log.warning(
                         'Ignoring unsupported payload: %s\nPayload: %s\n',
                         err, data['payload'])
                     return
-                _log.debug('%s event received, dispatching...',
-                           event.event_name)
-                self.dispatch(event)
+                self.metrics.record_event(event, time.perf_counter() - start)
+                # Hold back live events until missed events are recovered
+                if (source is not None
+                        and source.shard in self._backfilling):
+                    self._backfilling[source.shard].append(event)
+                    return
+                if self.backfill and source is not None:
+                    self._remember(source.shard, event)
+                if debug:
+                    _log.debug('%s event received, dispatching...',
+                               event.event_name)
+                start = time.perf_counter()
+                self._deliver(event)
+                self.metrics.record_dispatch(time.perf_counter() - start)
             elif data['type'] == 'heartbeat':  # pragma: no cover
                 servers = cast(dict[str, str], data['online'])
-                self._endpoint_status = {
+                self._endpoint_status.update({
                     k.split('_', maxsplit=2)[1]: v == 'true'
-                    for k, v in servers.items()}
+                    for k, v in servers.items()})
                 _log.debug('Heartbeat received: %s', data)
         # Subscription echo
         elif 'subscription' in data:
@@ -496,13 +935,13 @@ class EventClient(Client):
         `interval` argument.
 
         If the WebSocket is already active at the time this method is
-        called, this will return without delay.
+        called, this will return without delay. For sharded clients,
+        this waits for all connections to be ready.
 
         :param float interval: The interval at which to check the
            WebSocket connection's status.
         """
-        while (self.websocket is None
-               or self.websocket.state != websockets.State.OPEN):
+        while not all(c.is_ready for c in self.connections):
             await asyncio.sleep(interval)
 
 
@@ -0,0 +1,357 @@
+"""WebSocket connection handling and subscription sharding."""
+
+import asyncio
+import collections
+import enum
+import json
+import logging
+import time
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+import websockets
+import yarl
+
+__all__ = [
+    'Connection',
+    'ShardKey',
+    'SubscriptionUnion',
+    'split_subscription'
+]
+
+# Subscription fields whose values are merged across subscriptions
+_FIELDS = ('eventNames', 'characters', 'worlds')
+
+_log = logging.getLogger('auraxium.ess')
+
+
+class ShardKey(enum.Enum):
+    """Enumerates the ways subscriptions can be split across shards.
+
+    .. attribute:: WORLD
+
+       Distribute subscriptions by world ID.
+
+    .. attribute:: EVENT
+
+       Distribute subscriptions by event name.
+
+    .. attribute:: CHARACTER
+
+       Distribute subscriptions by character ID.
+    """
+
+    WORLD = 'worlds'
+    EVENT = 'eventNames'
+    CHARACTER = 'characters'
+
+
+class Connection:
+    """A single WebSocket connection to an event streaming endpoint.
+
+    Connections are created and managed by the
+    :class:`~auraxium.event.EventClient`; there is generally no need
+    to interact with them directly.
+
+    .. attribute:: endpoint
+       :type: yarl.URL
+
+       The URL of the event streaming endpoint.
+
+    .. attribute:: last_gap
+       :type: tuple[float, float] | None
+
+       The UTC timestamps of the start and end of the most recent
+       disconnect. The start is the time the last message was received
+       before the connection was lost. :obj:`None` if the connection
+       has not been re-established yet.
+
+    .. attribute:: last_received
+       :type: float | None
+
+       The UTC timestamp of the last message received. :obj:`None` if
+       no message has been received yet.
+
+    .. attribute:: reconnects
+       :type: int
+
+       The number of times the connection has been re-established
+       after being closed unexpectedly.
+
+    .. attribute:: shard
+       :type: int
+
+       The index of the subscription shard carried by this connection.
+
+    .. attribute:: websocket
+       :type: websockets.asyncio.client.ClientConnection | None
+
+       The underlying websocket connection. This is :obj:`None` while
+       the connection is not running.
+    """
+
+    def __init__(self, endpoint: yarl.URL, service_id: str,
+                 on_message: Callable[[str, 'Connection'], None],
+                 on_reconnect: Callable[['Connection'], None],
+                 shard: int = 0) -> None:
+        """Initialise a new connection.
+
+        This does not connect to the endpoint, use :meth:`run` to start
+        the connection.
+
+        :param yarl.URL endpoint: The endpoint to connect to.
+        :param str service_id: The service ID identifying the app.
+        :param on_message: Callable receiving every message received,
+           along with the connection it was received through.
+        :param on_reconnect: Callable run whenever the connection has
+           been re-established after being closed.
+        :param int shard: The subscription shard of this connection.
+        """
+        self.endpoint: yarl.URL = endpoint
+        self.last_gap: tuple[float, float] | None = None
+        self.last_received: float | None = None
+        self.reconnects: int = 0
+        self.shard: int = shard
+        self.websocket: websockets.ClientConnection | None = None
+        self._on_message = on_message
+        self._on_reconnect = on_reconnect
+        self._open: bool = False
+        self._send_queue: list[str] = []
+        self._service_id = service_id
+        # The subscription the connection should have, and the one
+        # acknowledged by the server so far
+        self._target: tuple[dict[str, set[str]], bool] = (
+            {f: set() for f in _FIELDS}, False)
+        self._subscribed: tuple[dict[str, set[str]], bool | None] = (
+            {f: set() for f in _FIELDS}, None)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}:{self.shard}:{self.endpoint}>'
+
+    @property
+    def is_ready(self) -> bool:
+        """Return whether the websocket is open."""
+        return (self.websocket is not None
+                and self.websocket.state == websockets.State.OPEN)
+
+    def send(self, message: str) -> None:
+        """Queue a message to be sent through the websocket.
+
+        :param str message: The message to send.
+        """
+        self._send_queue.append(message)
+
+    def subscribe(self, values: dict[str, set[str]],
+                  logical_and: bool) -> None:
+        """Set the subscription of the connection.
+
+        Rather than being sent immediately, the difference between the
+        current and the new subscription is sent the next time the
+        connection sends messages. This coalesces any number of
+        updates into at most one ``clearSubscribe`` and one
+        ``subscribe`` message. The subscription is also restored
+        automatically after a reconnect.
+
+        :param values: The event names, characters and worlds to
+           subscribe to, keyed by subscription field.
+        :type values: dict[str, set[str]]
+        :param bool logical_and: The value of the
+           ``logicalAndCharactersWithWorlds`` flag.
+        """
+        self._target = (
+            {f: set(values.get(f, ())) for f in _FIELDS}, logical_and)
+
+    def _subscription_delta(self) -> list[dict[str, Any]]:
+        """Return the messages required to update the subscription.
+
+        The subscription is assumed to be up to date once this method
+        returns.
+
+        :return: A list of up to two subscription messages.
+        """
+        target, logical_and = self._target
+        current, current_and = self._subscribed
+        messages: list[dict[str, Any]] = []
+        removed = {f: sorted(current[f] - target[f]) for f in _FIELDS}
+        if any(removed.values()):
+            messages.append({'action': 'clearSubscribe', 'service': 'event',
+                             **{k: v for k, v in removed.items() if v}})
+        added = {f: sorted(target[f] - current[f]) for f in _FIELDS}
+        if any(added.values()) or (
+                current_and is not None and logical_and != current_and):
+            messages.append({
+                'action': 'subscribe', 'service': 'event',
+                **{k: v for k, v in added.items() if v},
+                'logicalAndCharactersWithWorlds': (
+                    'true' if logical_and else 'false')})
+        self._subscribed = (
+            {f: set(target[f]) for f in _FIELDS}, logical_and)
+        return messages
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if not self._open:
+            return
+        self._open = False
+        if self.is_ready:
+            assert self.websocket is not None
+            await self.websocket.close()
+
+    async def run(self) -> None:
+        """Connect to the endpoint and process messages.
+
+        This will continuously loop until :meth:`close` is called. If
+        the websocket connection is closed unexpectedly, it will be
+        re-established automatically.
+        """
+        if self._open:  # pragma: no cover
+            _log.debug('%r already running', self)
+            return
+        self._open = True
+        _log.info('Connecting to WebSocket endpoint...')
+        url = self.endpoint.with_query(
+            {'environment': 'ps2', 'service-id': self._service_id})
+
+        # NOTE: The following "async for" loop will cleanly restart the
+        # connection should it go down. Invoking "continue" manually may be
+        # used to manually force a reconnect if needed.
+        connection_failed = False
+        async for websocket in websockets.connect(str(url)):
+            _log.info('Connected to %s', url)
+            if connection_failed:
+                # The new connection starts without any subscriptions
+                self._subscribed = {f: set() for f in _FIELDS}, None
+                now = time.time()
+                self.last_gap = self.last_received or now, now
+                self.reconnects += 1
+                self._on_reconnect(self)
+                connection_failed = False
+            self.websocket = websocket
+
+            try:
+                while self._open:
+                    await self._handle_websocket()
+
+            except websockets.exceptions.ConnectionClosed:
+                if not self._open:
+                    break
+                _log.info('Connection closed, restarting...')
+                connection_failed = True
+                continue
+
+            if not self._open:
+                break
+
+        self.websocket = None
+        _log.info('Disconnected from WebSocket endpoint')
+
+    async def _handle_websocket(self, timeout: float = 0.1) -> None:
+        """Main loop handling the WebSocket connection.
+
+        This method forwards received messages and sends any messages
+        added via :meth:`send`.
+        """
+        if self.websocket is None:  # pragma: no cover
+            return
+        try:
+            response = str(await asyncio.wait_for(
+                self.websocket.recv(), timeout=timeout))
+        except asyncio.TimeoutError:
+            # NOTE: This inner timeout try block is used to ensure the
+            # websocket will regularly check for messages in the
+            # ``_send_queue`` even when no messages are received. Without
+            # this, awaiting ``self.websocket.recv()`` would block
+            # subscriptions from being sent until a heartbeat message is
+            # received, causing random delays.
+            pass
+        else:
+            self.last_received = time.time()
+            self._on_message(response, self)
+        finally:
+            if self._send_queue:
+                msg = self._send_queue.pop(0)
+                _log.info('Sending message: %s', msg)
+                await self.websocket.send(msg)
+            for data in self._subscription_delta():
+                msg = json.dumps(data)
+                _log.info('Sending message: %s', msg)
+                await self.websocket.send(msg)
+
+
+class SubscriptionUnion:
+    """The combined subscriptions of multiple triggers.
+
+    The event streaming service merges all subscriptions sent through
+    a connection into a single set of event names, characters and
+    worlds. This class tracks how many subscriptions reference each of
+    these values, so that a value is only unsubscribed from once no
+    subscription references it anymore.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[str, collections.Counter[str]] = {
+            f: collections.Counter() for f in _FIELDS}
+        self._logical_and = 0
+
+    def add(self, data: dict[str, Any]) -> None:
+        """Add a subscription message to the union.
+
+        :param data: The subscription message to add.
+        :type data: dict[str, typing.Any]
+        """
+        for field in _FIELDS:
+            self._counts[field].update(data.get(field, ()))
+        if str(data.get('logicalAndCharactersWithWorlds')).lower() == 'true':
+            self._logical_and += 1
+
+    def remove(self, data: dict[str, Any]) -> None:
+        """Remove a previously added subscription message.
+
+        :param data: The subscription message to remove.
+        :type data: dict[str, typing.Any]
+        """
+        for field in _FIELDS:
+            counts = self._counts[field]
+            counts.subtract(data.get(field, ()))
+            for value in [k for k, v in counts.items() if v <= 0]:
+                del counts[value]
+        if str(data.get('logicalAndCharactersWithWorlds')).lower() == 'true':
+            self._logical_and -= 1
+
+    @property
+    def logical_and(self) -> bool:
+        """Whether any subscription requires the logical AND flag."""
+        return self._logical_and > 0
+
+    def values(self) -> dict[str, set[str]]:
+        """Return the values currently subscribed to, by field."""
+        return {f: set(c) for f, c in self._counts.items()}
+
+
+def split_subscription(data: dict[str, Any], key: ShardKey,
+                       count: int) -> dict[int, dict[str, Any]]:
+    """Split a subscription message across a number of shards.
+
+    The list of values for the given key is distributed across the
+    shards; all other fields are copied as-is. Subscriptions that
+    cannot be split, such as those for ``'all'`` worlds when sharding
+    by world, are assigned to the first shard.
+
+    :param data: The subscription message to split.
+    :param ShardKey key: The subscription field to shard by.
+    :param int count: The number of shards.
+    :return: A mapping of shard indices to the subscription message
+       for that shard. Shards without any values are omitted.
+    """
+    values: list[str] = data.get(key.value, [])
+    if count <= 1 or not values or 'all' in values:
+        return {0: data}
+    buckets: dict[int, list[str]] = {}
+    for value in values:
+        if key is ShardKey.EVENT:
+            index = zlib.crc32(value.encode()) % count
+        else:
+            index = int(value) % count
+        buckets.setdefault(index, []).append(value)
+    return {i: {**data, key.value: v} for i, v in sorted(buckets.items())}
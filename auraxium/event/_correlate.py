@@ -0,0 +1,200 @@
+"""Correlation of related events within a time window."""
+
+import collections
+import itertools
+import math
+from collections.abc import Callable, Hashable
+
+from ..models import Event
+
+__all__ = [
+    'Correlator'
+]
+
+_KeyFunc = Callable[[Event], Hashable | None]
+
+
+class Correlator:
+    """Pair up related events that occur within a time window.
+
+    Events are indexed by a key returned by the `index` function. Each
+    new event is first checked against the index using the key
+    returned by the `probe` function; if a recent event with this key
+    exists, the two are reported as a match. Otherwise, the new event
+    is added to the index itself.
+
+    Either function may return :obj:`None` to skip that step for a
+    given event, which allows correlating different event types:
+
+    .. code-block:: python3
+
+       # Mutual deaths: a kill followed by the victim killing the attacker
+       mutual = event.Correlator(
+           5.0, index=lambda e: (e.attacker_character_id, e.character_id),
+           probe=lambda e: (e.character_id, e.attacker_character_id))
+
+       # Revives: a death followed by a revive experience tick
+       revives = event.Correlator(
+           30.0,
+           index=lambda e: (e.character_id
+                            if isinstance(e, event.Death) else None),
+           probe=lambda e: (e.other_id if isinstance(
+               e, event.GainExperience) else None))
+
+    Lookups and insertions take constant time. Events are timed by
+    their :attr:`~auraxium.event.Event.timestamp` and expire once they
+    are older than :attr:`window`, or once more than :attr:`max_size`
+    events are indexed.
+
+    .. attribute:: consume
+       :type: bool
+
+       Whether indexed events are removed once matched. If false, an
+       indexed event may be matched multiple times.
+
+    .. attribute:: matches
+       :type: int
+
+       The number of matches found.
+
+    .. attribute:: max_size
+       :type: int
+
+       The maximum number of events to keep indexed.
+
+    .. attribute:: window
+       :type: float
+
+       The maximum time in seconds between two matching events.
+    """
+
+    def __init__(self, window: float, index: _KeyFunc,
+                 probe: _KeyFunc | None = None,
+                 on_match: Callable[[Event, Event], None] | None = None,
+                 max_size: int = 100_000, consume: bool = True) -> None:
+        """Create a new, empty correlator.
+
+        :param float window: The maximum time in seconds between two
+           matching events.
+        :param index: Callable returning the key to index an event
+           under, or :obj:`None` to not index it.
+        :type index: collections.abc.Callable[[Event],
+           collections.abc.Hashable | None]
+        :param probe: Callable returning the key of the indexed events
+           matching an event, or :obj:`None` to not look it up.
+           Defaults to `index`.
+        :type probe: collections.abc.Callable[[Event],
+           collections.abc.Hashable | None] | None
+        :param on_match: Callable receiving the indexed event and the
+           new event for every match found.
+        :type on_match: collections.abc.Callable[[Event, Event], None]
+           | None
+        :param int max_size: The maximum number of events to keep
+           indexed.
+        :param bool consume: Whether to remove indexed events once
+           matched.
+        :raises ValueError: Raised if `window` is negative or
+           `max_size` is less than 1.
+        """
+        if window < 0.0:
+            raise ValueError(f'{window} is not a valid window')
+        if max_size < 1:
+            raise ValueError(f'{max_size} is not a valid size')
+        self.consume: bool = consume
+        self.matches: int = 0
+        self.max_size: int = max_size
+        self.window: float = window
+        self._index_func = index
+        self._probe_func = index if probe is None else probe
+        self._on_match = on_match
+        # Indexed events by key, oldest first
+        self._index: dict[Hashable, collections.deque[
+            tuple[int, float, Event]]] = {}
+        # All insertions in arrival order, used for expiry. Entries for
+        # events that have since been consumed are skipped when expiring;
+        # the sequence number tells them apart from events indexed under
+        # the same key and timestamp.
+        self._order: collections.deque[tuple[int, float, Hashable]] = (
+            collections.deque())
+        self._latest: float = -math.inf
+        self._sequence = itertools.count()
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of events currently indexed."""
+        return self._size
+
+    def add(self, event: Event) -> Event | None:
+        """Process a new event.
+
+        This can be used as a trigger action directly.
+
+        :param auraxium.event.Event event: The event to process.
+        :return: The indexed event matched by the new event, or
+           :obj:`None` if there was no match.
+        """
+        timestamp = event.timestamp.timestamp()
+        self._expire(timestamp)
+        if (key := self._probe_func(event)) is not None:
+            if (match := self._lookup(key, timestamp)) is not None:
+                self.matches += 1
+                if self._on_match is not None:
+                    self._on_match(match, event)
+                return match
+        if (key := self._index_func(event)) is not None:
+            sequence = next(self._sequence)
+            self._index.setdefault(key, collections.deque()).append(
+                (sequence, timestamp, event))
+            self._order.append((sequence, timestamp, key))
+            self._size += 1
+            while self._size > self.max_size:
+                self._evict()
+        return None
+
+    def clear(self) -> None:
+        """Remove all indexed events."""
+        self._index.clear()
+        self._order.clear()
+        self._latest = -math.inf
+        self._size = 0
+
+    def _lookup(self, key: Hashable, timestamp: float) -> Event | None:
+        """Return the oldest indexed event for a key within the window.
+
+        :param collections.abc.Hashable key: The key to look up.
+        :param float timestamp: The timestamp of the probing event.
+        :return: The matching event, or :obj:`None` if not found.
+        """
+        if (entries := self._index.get(key)) is None:
+            return None
+        for position, (_, indexed_at, event) in enumerate(entries):
+            if abs(timestamp - indexed_at) <= self.window:
+                if self.consume:
+                    del entries[position]
+                    self._size -= 1
+                    if not entries:
+                        del self._index[key]
+                return event
+        return None
+
+    def _expire(self, now: float) -> None:
+        """Remove any indexed events older than the window.
+
+        :param float now: The timestamp of the newest event.
+        """
+        self._latest = max(self._latest, now)
+        cutoff = self._latest - self.window
+        order = self._order
+        while order and order[0][1] < cutoff:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the oldest indexed event."""
+        sequence, _, key = self._order.popleft()
+        entries = self._index.get(key)
+        # The entry may already have been consumed by a match
+        if entries and entries[0][0] == sequence:
+            entries.popleft()
+            self._size -= 1
+            if not entries:
+                del self._index[key]
@@ -0,0 +1,150 @@
+"""Deduplication of events received through redundant connections."""
+
+import dataclasses
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+
+from ..types import CensusData
+
+__all__ = [
+    'Deduplicator'
+]
+
+# Payload fields used to identify an event. Fields missing from a given
+# payload are ignored.
+DEFAULT_KEY_FIELDS: tuple[str, ...] = (
+    'event_name', 'timestamp', 'world_id', 'zone_id', 'character_id',
+    'attacker_character_id', 'experience_id', 'other_id', 'amount',
+    'facility_id', 'vehicle_id', 'attacker_weapon_id', 'achievement_id',
+    'item_id', 'skill_id', 'metagame_event_id', 'metagame_event_state')
+
+
+@dataclasses.dataclass()
+class _Entry:
+    """Bookkeeping for a single event key.
+
+    .. attribute:: added
+       :type: float
+
+       The monotonic time the key was first seen.
+
+    .. attribute:: emitted
+       :type: int
+
+       The number of events with this key that have been accepted.
+
+    .. attribute:: counts
+       :type: dict[collections.abc.Hashable, int]
+
+       The number of events with this key received per source.
+    """
+
+    added: float
+    emitted: int
+    counts: dict[Hashable, int]
+
+
+class Deduplicator:
+    """Filter for duplicate events received through multiple streams.
+
+    Events are identified by a content key made up of the values of
+    the :attr:`fields` in their payload. Keys are remembered for
+    :attr:`window` seconds, after which they expire.
+
+    Rather than discarding every repeat of a key, the deduplicator
+    counts how often each source has delivered it. An event is only
+    dropped if some source has already delivered at least as many
+    events with this key. This way, two genuinely identical events sent
+    in the same second (such as repeated experience ticks) are both
+    kept, while their copies from a redundant stream are discarded.
+
+    .. attribute:: duplicates
+       :type: int
+
+       The number of events discarded as duplicates.
+
+    .. attribute:: fields
+       :type: tuple[str, ...]
+
+       The payload fields used to identify an event.
+
+    .. attribute:: max_size
+       :type: int
+
+       The maximum number of keys to remember. Once exceeded, the
+       oldest keys are discarded regardless of their age.
+
+    .. attribute:: window
+       :type: float
+
+       The time in seconds for which an event key is remembered.
+    """
+
+    def __init__(self, window: float = 30.0, max_size: int = 100_000,
+                 fields: Iterable[str] = DEFAULT_KEY_FIELDS) -> None:
+        """Initialise a new, empty deduplicator.
+
+        :param float window: The time in seconds for which an event
+           key is remembered.
+        :param int max_size: The maximum number of keys to remember.
+        :param fields: The payload fields used to identify an event.
+        :type fields: collections.abc.Iterable[str]
+        :raises ValueError: Raised if `max_size` is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError(f'{max_size} is not a valid size')
+        self.duplicates: int = 0
+        self.fields: tuple[str, ...] = tuple(fields)
+        self.max_size: int = max_size
+        self.window: float = window
+        self._entries: 'OrderedDict[tuple[object, ...], _Entry]' = (
+            OrderedDict())
+
+    def __len__(self) -> int:
+        """Return the number of event keys currently remembered."""
+        return len(self._entries)
+
+    def accept(self, payload: CensusData, source: Hashable = None) -> bool:
+        """Return whether the given event payload should be processed.
+
+        :param payload: The raw event payload.
+        :type payload: auraxium.types.CensusData
+        :param source: An identifier for the stream the event was
+           received through, such as the connection object.
+        :type source: collections.abc.Hashable
+        :return: Whether the event is new. If false, the event is a
+           duplicate and should be discarded.
+        """
+        now = time.monotonic()
+        self._expire(now)
+        key = tuple(payload.get(f) for f in self.fields)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = _Entry(now, 1, {source: 1})
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return True
+        count = entry.counts.get(source, 0) + 1
+        entry.counts[source] = count
+        if count > entry.emitted:
+            entry.emitted = count
+            return True
+        self.duplicates += 1
+        return False
+
+    def clear(self) -> None:
+        """Forget all event keys."""
+        self._entries.clear()
+
+    def _expire(self, now: float) -> None:
+        """Remove any keys older than the deduplication window.
+
+        :param float now: The current monotonic time.
+        """
+        entries = self._entries
+        while entries:
+            entry = next(iter(entries.values()))
+            if now - entry.added <= self.window:
+                break
+            entries.popitem(last=False)
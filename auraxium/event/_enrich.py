@@ -0,0 +1,272 @@
+"""Resolution of the objects referenced by events."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .._rest import RequestClient, extract_payload
+from ..base import Cached
+from ..census import Query
+from ..models import Event
+from ..ps2 import (Achievement, Character, Experience, Item, Outfit, Skill,
+                   Vehicle, World, Zone)
+
+__all__ = [
+    'DEFAULT_FIELDS',
+    'Enricher'
+]
+
+DEFAULT_FIELDS: dict[str, type[Cached]] = {
+    'achievement_id': Achievement,
+    'attacker_character_id': Character,
+    'attacker_vehicle_id': Vehicle,
+    'attacker_weapon_id': Item,
+    'character_id': Character,
+    'experience_id': Experience,
+    'item_id': Item,
+    'outfit_id': Outfit,
+    'skill_id': Skill,
+    'vehicle_id': Vehicle,
+    'world_id': World,
+    'zone_id': Zone
+}
+# The number of IDs to look up per request
+_CHUNK_SIZE = 100
+
+_log = logging.getLogger('auraxium.ess')
+
+
+class Enricher:
+    """Resolve the objects referenced by events in batches.
+
+    Events refer to other objects, like the characters involved or the
+    weapon used, by ID. The enricher resolves these IDs for the fields
+    listed in :attr:`fields` and attaches the resulting objects to the
+    event, where they are available via
+    :attr:`Event.refs <auraxium.event.Event.refs>`.
+
+    Objects are taken from the caches of their respective classes
+    where possible. All other IDs are collected across the events of a
+    batch and retrieved with a single query per object type, with any
+    lookups already in progress being shared rather than repeated.
+
+    When enabled on an :class:`~auraxium.event.EventClient` via its
+    `enrich` argument, incoming events are collected for up to
+    :attr:`delay` seconds, resolved as a batch, and then dispatched in
+    the order they were received.
+
+    .. attribute:: delay
+       :type: float
+
+       The maximum time in seconds to collect events for before
+       resolving them.
+
+    .. attribute:: fields
+       :type: dict[str, type[auraxium.base.Cached]]
+
+       The event fields to resolve, mapped to the object type they
+       refer to. Defaults to :data:`DEFAULT_FIELDS`.
+
+    .. attribute:: max_batch
+       :type: int
+
+       The maximum number of events to resolve at once. Batches are
+       resolved early once this many events have been collected.
+    """
+
+    def __init__(self, client: RequestClient,
+                 fields: dict[str, type[Cached]] | None = None,
+                 delay: float = 0.05, max_batch: int = 500,
+                 callback: Callable[[Event], None] | None = None) -> None:
+        """Create a new enricher.
+
+        :param auraxium.Client client: The client to use for lookups.
+        :param fields: The event fields to resolve, mapped to the
+           object type they refer to.
+        :type fields: dict[str, type[auraxium.base.Cached]] | None
+        :param float delay: The maximum time in seconds to collect
+           events for before resolving them.
+        :param int max_batch: The maximum number of events to resolve
+           at once.
+        :param callback: Callable receiving each event submitted via
+           :meth:`submit` once it has been resolved.
+        :type callback: collections.abc.Callable[[Event], None] | None
+        :raises ValueError: Raised if `delay` is negative or
+           `max_batch` is less than 1.
+        """
+        if delay < 0.0:
+            raise ValueError(f'{delay} is not a valid delay')
+        if max_batch < 1:
+            raise ValueError(f'{max_batch} is not a valid batch size')
+        self.delay: float = delay
+        self.fields: dict[str, type[Cached]] = dict(
+            DEFAULT_FIELDS if fields is None else fields)
+        self.max_batch: int = max_batch
+        self._callback = callback
+        self._client = client
+        self._last: asyncio.Task[None] | None = None
+        self._pending: list[Event] = []
+        # Lookups in progress, shared between concurrent batches
+        self._lookups: dict[tuple[type[Cached], int],
+                            asyncio.Future[Any]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    def submit(self, event: Event) -> None:
+        """Add an event to the current batch.
+
+        Once the batch is resolved, its events are passed to the
+        `callback` given when creating the enricher.
+
+        :param auraxium.event.Event event: The event to resolve.
+        """
+        self._pending.append(event)
+        if len(self._pending) >= self.max_batch:
+            self._schedule()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.delay, self._schedule)
+
+    async def flush(self) -> None:
+        """Resolve and deliver any pending events immediately."""
+        self._schedule()
+        if self._last is not None:
+            await self._last
+
+    async def resolve(self, events: Iterable[Event]) -> None:
+        """Resolve the referenced objects of the given events.
+
+        References that could not be resolved, such as due to a failed
+        lookup, are set to :obj:`None`.
+
+        :param events: The events to resolve.
+        :type events: collections.abc.Iterable[auraxium.event.Event]
+        """
+        events = list(events)
+        wanted: dict[type[Cached], set[int]] = {}
+        for event in events:
+            for field, type_ in self.fields.items():
+                if (id_ := self._get_id(event, field)) is not None:
+                    wanted.setdefault(type_, set()).add(id_)
+        found: dict[tuple[type[Cached], int], Any] = {}
+        waiting: list[tuple[tuple[type[Cached], int],
+                            asyncio.Future[Any]]] = []
+        lookups: list[asyncio.Task[None]] = []
+        for type_, ids in wanted.items():
+            missing: list[int] = []
+            for id_ in ids:
+                key = (type_, id_)
+                # pylint: disable=protected-access
+                if (instance := type_._cache.get(id_)) is not None:
+                    found[key] = instance
+                elif (future := self._lookups.get(key)) is not None:
+                    waiting.append((key, future))
+                else:
+                    missing.append(id_)
+            for index in range(0, len(missing), _CHUNK_SIZE):
+                chunk = missing[index:index + _CHUNK_SIZE]
+                for id_ in chunk:
+                    future = asyncio.get_running_loop().create_future()
+                    self._lookups[type_, id_] = future
+                    waiting.append(((type_, id_), future))
+                lookups.append(
+                    asyncio.create_task(self._lookup(type_, chunk)))
+        if lookups:
+            await asyncio.gather(*lookups)
+        for key, future in waiting:
+            try:
+                found[key] = await future
+            except Exception:  # pylint: disable=broad-except
+                found[key] = None
+        for event in events:
+            refs = event.refs
+            for field, type_ in self.fields.items():
+                if (id_ := self._get_id(event, field)) is not None:
+                    refs[field] = found.get((type_, id_))
+
+    async def _lookup(self, type_: type[Cached], ids: list[int]) -> None:
+        """Retrieve a list of objects by ID.
+
+        The result for each ID is set on its future in
+        :attr:`_lookups`.
+
+        :param type_: The type of object to retrieve.
+        :type type_: type[auraxium.base.Cached]
+        :param list[int] ids: The IDs of the objects.
+        """
+        query = Query(type_.collection, service_id=self._client.service_id,
+                      endpoint=self._client.endpoint)
+        query.add_term(type_.id_field, ','.join(map(str, ids)))
+        query.limit(len(ids))
+        instances: dict[int, Any] = {}
+        error: Exception | None = None
+        try:
+            payload = await self._client.request(query)
+            for data in extract_payload(payload, type_.collection):
+                instance = type_(data, client=self._client)
+                instances[instance.id] = instance
+        except Exception as err:  # pylint: disable=broad-except
+            _log.warning('Unable to resolve %s references: %s',
+                         type_.__name__, err)
+            error = err
+        for id_ in ids:
+            future = self._lookups.pop((type_, id_))
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(instances.get(id_))
+
+    def _schedule(self) -> None:
+        """Start resolving the current batch of events."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self._last = asyncio.create_task(self._deliver(batch, self._last))
+
+    async def _deliver(self, batch: list[Event],
+                       previous: asyncio.Task[None] | None) -> None:
+        """Resolve a batch of events and pass them to the call-back.
+
+        Batches are delivered in order; this waits for the previous
+        batch to be delivered first. Errors are logged rather than
+        raised, so that a failing batch or call-back does not prevent
+        the delivery of other events.
+
+        :param list[auraxium.event.Event] batch: The events to resolve.
+        :param previous: The task delivering the previous batch.
+        :type previous: asyncio.Task[None] | None
+        """
+        try:
+            await self.resolve(batch)
+        except Exception:  # pylint: disable=broad-except
+            _log.exception('Unable to resolve event references')
+        if previous is not None:
+            # Only used for ordering; failures were logged by that task
+            await asyncio.gather(previous, return_exceptions=True)
+        if self._callback is not None:
+            for event in batch:
+                try:
+                    self._callback(event)
+                except Exception:  # pylint: disable=broad-except
+                    _log.exception('Exception while delivering %s event',
+                                   event.event_name)
+
+    @staticmethod
+    def _get_id(event: Event, field: str) -> int | None:
+        """Return the ID referenced by an event field, if any.
+
+        :param auraxium.event.Event event: The event to inspect.
+        :param str field: The name of the field.
+        :return: The referenced ID, or :obj:`None` if the event does
+           not have this field or does not reference an object.
+        """
+        id_ = getattr(event, field, None)
+        if not id_:
+            return None
+        if field == 'zone_id':
+            # The upper bits identify the instance of instanced zones
+            id_ &= 0xFFFF
+        return int(id_)
@@ -0,0 +1,300 @@
+"""Throughput and latency instrumentation for the event client."""
+
+import asyncio
+import collections
+import dataclasses
+import logging
+import statistics
+import time
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any
+
+from ..models import Event
+from ._trigger import BatchTrigger, Trigger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._client import EventClient
+
+__all__ = [
+    'Metrics',
+    'MetricsSnapshot'
+]
+
+# Percentiles of the event age reported in snapshots
+_PERCENTILES = (50, 90, 99)
+
+_log = logging.getLogger('auraxium.ess')
+
+
+def _trigger_key(trigger: Trigger) -> str:
+    """Return the key used to report metrics for a trigger."""
+    return trigger.name if trigger.name is not None else repr(trigger)
+
+
+@dataclasses.dataclass(frozen=True)
+class MetricsSnapshot:
+    """The performance metrics of an event client over an interval.
+
+    Unless noted otherwise, values cover the interval since the
+    previous snapshot.
+
+    .. attribute:: timestamp
+       :type: float
+
+       The UTC timestamp the snapshot was taken at.
+
+    .. attribute:: interval
+       :type: float
+
+       The time in seconds since the previous snapshot.
+
+    .. attribute:: messages
+       :type: int
+
+       The number of messages received through the event stream,
+       including heartbeats and other non-event messages.
+
+    .. attribute:: events
+       :type: int
+
+       The number of events decoded.
+
+    .. attribute:: message_rate
+       :type: float
+
+       The number of messages received per second.
+
+    .. attribute:: event_rate
+       :type: float
+
+       The number of events decoded per second.
+
+    .. attribute:: decode_time
+       :type: float
+
+       The mean time in seconds taken to decode an event.
+
+    .. attribute:: dispatch_time
+       :type: float
+
+       The mean time in seconds taken to match an event against the
+       client's triggers and schedule their call-backs.
+
+    .. attribute:: callback_times
+       :type: dict[str, float]
+
+       The mean time in seconds from the start of a trigger's
+       call-back until its completion, keyed by trigger name.
+
+    .. attribute:: event_age
+       :type: dict[int, float]
+
+       Percentiles of the age of the events received, i.e. the
+       difference between their timestamp and the time they were
+       decoded, in seconds. Keyed by percentile.
+
+    .. attribute:: queue_depths
+       :type: dict[str, int]
+
+       The number of events currently waiting to be processed. This
+       includes the backlog and batch buffer of each trigger, keyed by
+       trigger name, as well as any events waiting for ``enrichment``
+       or ``backfill``.
+
+    .. attribute:: reconnects
+       :type: int
+
+       The total number of times any of the client's connections has
+       been re-established.
+    """
+
+    timestamp: float
+    interval: float
+    messages: int
+    events: int
+    message_rate: float
+    event_rate: float
+    decode_time: float
+    dispatch_time: float
+    callback_times: dict[str, float]
+    event_age: dict[int, float]
+    queue_depths: dict[str, int]
+    reconnects: int
+
+
+class Metrics:
+    """Performance counters of an event client.
+
+    Every :class:`~auraxium.event.EventClient` records these metrics
+    in its :attr:`~auraxium.event.EventClient.metrics` attribute. Use
+    :meth:`snapshot` to retrieve the metrics for the interval since the
+    previous snapshot, or :meth:`start` to have snapshots passed to a
+    call-back periodically:
+
+    .. code-block:: python3
+
+       def report(snapshot: event.MetricsSnapshot) -> None:
+           print(f'{snapshot.event_rate:.0f} events/s, '
+                 f'p99 age: {snapshot.event_age.get(99, 0.0):.1f} s')
+
+       client.metrics.start(report, interval=60.0)
+
+    .. attribute:: messages
+       :type: int
+
+       The total number of messages received.
+
+    .. attribute:: events
+       :type: int
+
+       The total number of events decoded.
+
+    .. attribute:: samples
+       :type: int
+
+       The maximum number of event ages to keep per interval for
+       calculating percentiles.
+    """
+
+    def __init__(self, client: 'EventClient', samples: int = 1000) -> None:
+        """Create a new set of metrics for a client.
+
+        :param auraxium.event.EventClient client: The client to report
+           on.
+        :param int samples: The maximum number of event ages to keep
+           per interval.
+        """
+        self.events: int = 0
+        self.messages: int = 0
+        self.samples: int = samples
+        self._ages: collections.deque[float] = collections.deque(
+            maxlen=samples)
+        self._callbacks: dict[str, list[float]] = {}
+        self._client = client
+        self._decode_time = 0.0
+        self._dispatch_time = 0.0
+        self._dispatched = 0
+        self._last: tuple[float, int, int] = (time.perf_counter(), 0, 0)
+        self._task: asyncio.Task[None] | None = None
+
+    def record_event(self, event: Event, decode_time: float) -> None:
+        """Record a decoded event.
+
+        :param auraxium.event.Event event: The event decoded.
+        :param float decode_time: The time in seconds taken to decode
+           the event.
+        """
+        self.events += 1
+        self._decode_time += decode_time
+        self._ages.append(time.time() - event.timestamp.timestamp())
+
+    def record_dispatch(self, duration: float) -> None:
+        """Record the dispatch of an event.
+
+        :param float duration: The time in seconds taken to dispatch
+           the event.
+        """
+        self._dispatched += 1
+        self._dispatch_time += duration
+
+    def record_callback(self, trigger: Trigger, duration: float) -> None:
+        """Record the completion of a trigger call-back.
+
+        :param Trigger trigger: The trigger the call-back belongs to.
+        :param float duration: The time in seconds the call-back ran
+           for.
+        """
+        key = _trigger_key(trigger)
+        if (totals := self._callbacks.get(key)) is None:
+            totals = self._callbacks[key] = [0, 0.0]
+        totals[0] += 1
+        totals[1] += duration
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return the metrics since the previous snapshot.
+
+        This resets the interval-based metrics.
+
+        :return: The metrics for the interval.
+        """
+        now = time.perf_counter()
+        start, messages, events = self._last
+        interval = max(now - start, 1e-9)
+        messages = self.messages - messages
+        events = self.events - events
+        ages = sorted(self._ages)
+        event_age: dict[int, float] = {}
+        if len(ages) > 1:
+            cuts = statistics.quantiles(ages, n=100, method='inclusive')
+            event_age = {p: cuts[p - 1] for p in _PERCENTILES}
+        elif ages:
+            event_age = {p: ages[0] for p in _PERCENTILES}
+        snapshot = MetricsSnapshot(
+            timestamp=time.time(), interval=interval, messages=messages,
+            events=events, message_rate=messages / interval,
+            event_rate=events / interval,
+            decode_time=self._decode_time / events if events else 0.0,
+            dispatch_time=(self._dispatch_time / self._dispatched
+                           if self._dispatched else 0.0),
+            callback_times={k: t / n for k, (n, t) in self._callbacks.items()},
+            event_age=event_age, queue_depths=self._queue_depths(),
+            reconnects=sum(c.reconnects for c in self._client.connections))
+        self._ages.clear()
+        self._callbacks.clear()
+        self._decode_time = self._dispatch_time = 0.0
+        self._dispatched = 0
+        self._last = now, self.messages, self.events
+        return snapshot
+
+    def start(self, callback: Callable[[MetricsSnapshot], Any],
+              interval: float = 60.0) -> None:
+        """Pass a snapshot to a call-back periodically.
+
+        Any previously started reporting is stopped. The call-back may
+        be a regular function or a coroutine function.
+
+        :param callback: The callable to pass each snapshot to.
+        :type callback: collections.abc.Callable[[MetricsSnapshot],
+           typing.Any]
+        :param float interval: The time in seconds between snapshots.
+        :raises ValueError: Raised if `interval` is not positive.
+        """
+        if interval <= 0.0:
+            raise ValueError(f'{interval} is not a valid interval')
+        self.stop()
+        self._task = asyncio.get_running_loop().create_task(
+            self._report(callback, interval))
+
+    def stop(self) -> None:
+        """Stop any periodic reporting started via :meth:`start`."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _queue_depths(self) -> dict[str, int]:
+        """Return the number of events waiting per processing stage."""
+        # pylint: disable=protected-access
+        client = self._client
+        depths: dict[str, int] = {}
+        for trigger in client.triggers:
+            depth = len(trigger.backlog)
+            if isinstance(trigger, BatchTrigger):
+                depth += len(trigger.buffer)
+            depths[_trigger_key(trigger)] = depth
+        if client.enricher is not None:
+            depths['enrichment'] = len(client.enricher._pending)
+        if client.backfill:
+            depths['backfill'] = sum(map(len, client._backfilling.values()))
+        return depths
+
+    async def _report(self, callback: Callable[[MetricsSnapshot], Any],
+                      interval: float) -> None:
+        """Pass a snapshot to the call-back every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                result = callback(self.snapshot())
+                if isinstance(result, Coroutine):
+                    await result
+            except Exception:  # pylint: disable=broad-except
+                _log.exception('Exception in metrics call-back')
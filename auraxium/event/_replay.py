@@ -0,0 +1,179 @@
+"""Recording and replay of raw event stream traffic."""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+import zlib
+from collections.abc import Iterator
+from types import TracebackType
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._client import EventClient
+
+__all__ = [
+    'Recorder',
+    'read_frames',
+    'replay'
+]
+
+# Number of frames to process before yielding to the event loop when
+# replaying at maximum speed
+_YIELD_INTERVAL = 100
+
+_log = logging.getLogger('auraxium.ess')
+
+
+class Recorder:
+    """Writer for recordings of raw event stream messages.
+
+    Recordings are gzip-compressed text files containing one JSON
+    object per line, with the UTC timestamp the message was received
+    at (``t``) and the message itself (``frame``). Files are opened in
+    append mode, so multiple sessions may be recorded to the same file.
+
+    Assign a recorder to
+    :attr:`EventClient.recorder <auraxium.event.EventClient.recorder>`
+    to record all messages received by the client:
+
+    .. code-block:: python3
+
+       with event.Recorder('stream.jsonl.gz') as recorder:
+           client.recorder = recorder
+           ...
+
+    Use :func:`replay` to feed a recording back into a client.
+
+    .. attribute:: frames
+       :type: int
+
+       The number of messages written by this recorder.
+
+    .. attribute:: path
+       :type: str
+
+       The path of the recording file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open a recording file for writing.
+
+        :param path: The path of the recording file. If the file
+           exists, new messages will be appended to it.
+        :type path: str | os.PathLike[str]
+        """
+        self.frames: int = 0
+        self.path: str = os.fspath(path)
+        self._file: IO[str] | None = gzip.open(
+            self.path, 'at', encoding='utf-8')
+
+    def __enter__(self) -> 'Recorder':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
+
+    def write(self, frame: str, timestamp: float | None = None) -> None:
+        """Append a message to the recording.
+
+        :param str frame: The raw message received.
+        :param timestamp: The UTC timestamp the message was received
+           at. Defaults to the current time.
+        :type timestamp: float | None
+        :raises ValueError: Raised if the recorder has been closed.
+        """
+        if self._file is None:
+            raise ValueError('Recorder has been closed')
+        if timestamp is None:
+            timestamp = time.time()
+        self._file.write(json.dumps({'t': timestamp, 'frame': frame}))
+        self._file.write('\n')
+        self.frames += 1
+
+    def flush(self) -> None:
+        """Write any buffered messages to disk.
+
+        Messages are only guaranteed to be readable after the recorder
+        has been flushed or closed.
+        """
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the recording file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_frames(path: str | os.PathLike[str]) -> Iterator[tuple[float, str]]:
+    """Iterate over the messages in a recording.
+
+    If the recording ends with an incomplete message, such as after a
+    crash during recording, it is silently skipped.
+
+    :param path: The path of the recording file.
+    :type path: str | os.PathLike[str]
+    :return: An iterator of UTC timestamps and raw messages, in the
+       order they were recorded.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as file_:
+        try:
+            for line in file_:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    _log.warning('Skipping incomplete frame in %s', path)
+                    break
+                yield float(data['t']), str(data['frame'])
+        except (EOFError, zlib.error):
+            _log.warning('Recording %s is truncated', path)
+
+
+async def replay(client: 'EventClient', path: str | os.PathLike[str],
+                 speed: float | None = 1.0) -> int:
+    """Feed a recording into an event client.
+
+    Messages are processed as if they had been received through the
+    client's websocket. The client does not need to be connected.
+
+    By default, messages are replayed in real-time, preserving the
+    delays between them. Use `speed` to scale the replay, e.g. ``2.0``
+    for twice the original rate. If `speed` is :obj:`None`, messages
+    are replayed as fast as possible; this is useful for benchmarking
+    the client's dispatch and trigger logic.
+
+    :param auraxium.event.EventClient client: The client to feed the
+       recorded messages to.
+    :param path: The path of the recording file.
+    :type path: str | os.PathLike[str]
+    :param speed: The replay speed relative to the original
+       recording, or :obj:`None` for maximum speed.
+    :type speed: float | None
+    :raises ValueError: Raised if `speed` is not a positive number.
+    :return: The number of messages replayed.
+    """
+    if speed is not None and speed <= 0.0:
+        raise ValueError(f'{speed} is not a valid replay speed')
+    # pylint: disable=protected-access
+    loop = asyncio.get_running_loop()
+    count = 0
+    start: float | None = None
+    first: float | None = None
+    for timestamp, frame in read_frames(path):
+        if speed is None:
+            if count % _YIELD_INTERVAL == 0:
+                await asyncio.sleep(0)
+        else:
+            if start is None or first is None:
+                start, first = loop.time(), timestamp
+            delay = start + (timestamp - first) / speed - loop.time()
+            await asyncio.sleep(max(delay, 0.0))
+        client._process_payload(frame)
+        count += 1
+    return count
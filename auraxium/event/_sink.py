@@ -0,0 +1,359 @@
+"""Columnar storage of events for archival and analysis."""
+
+import array
+import datetime
+import json
+import logging
+import os
+import struct
+import sys
+import time
+import zlib
+from collections.abc import Iterator, Sequence
+from types import TracebackType
+from typing import Any
+
+from ..models import Event
+from ._trigger import Trigger
+
+__all__ = [
+    'ColumnarSink',
+    'read_chunks'
+]
+
+# Chunk header: magic bytes and the length of the JSON column index
+_MAGIC = b'AXC1'
+_HEADER = struct.Struct('<4sI')
+# Array type codes for the supported field types
+_TYPECODES: dict[Any, str] = {
+    bool: 'b',
+    datetime.datetime: 'q',
+    float: 'd',
+    int: 'q'
+}
+# Size of the string lengths stored for string columns
+_LENGTH_SIZE = array.array('I').itemsize
+# Placeholder stored for missing values of nullable columns
+_NULL: dict[str, Any] = {'b': 0, 'd': 0.0, 'q': 0, 's': ''}
+
+_log = logging.getLogger('auraxium.ess')
+
+
+def _event_types() -> dict[str, type[Event]]:
+    """Return all event types, keyed by event name."""
+    return {t.__name__: t for t in Event.__subclasses__()}
+
+
+def _columns(type_: type[Event]) -> list[tuple[str, str, bool]]:
+    """Return the column layout for an event type.
+
+    :param type_: The event type to inspect.
+    :type type_: type[auraxium.event.Event]
+    :return: The name, type code and nullability of each column. A
+       type code of ``'s'`` denotes a string column.
+    """
+    columns: list[tuple[str, str, bool]] = []
+    for name, field in type_.model_fields.items():
+        annotation = field.annotation
+        args = getattr(annotation, '__args__', ())
+        nullable = type(None) in args
+        if nullable:
+            annotation = next(a for a in args if a is not type(None))
+        columns.append((name, _TYPECODES.get(annotation, 's'), nullable))
+    return columns
+
+
+def _to_little_endian(data: 'array.array[Any]') -> bytes:
+    """Return the contents of an array in little-endian byte order."""
+    if sys.byteorder != 'little':  # pragma: no cover
+        data = array.array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def _from_little_endian(typecode: str, raw: bytes) -> 'array.array[Any]':
+    """Create an array from little-endian encoded bytes."""
+    data = array.array(typecode)
+    data.frombytes(raw)
+    if sys.byteorder != 'little':  # pragma: no cover
+        data.byteswap()
+    return data
+
+
+class _Buffer:
+    """Column buffers for the events of a single type."""
+
+    def __init__(self, type_: type[Event]) -> None:
+        self.columns = _columns(type_)
+        self.rows = 0
+        self.started = time.monotonic()
+        self.values: list[array.array[Any] | list[str]] = [
+            [] if code == 's' else array.array(code)
+            for _, code, _ in self.columns]
+        self.valid: list[array.array[int] | None] = [
+            array.array('b') if nullable else None
+            for *_, nullable in self.columns]
+
+    def append(self, event: Event) -> None:
+        """Append the fields of an event to the column buffers."""
+        for index, (name, code, _) in enumerate(self.columns):
+            value = getattr(event, name)
+            if (valid := self.valid[index]) is not None:
+                valid.append(value is not None)
+                if value is None:
+                    value = _NULL[code]
+            if code == 'q' and isinstance(value, datetime.datetime):
+                value = int(value.timestamp())
+            self.values[index].append(value)  # type: ignore
+        self.rows += 1
+
+    def encode(self, event_name: str, level: int) -> bytes:
+        """Return the buffered columns as a compressed chunk."""
+        index: list[dict[str, Any]] = []
+        blobs: list[bytes] = []
+        for (name, code, _), values, valid in zip(
+                self.columns, self.values, self.valid):
+            if isinstance(values, list):
+                encoded = [v.encode('utf-8') for v in values]
+                lengths = array.array('I', map(len, encoded))
+                raw = _to_little_endian(lengths) + b''.join(encoded)
+            else:
+                raw = _to_little_endian(values)
+            if valid is not None:
+                raw = valid.tobytes() + raw
+            blob = zlib.compress(raw, level)
+            index.append({'name': name, 'type': code,
+                          'nullable': valid is not None, 'size': len(blob)})
+            blobs.append(blob)
+        header = json.dumps(
+            {'event': event_name, 'rows': self.rows, 'columns': index},
+            separators=(',', ':')).encode('utf-8')
+        return b''.join(
+            (_HEADER.pack(_MAGIC, len(header)), header, *blobs))
+
+
+class ColumnarSink:
+    """Buffer events by type and write them to disk column by column.
+
+    Rather than storing events one at a time, the sink collects the
+    field values of each event type in typed arrays, one per field.
+    Once :attr:`chunk_size` events of a type have been collected, or
+    :attr:`flush_interval` seconds have passed since the first one,
+    the columns are compressed individually and appended to the file
+    for that event type, ``<directory>/<EventName>.cols``.
+
+    Storing values of the same field together compresses far better
+    than storing whole events and allows reading only the columns
+    needed for an analysis, see :func:`read_chunks`.
+
+    Use :meth:`trigger` to feed the sink from an
+    :class:`~auraxium.event.EventClient`:
+
+    .. code-block:: python3
+
+       sink = event.ColumnarSink('archive/', events=['Death'])
+       client.add_trigger(sink.trigger())
+       ...
+       sink.close()
+
+    Timestamps are stored as UTC seconds since the UNIX epoch. The
+    interval flush is checked as events are added; call :meth:`flush`
+    or :meth:`close` to write any remaining events.
+
+    .. attribute:: chunk_size
+       :type: int
+
+       The number of events of a type to collect before writing them.
+
+    .. attribute:: directory
+       :type: str
+
+       The directory the column files are written to.
+
+    .. attribute:: events
+       :type: list[str]
+
+       The names of the event types stored by the sink.
+
+    .. attribute:: flush_interval
+       :type: float
+
+       The maximum time in seconds events are buffered for. This is
+       only checked when an event is added to the sink, so the events
+       of a type may remain buffered for longer if no other events
+       are received. Call :meth:`flush` periodically to enforce it.
+
+    .. attribute:: rows
+       :type: int
+
+       The number of events written to disk.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str],
+                 events: Sequence[str | type[Event]] | None = None,
+                 chunk_size: int = 10_000, flush_interval: float = 60.0,
+                 level: int = 6) -> None:
+        """Create a new sink.
+
+        :param directory: The directory to write the column files to.
+           It is created if it does not exist.
+        :type directory: str | os.PathLike[str]
+        :param events: The event types to store. Defaults to all event
+           types.
+        :type events: collections.abc.Sequence[str |
+           type[auraxium.event.Event]] | None
+        :param int chunk_size: The number of events of a type to
+           collect before writing them.
+        :param float flush_interval: The maximum time in seconds to
+           buffer events for.
+        :param int level: The :mod:`zlib` compression level to use.
+        :raises ValueError: Raised if an unknown event type is given,
+           or if `chunk_size` or `flush_interval` are not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'{chunk_size} is not a valid chunk size')
+        if flush_interval <= 0.0:
+            raise ValueError(f'{flush_interval} is not a valid interval')
+        known = _event_types()
+        names = list(known) if events is None else [
+            e if isinstance(e, str) else e.__name__ for e in events]
+        for name in names:
+            if name not in known:
+                raise ValueError(f'Unknown event type: {name}')
+        self.chunk_size: int = chunk_size
+        self.directory: str = os.fspath(directory)
+        self.events: list[str] = names
+        self.flush_interval: float = flush_interval
+        self.rows: int = 0
+        self._buffers: dict[str, _Buffer] = {}
+        self._level = level
+        self._types = {n: known[n] for n in names}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self) -> 'ColumnarSink':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
+
+    def add(self, event: Event) -> None:
+        """Add an event to the sink.
+
+        Events of types not stored by the sink are ignored. This may
+        write any buffers that are full or past their flush interval.
+
+        :param auraxium.event.Event event: The event to add.
+        """
+        name = type(event).__name__
+        if (type_ := self._types.get(name)) is None:
+            return
+        if (buffer := self._buffers.get(name)) is None:
+            buffer = self._buffers[name] = _Buffer(type_)
+        buffer.append(event)
+        if buffer.rows >= self.chunk_size:
+            self._write(name)
+        cutoff = time.monotonic() - self.flush_interval
+        for name in [n for n, b in self._buffers.items()
+                     if b.started <= cutoff]:
+            self._write(name)
+
+    def flush(self) -> None:
+        """Write all buffered events to disk."""
+        for name in list(self._buffers):
+            self._write(name)
+
+    def close(self) -> None:
+        """Write all buffered events to disk.
+
+        Alias of :meth:`flush`, allowing the sink to be used as a
+        context manager.
+        """
+        self.flush()
+
+    def path(self, event: str | type[Event]) -> str:
+        """Return the path of the column file for an event type.
+
+        :param event: The event type.
+        :type event: str | type[auraxium.event.Event]
+        :return: The path of the file.
+        """
+        name = event if isinstance(event, str) else event.__name__
+        return os.path.join(self.directory, f'{name}.cols')
+
+    def trigger(self, name: str | None = None) -> Trigger:
+        """Return a trigger feeding all stored event types to the sink.
+
+        :param name: The name of the trigger.
+        :type name: str | None
+        :return: A trigger for the sink's event types.
+        """
+        return Trigger(*self.events, action=self.add, name=name)
+
+    def _write(self, name: str) -> None:
+        """Write the buffered events of a type to its column file."""
+        buffer = self._buffers.pop(name)
+        chunk = buffer.encode(name, self._level)
+        with open(self.path(name), 'ab') as file_:
+            file_.write(chunk)
+        self.rows += buffer.rows
+        _log.debug('Wrote %d %s events (%d bytes)',
+                   buffer.rows, name, len(chunk))
+
+
+def read_chunks(path: str | os.PathLike[str],
+                columns: Sequence[str] | None = None
+                ) -> Iterator[dict[str, Sequence[Any]]]:
+    """Iterate over the chunks of a column file.
+
+    Each chunk is returned as a dictionary mapping column names to
+    their values. Integer, float and timestamp columns are returned as
+    :class:`array.array` instances, all others as lists. Nullable
+    columns are also returned as lists, with missing values set to
+    :obj:`None`.
+
+    :param path: The path of the column file.
+    :type path: str | os.PathLike[str]
+    :param columns: The names of the columns to read. Other columns
+       are skipped without decompressing them. Defaults to all
+       columns.
+    :type columns: collections.abc.Sequence[str] | None
+    :raises ValueError: Raised if the file is not a column file.
+    :return: An iterator over the chunks in the file.
+    """
+    with open(path, 'rb') as file_:
+        while header := file_.read(_HEADER.size):
+            magic, length = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f'{path} is not a column file')
+            index = json.loads(file_.read(length))
+            rows = int(index['rows'])
+            chunk: dict[str, Sequence[Any]] = {}
+            for column in index['columns']:
+                if columns is not None and column['name'] not in columns:
+                    file_.seek(column['size'], os.SEEK_CUR)
+                    continue
+                raw = zlib.decompress(file_.read(column['size']))
+                valid = None
+                if column['nullable']:
+                    valid, raw = raw[:rows], raw[rows:]
+                values: Sequence[Any]
+                if column['type'] == 's':
+                    offset = _LENGTH_SIZE * rows
+                    lengths = _from_little_endian('I', raw[:offset])
+                    values = []
+                    for size in lengths:
+                        values.append(
+                            raw[offset:offset + size].decode('utf-8'))
+                        offset += size
+                else:
+                    values = _from_little_endian(column['type'], raw)
+                if column['type'] == 'b' and valid is None:
+                    values = [bool(v) for v in values]
+                if valid is not None:
+                    values = [None if not ok else (
+                        bool(v) if column['type'] == 'b' else v)
+                        for v, ok in zip(values, valid)]
+                chunk[column['name']] = values
+            yield chunk
@@ -1,4 +1,7 @@
+import collections
+import dataclasses
 import datetime
+import enum
 import inspect
 import json
 import warnings
@@ -12,8 +15,115 @@ from ..ps2 import Character, World
 _EventType = type[Event] | str
 _Condition = Any | Callable[[Event], bool]
 _Action = Callable[[Event], Coroutine[Any, Any, None] | None]
+_BatchAction = Callable[[list[Event]], Coroutine[Any, Any, None] | None]
 _CharConstraint = Iterable[Character] | Iterable[int]
 _WorldConstraint = Iterable[World] | Iterable[int]
+_Job = Callable[[], Coroutine[Any, Any, None]]
+
+
+class OverflowPolicy(enum.Enum):
+    """Enumerates the ways a trigger handles a full backlog.
+
+    This only applies to triggers that limit both the number of running
+    call-backs and the number of queued call-backs.
+
+    .. attribute:: DROP_NEWEST
+
+       Discard the event that would have been added to the backlog.
+
+    .. attribute:: DROP_OLDEST
+
+       Discard the oldest event in the backlog to make room for the new
+       one.
+    """
+
+    DROP_NEWEST = 0
+    DROP_OLDEST = 1
+
+
+@dataclasses.dataclass()
+class TriggerStats:
+    """Call-back counters for an event trigger.
+
+    .. attribute:: queued
+       :type: int
+
+       The number of call-backs waiting for a free slot.
+
+    .. attribute:: running
+       :type: int
+
+       The number of call-backs currently running.
+
+    .. attribute:: completed
+       :type: int
+
+       The number of call-backs that have finished running.
+
+    .. attribute:: dropped
+       :type: int
+
+       The number of call-backs discarded due to a full backlog.
+    """
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    dropped: int = 0
+
+
+class FieldFilter:
+    """A trigger condition matching events by the value of a field.
+
+    Unlike arbitrary callables, field filters can be inspected by the
+    trigger. Where supported by the event streaming service, they are
+    used to narrow the trigger's subscription, so that fewer
+    non-matching events are sent to the client in the first place:
+
+    - ``world_id`` filters restrict the subscribed worlds
+    - ``character_id`` and ``attacker_character_id`` filters restrict
+      the subscribed characters
+    - ``experience_id`` filters replace the
+      :class:`~auraxium.event.GainExperience` event with the
+      corresponding experience ID specific events
+
+    Filters on other fields, such as ``zone_id``, are only checked
+    by the client.
+
+    .. code-block:: python3
+
+       trigger = event.Trigger(event.Death, conditions=[
+           event.FieldFilter('world_id', 17),
+           event.FieldFilter('zone_id', 2, 4)])
+
+    .. attribute:: field
+       :type: str
+
+       The name of the event field to check.
+
+    .. attribute:: values
+       :type: frozenset[int]
+
+       The accepted values of the field.
+    """
+
+    def __init__(self, field: str, value: int, *args: int) -> None:
+        """Create a new field filter.
+
+        :param str field: The name of the event field to check.
+        :param int value: An accepted value of the field.
+        :param int args: Additional accepted values.
+        """
+        self.field: str = field
+        self.values: frozenset[int] = frozenset((value, *args))
+
+    def __call__(self, event: Event) -> bool:
+        """Return whether the event matches the filter."""
+        return getattr(event, self.field, None) in self.values
+
+    def __repr__(self) -> str:
+        values = ', '.join(map(str, sorted(self.values)))
+        return f'<{self.__class__.__name__}:{self.field} in ({values})>'
 
 
 class Trigger:
@@ -35,6 +145,12 @@ class Trigger:
        The method or coroutine to run if the matching event is
        encountered.
 
+    .. attribute:: backlog
+       :type: collections.deque[collections.abc.Callable[[], typing.Coroutine[None]]]
+
+       The call-backs waiting for a free slot. Only used if
+       :attr:`max_running` is set.
+
     .. attribute:: characters
        :type: list[int]
 
@@ -61,17 +177,42 @@ class Trigger:
        last time the trigger has run. This will be :obj:`None` until
        the first run of te trigger.
 
+    .. attribute:: max_queued
+       :type: int | None
+
+       The maximum number of call-backs that may wait for a free slot.
+       If the backlog is full, :attr:`overflow` determines which event
+       is discarded. Unlimited if :obj:`None`.
+
+    .. attribute:: max_running
+       :type: int | None
+
+       The maximum number of call-backs that may run concurrently.
+       Additional call-backs are added to the :attr:`backlog` until a
+       slot frees up. Unlimited if :obj:`None`.
+
     .. attribute:: name
        :type: str
 
        The unique name of the trigger.
 
+    .. attribute:: overflow
+       :type: OverflowPolicy
+
+       The policy used when the :attr:`backlog` is full.
+
     .. attribute:: single_shot
        :type: bool
 
        If True, the trigger will be automatically removed from the
        client when it first fires.
 
+    .. attribute:: stats
+       :type: TriggerStats
+
+       Counters for the trigger's queued, running, completed and
+       dropped call-backs.
+
     .. attribute:: worlds
        :type: list[int]
 
@@ -84,7 +225,11 @@ class Trigger:
                  conditions: list[_Condition] | None = None,
                  action: _Action | None = None,
                  name: str | None = None,
-                 single_shot: bool = False) -> None:
+                 single_shot: bool = False,
+                 max_running: int | None = None,
+                 max_queued: int | None = None,
+                 overflow: OverflowPolicy = OverflowPolicy.DROP_NEWEST
+                 ) -> None:
         """Initialise a new trigger.
 
         .. seealso::
@@ -112,8 +257,23 @@ class Trigger:
         :type name: str | None
         :param bool single_shot: If true, trigger will be removed from
            any client when it first fires.
+        :param max_running: The maximum number of concurrently running
+           call-backs. Unlimited if not specified.
+        :type max_running: int | None
+        :param max_queued: The maximum number of call-backs waiting for
+           a free slot. Unlimited if not specified.
+        :type max_queued: int | None
+        :param OverflowPolicy overflow: The policy to use when the
+           backlog is full.
+        :raises ValueError: Raised if `max_running` is less than 1 or
+           `max_queued` is negative.
         """
+        if max_running is not None and max_running < 1:
+            raise ValueError(f'{max_running} is not a valid concurrency limit')
+        if max_queued is not None and max_queued < 0:
+            raise ValueError(f'{max_queued} is not a valid backlog size')
         self.action: _Action | None = action
+        self.backlog: collections.deque[_Job] = collections.deque()
         self.characters: list[int] = []
         if characters is not None:
             self.characters = [
@@ -121,8 +281,12 @@ class Trigger:
         self.conditions: list[Callable[[Event], bool]] = conditions or []
         self.events: set[_EventType] = set((event, *args))
         self.last_run: datetime.datetime | None = None
+        self.max_queued: int | None = max_queued
+        self.max_running: int | None = max_running
         self.name: str | None = name
+        self.overflow: OverflowPolicy = overflow
         self.single_shot: bool = single_shot
+        self.stats: TriggerStats = TriggerStats()
         self.worlds: list[int] = []
         if worlds is not None:
             self.worlds = [w if isinstance(w, int) else w.id for w in worlds]
@@ -192,18 +356,22 @@ class Trigger:
         return True
 
     def generate_subscription(self, logical_and: bool | None = None) -> str:
-        """Generate the appropriate subscription for this trigger."""
+        """Generate the appropriate subscription for this trigger.
+
+        Any :class:`FieldFilter` conditions supported by the event
+        streaming service are used to narrow the subscription.
+        """
+        event_names, characters, worlds = self._pushdown()
         json_data: dict[str, str | list[str]] = {
             'action': 'subscribe',
-            'eventNames': [e if isinstance(e, str) else e.__name__
-                           for e in self.events],
+            'eventNames': event_names,
             'service': 'event'}
-        if self.characters:
-            json_data['characters'] = [str(c) for c in self.characters]
+        if characters:
+            json_data['characters'] = [str(c) for c in characters]
         else:
             json_data['characters'] = ['all']
-        if self.worlds:
-            json_data['worlds'] = [str(c) for c in self.worlds]
+        if worlds:
+            json_data['worlds'] = [str(c) for c in worlds]
         else:
             json_data['worlds'] = ['all']
         if logical_and is not None:
@@ -212,15 +380,53 @@ class Trigger:
         # When subscribing to character-centric events using only a world ID,
         # set the "logicalAnd*" flag to avoid subscribing to all characters on
         # all continents (characters would default to "all" if not specified).
-        elif (self.worlds and not self.characters):
+        # Triggers filtering by both characters and worlds require both to
+        # match, so the flag also narrows their subscription.
+        elif worlds:
             char_events = [s.__name__ for s in CharacterEvent.__subclasses__()]
-            event_names = [e if isinstance(e, str) else e.__name__
-                           for e in self.events]
             if any((e.startswith('GainExperience_experience_id_')
                    or e in char_events) for e in event_names):
                 json_data['logicalAndCharactersWithWorlds'] = 'true'
         return json.dumps(json_data)
 
+    def _pushdown(self) -> tuple[list[str], list[int], list[int]]:
+        """Return the narrowest subscription matching the trigger.
+
+        This combines the trigger's events, characters and worlds with
+        any :class:`FieldFilter` conditions on fields the event
+        streaming service can filter by.
+
+        :return: The event names, characters and worlds to subscribe
+           to. Empty lists of characters or worlds mean all.
+        """
+        event_names = [e if isinstance(e, str) else e.__name__
+                       for e in self.events]
+        characters = list(self.characters)
+        worlds = list(self.worlds)
+        for condition in self.conditions:
+            if not isinstance(condition, FieldFilter):
+                continue
+            values = sorted(condition.values)
+            if condition.field == 'world_id':
+                if worlds:
+                    values = [w for w in worlds if w in condition.values]
+                # An empty intersection matches nothing; keep the
+                # explicit worlds rather than subscribing to all
+                if values:
+                    worlds = values
+            elif condition.field in ('character_id',
+                                     'attacker_character_id'):
+                # Every filter must match, so any one of them is
+                # sufficient for the subscription; use the smallest
+                if not characters or len(values) < len(characters):
+                    characters = values
+            elif (condition.field == 'experience_id'
+                  and GainExperience.__name__ in event_names):
+                event_names.remove(GainExperience.__name__)
+                event_names.extend(
+                    GainExperience.filter_experience(i) for i in values)
+        return event_names, characters, worlds
+
     async def run(self, event: Event) -> None:
         """Perform the action associated with this trigger.
 
@@ -237,3 +443,110 @@ class Trigger:
                 await ret
         except CensusError as err:  # pragma: no cover
             warnings.warn(f'Trigger {self.name} callback cancelled: {err}')
+
+
+class BatchTrigger(Trigger):
+    """An event trigger that delivers matching events in batches.
+
+    Rather than running its action once for every matching event, a
+    batch trigger collects events in an internal buffer and runs its
+    action with a list of events once the buffer is full or the batch
+    window has elapsed, whichever comes first.
+
+    This is useful for aggregating consumers such as counters or bulk
+    database inserts, as the action only runs once per batch.
+
+    .. note::
+
+       Single-shot batch triggers are removed from the client once
+       their first batch has been scheduled.
+
+    .. attribute:: action
+       :type: collections.abc.Callable[[list[auraxium.event.Event]], None] | collections.abc.Callable[[list[auraxium.event.Event]], typing.Coroutine[None]]
+
+       The method or coroutine to run with the list of buffered events
+       whenever a batch is flushed.
+
+    .. attribute:: batch_size
+       :type: int
+
+       The maximum number of events per batch. Once this many events
+       have been buffered, the batch is flushed immediately.
+
+    .. attribute:: batch_window
+       :type: float
+
+       The maximum number of seconds an event may remain in the buffer
+       before the batch is flushed. If set to zero or less, batches are
+       only flushed once they are full.
+
+    .. attribute:: buffer
+       :type: list[auraxium.event.Event]
+
+       The events buffered for the next batch.
+    """
+
+    def __init__(self, event: _EventType, *args: _EventType,
+                 batch_size: int = 100, batch_window: float = 1.0,
+                 action: _BatchAction | None = None,
+                 **kwargs: Any) -> None:
+        """Initialise a new batch trigger.
+
+        Any keyword arguments not listed here are forwarded to the
+        :class:`Trigger` initialiser.
+
+        :param event: The event type to trigger on.
+        :type event: type[Event] | str
+        :param args: Additional events to trigger on.
+        :type args: type[Event] | str
+        :param int batch_size: The maximum number of events per batch.
+        :param float batch_window: The maximum time in seconds to wait
+           before flushing a non-empty batch.
+        :param action: The method or coroutine to run with each batch.
+        :type action: collections.abc.Callable[[list[Event]], None] | collections.abc.Callable[[list[Event]], typing.Coroutine[None]]
+        :raises ValueError: Raised if `batch_size` is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError(f'{batch_size} is not a valid batch size')
+        super().__init__(event, *args, **kwargs)
+        self.action: _BatchAction | None = action  # type: ignore
+        self.batch_size: int = batch_size
+        self.batch_window: float = batch_window
+        self.buffer: list[Event] = []
+
+    def add(self, event: Event) -> bool:
+        """Add an event to the batch buffer.
+
+        :param Event event: The event to buffer.
+        :return: Whether the buffer is full and should be flushed.
+        """
+        self.buffer.append(event)
+        return len(self.buffer) >= self.batch_size
+
+    def flush(self) -> list[Event]:
+        """Return the buffered events and reset the buffer.
+
+        :return: The events buffered since the last flush, in the order
+           they were received.
+        """
+        events, self.buffer = self.buffer, []
+        return events
+
+    async def run_batch(self, events: list[Event]) -> None:
+        """Perform the action associated with this trigger.
+
+        :param events: The batch of events to pass to the trigger
+           action.
+        :type events: list[Event]
+        """
+        self.last_run = datetime.datetime.now(datetime.timezone.utc)
+        if self.action is None:  # pragma: no cover
+            warnings.warn(f'Trigger {self.name} run with no action specified')
+            return
+        try:
+            ret = self.action(events)
+            if inspect.iscoroutinefunction(self.action):
+                assert ret is not None
+                await ret
+        except CensusError as err:  # pragma: no cover
+            warnings.warn(f'Trigger {self.name} callback cancelled: {err}')
@@ -0,0 +1,347 @@
+"""Time-windowed streaming aggregations over events."""
+
+import collections
+import dataclasses
+import heapq
+import math
+import operator
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from ..models import Event
+
+__all__ = [
+    'SlidingWindow',
+    'TumblingWindow',
+    'WindowResult'
+]
+
+_KeyFunc = Callable[[Event], Hashable]
+_ValueFunc = Callable[[Event], float]
+
+
+def _getter(spec: str | Callable[[Event], Any]) -> Callable[[Event], Any]:
+    """Return a callable extracting the given field from an event.
+
+    :param spec: The name of an event attribute, or a callable
+       returning the value for a given event.
+    :type spec: str | collections.abc.Callable[[Event], typing.Any]
+    :return: A callable returning the value for a given event.
+    """
+    if isinstance(spec, str):
+        return operator.attrgetter(spec)
+    return spec
+
+
+def _top(values: dict[Hashable, Any], k: int) -> list[tuple[Hashable, Any]]:
+    """Return the `k` largest items of a dictionary by value.
+
+    :param values: The dictionary to search.
+    :type values: dict[collections.abc.Hashable, typing.Any]
+    :param int k: The number of items to return.
+    :return: Up to `k` key-value pairs, largest first.
+    """
+    return heapq.nlargest(k, values.items(), key=operator.itemgetter(1))
+
+
+@dataclasses.dataclass(frozen=True)
+class WindowResult:
+    """The aggregates of a closed tumbling window.
+
+    .. attribute:: start
+       :type: float
+
+       The UTC timestamp of the start of the window.
+
+    .. attribute:: end
+       :type: float
+
+       The UTC timestamp of the end of the window (exclusive).
+
+    .. attribute:: counts
+       :type: dict[collections.abc.Hashable, int]
+
+       The number of events per key.
+
+    .. attribute:: sums
+       :type: dict[collections.abc.Hashable, float]
+
+       The sum of the event values per key.
+    """
+
+    start: float
+    end: float
+    counts: dict[Hashable, int]
+    sums: dict[Hashable, float]
+
+    def top(self, k: int, by_sum: bool = False
+            ) -> list[tuple[Hashable, float]]:
+        """Return the keys with the highest counts or sums.
+
+        :param int k: The number of keys to return.
+        :param bool by_sum: Whether to rank keys by the sum of their
+           values rather than their event count.
+        :return: Up to `k` pairs of keys and their count or sum,
+           highest first.
+        """
+        return _top(self.sums if by_sum else self.counts, k)
+
+
+class _Window:
+    """Shared logic for keyed count and sum aggregations."""
+
+    def __init__(self, size: float, key: str | _KeyFunc,
+                 value: str | _ValueFunc | None = None) -> None:
+        if size <= 0.0:
+            raise ValueError(f'{size} is not a valid window size')
+        self.size: float = size
+        self._counts: dict[Hashable, int] = {}
+        self._key: _KeyFunc = _getter(key)
+        self._sums: dict[Hashable, float] = {}
+        self._value: _ValueFunc | None = (
+            None if value is None else _getter(value))
+
+    def __len__(self) -> int:
+        """Return the number of keys in the window."""
+        return len(self._counts)
+
+    def count(self, key: Hashable) -> int:
+        """Return the number of events for a key.
+
+        :param collections.abc.Hashable key: The key to look up.
+        :return: The number of events with this key in the window.
+        """
+        return self._counts.get(key, 0)
+
+    def sum(self, key: Hashable) -> float:
+        """Return the sum of the event values for a key.
+
+        If no `value` was specified for the window, every event has a
+        value of one.
+
+        :param collections.abc.Hashable key: The key to look up.
+        :return: The sum of the values of the events with this key in
+           the window.
+        """
+        return self._sums.get(key, 0.0)
+
+    def keys(self) -> list[Hashable]:
+        """Return all keys currently in the window."""
+        return list(self._counts)
+
+    def top(self, k: int, by_sum: bool = False
+            ) -> list[tuple[Hashable, float]]:
+        """Return the keys with the highest counts or sums.
+
+        :param int k: The number of keys to return.
+        :param bool by_sum: Whether to rank keys by the sum of their
+           values rather than their event count.
+        :return: Up to `k` pairs of keys and their count or sum,
+           highest first.
+        """
+        return _top(self._sums if by_sum else self._counts, k)
+
+    def _extract(self, event: Event) -> tuple[Hashable, float]:
+        """Return the key and value of an event."""
+        value = 1.0 if self._value is None else float(self._value(event))
+        return self._key(event), value
+
+
+class SlidingWindow(_Window):
+    """A continuously moving time window over an event stream.
+
+    Events are grouped by a key, such as the character or weapon ID,
+    and counted and summed over the last :attr:`size` seconds. Use an
+    instance's :meth:`add` method as a trigger action to feed it:
+
+    .. code-block:: python3
+
+       # Kills per attacker over the last 5 minutes
+       kills = event.SlidingWindow(300.0, key='attacker_character_id')
+       client.add_trigger(event.Trigger(event.Death, action=kills.add))
+
+       ...
+       kpm = kills.count(character_id) / 5.0
+
+    Events are kept in a ring buffer in arrival order, so expiring old
+    events takes constant time per event. Events are timed by their
+    :attr:`~auraxium.event.Event.timestamp` and are expected to arrive
+    roughly in order.
+
+    .. attribute:: size
+       :type: float
+
+       The length of the window in seconds.
+    """
+
+    def __init__(self, size: float, key: str | _KeyFunc,
+                 value: str | _ValueFunc | None = None) -> None:
+        """Create a new, empty sliding window.
+
+        :param float size: The length of the window in seconds.
+        :param key: The event attribute to group events by, or a
+           callable returning the key for a given event.
+        :type key: str | collections.abc.Callable[[Event],
+           collections.abc.Hashable]
+        :param value: The event attribute to sum, or a callable
+           returning the value for a given event. If not set, each
+           event has a value of one.
+        :type value: str | collections.abc.Callable[[Event], float] | None
+        :raises ValueError: Raised if `size` is not positive.
+        """
+        super().__init__(size, key, value)
+        self._buffer: collections.deque[tuple[float, Hashable, float]] = (
+            collections.deque())
+        self._latest: float = -math.inf
+
+    def add(self, event: Event) -> None:
+        """Add an event to the window.
+
+        This also expires any events that have moved out of the
+        window.
+
+        :param auraxium.event.Event event: The event to add.
+        """
+        timestamp = event.timestamp.timestamp()
+        key, value = self._extract(event)
+        self._buffer.append((timestamp, key, value))
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._sums[key] = self._sums.get(key, 0.0) + value
+        self.expire(timestamp)
+
+    def expire(self, now: float | None = None) -> None:
+        """Remove any events that are older than the window.
+
+        This is done automatically when adding events; call it
+        manually to update the window when no events are received.
+
+        :param now: The current UTC timestamp. Defaults to the newest
+           event timestamp seen.
+        :type now: float | None
+        """
+        if now is not None:
+            self._latest = max(self._latest, now)
+        cutoff = self._latest - self.size
+        buffer = self._buffer
+        counts, sums = self._counts, self._sums
+        while buffer and buffer[0][0] <= cutoff:
+            _, key, value = buffer.popleft()
+            if counts[key] == 1:
+                del counts[key]
+                del sums[key]
+            else:
+                counts[key] -= 1
+                sums[key] -= value
+
+    def rate(self, key: Hashable) -> float:
+        """Return the number of events per second for a key.
+
+        :param collections.abc.Hashable key: The key to look up.
+        :return: The event count of the key divided by the window size.
+        """
+        return self.count(key) / self.size
+
+
+class TumblingWindow(_Window):
+    """A series of fixed, non-overlapping time windows.
+
+    Windows are aligned to multiples of :attr:`size` seconds since the
+    UNIX epoch. Once an event for a later window is added, the current
+    window is closed and its aggregates are passed to the `on_close`
+    call-back as a :class:`WindowResult`.
+
+    .. code-block:: python3
+
+       def on_close(result: event.WindowResult) -> None:
+           print('Most XP this hour:', result.top(10, by_sum=True))
+
+       xp = event.TumblingWindow(3600.0, key='character_id',
+                                 value='amount', on_close=on_close)
+       client.add_trigger(event.Trigger(event.GainExperience,
+                                        action=xp.add))
+
+    .. attribute:: late
+       :type: int
+
+       The number of events discarded because their window had already
+       been closed.
+
+    .. attribute:: size
+       :type: float
+
+       The length of each window in seconds.
+
+    .. attribute:: start
+       :type: float | None
+
+       The UTC timestamp of the start of the current window, or
+       :obj:`None` if no event has been added yet.
+    """
+
+    def __init__(self, size: float, key: str | _KeyFunc,
+                 value: str | _ValueFunc | None = None,
+                 on_close: Callable[[WindowResult], None] | None = None
+                 ) -> None:
+        """Create a new tumbling window.
+
+        :param float size: The length of each window in seconds.
+        :param key: The event attribute to group events by, or a
+           callable returning the key for a given event.
+        :type key: str | collections.abc.Callable[[Event],
+           collections.abc.Hashable]
+        :param value: The event attribute to sum, or a callable
+           returning the value for a given event. If not set, each
+           event has a value of one.
+        :type value: str | collections.abc.Callable[[Event], float] | None
+        :param on_close: A callable receiving the aggregates of each
+           window once it is closed.
+        :type on_close: collections.abc.Callable[[WindowResult], None]
+           | None
+        :raises ValueError: Raised if `size` is not positive.
+        """
+        super().__init__(size, key, value)
+        self.late: int = 0
+        self.start: float | None = None
+        self._closed: float = -math.inf
+        self._on_close = on_close
+
+    def add(self, event: Event) -> None:
+        """Add an event to its window.
+
+        If the event belongs to a later window than the current one,
+        the current window is closed first.
+
+        :param auraxium.event.Event event: The event to add.
+        """
+        timestamp = event.timestamp.timestamp()
+        start = math.floor(timestamp / self.size) * self.size
+        if start < self._closed or (
+                self.start is not None and start < self.start):
+            self.late += 1
+            return
+        if self.start is not None and start > self.start:
+            self.flush()
+        self.start = start
+        key, value = self._extract(event)
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def flush(self) -> WindowResult | None:
+        """Close the current window.
+
+        The aggregates of the window are passed to the `on_close`
+        call-back, if any, and returned.
+
+        :return: The aggregates of the closed window, or :obj:`None` if
+           no window was open.
+        """
+        if self.start is None:
+            return None
+        result = WindowResult(self.start, self.start + self.size,
+                              self._counts, self._sums)
+        self._closed = result.end
+        self._counts, self._sums = {}, {}
+        self.start = None
+        if self._on_close is not None:
+            self._on_close(result)
+        return result
@@ -2,14 +2,12 @@
 
 import abc
 import datetime
-from typing import Any, TypeVar
+from typing import Any
 
 import pydantic
 
 from ..types import CensusData
 
-_T = TypeVar('_T')
-
 
 class Payload(pydantic.BaseModel):
     """A payload received through the REST or WebSocket interface.
@@ -27,26 +25,26 @@ class RESTPayload(Payload):
     :obj:`None`.
     """
 
-    @pydantic.field_validator('*', mode='before')
+    @pydantic.model_validator(mode='before')
     @classmethod
-    def _convert_null(cls, value: _T,
-                      info: Any,
-                      ) -> _T | None:
+    def _convert_null(cls, data: Any) -> Any:
         """Replace any "NULL" string inputs with :obj:`None`.
 
-        This is a pre-validator; it is run before any other validation
-        or conversion takes place.
+        This is a pre-validator; it is run once per payload before any
+        other validation or conversion takes place.
 
         By default, the API will omit any NULL fields in the
         response unless the ``c:includeNull`` flag is set. In Python,
         a missing value is instead :obj:`None`. This also ensures that
         optional values can be type-hinted with :obj:`X | None` without
         risk of errors.
+
+        Nested payloads are handled by their own model's validator.
         """
-        _ = cls, info
-        if value == 'NULL':
-            return None
-        return value
+        _ = cls
+        if isinstance(data, dict) and 'NULL' in data.values():
+            return {k: None if v == 'NULL' else v for k, v in data.items()}
+        return data
 
 
 class FallbackMixin(metaclass=abc.ABCMeta):
@@ -62,6 +60,8 @@ class FallbackMixin(metaclass=abc.ABCMeta):
     provided for a given `id_`, a :exc:`KeyError` should be raised.
     """
 
+    __slots__ = ()
+
     @staticmethod
     @abc.abstractmethod
     def fallback_hook(id_: int) -> CensusData:
@@ -128,6 +128,10 @@ class Event(Payload):
        endpoint broadcast the event.
     """
 
+    # Holds the resolved references, see refs. This is a slot rather than
+    # a private attribute as those add to the cost of every instantiation.
+    __slots__ = ('_refs',)
+
     event_name: str
     timestamp: datetime.datetime
     world_id: int
@@ -147,6 +151,22 @@ class Event(Payload):
         now = datetime.datetime.now(datetime.timezone.utc)
         return (now - self.timestamp).total_seconds()
 
+    @property
+    def refs(self) -> dict[str, Any]:
+        """The objects referenced by the event, keyed by field name.
+
+        This is only populated for events resolved by an
+        :class:`~auraxium.event.Enricher`. References that could not be
+        resolved are :obj:`None`.
+        """
+        try:
+            return self._refs
+        except AttributeError:
+            # The dictionary is only created when first needed
+            refs: dict[str, Any] = {}
+            object.__setattr__(self, '_refs', refs)
+            return refs
+
 
 class CharacterEvent:
     """Mixin class for character-centric events.
@@ -1,7 +1,6 @@
 """Ability and ability type class definitions."""
 
 from ..base import Cached
-from ..census import Query
 from ..collections import AbilityData, AbilityTypeData, ResourceTypeData
 from .._proxy import InstanceProxy
 
@@ -39,6 +38,8 @@ class ResourceType(Cached, cache_size=50, cache_ttu=3600.0):
        ``Esamir.Storm.VehicleOverload``.
     """
 
+    __slots__ = ()
+
     collection = 'resource_type'
     data: ResourceTypeData
     id_field = 'resource_type_id'
@@ -97,6 +98,8 @@ class AbilityType(Cached, cache_size=20, cache_ttu=60.0):
           As of April 2021, none of the string fields are used.
     """
 
+    __slots__ = ()
+
     collection = 'ability_type'
     data: AbilityTypeData
     id_field = 'ability_type_id'
@@ -267,6 +270,8 @@ class Ability(Cached, cache_size=10, cache_ttu=60.0):
           As of April 2021, none of the string fields are used.
     """
 
+    __slots__ = ()
+
     collection = 'ability'
     data: AbilityData
     id_field = 'ability_id'
@@ -310,18 +315,12 @@ class Ability(Cached, cache_size=10, cache_ttu=60.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         type_id = self.data.resource_type_id or -1
-        query = Query(
-            ResourceType.collection, service_id=self._client.service_id)
-        query.add_term(field=ResourceType.id_field, value=type_id)
-        return InstanceProxy(ResourceType, query, client=self._client)
+        return InstanceProxy.by_id(ResourceType, type_id, client=self._client)
 
     def type(self) -> InstanceProxy[AbilityType]:
         """Return the ability type of this ability.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            AbilityType.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=AbilityType.id_field, value=self.data.ability_type_id)
-        return InstanceProxy(AbilityType, query, client=self._client)
+        return InstanceProxy.by_id(
+            AbilityType, self.data.ability_type_id, client=self._client)
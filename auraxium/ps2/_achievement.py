@@ -4,9 +4,7 @@ Achievements include weapon medals and service ribbons.
 """
 
 from ..base import ImageMixin, Named
-from ..census import Query
 from ..collections import AchievementData
-from .._rest import extract_payload
 from .._proxy import InstanceProxy
 from ..types import LocaleData
 
@@ -98,6 +96,8 @@ class Achievement(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'achievement'
     data: AchievementData
     id_field = 'achievement_id'
@@ -117,13 +117,8 @@ class Achievement(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
 
     async def objectives(self) -> list[Objective]:
         """Return any objectives in the given objective group."""
-        query = Query(
-            Objective.collection, service_id=self._client.service_id,
-            objective_group_id=self.objective_group_id)
-        query.limit(1000)
-        data = await self._client.request(query)
-        payload = extract_payload(data, Objective.collection)
-        return [Objective(o, client=self._client) for o in payload]
+        return await Objective.get_by_objective_group(
+            self.objective_group_id, client=self._client).flatten()
 
     def reward(self) -> InstanceProxy[Reward]:
         """Return the reward tied to this achievement.
@@ -131,6 +126,5 @@ class Achievement(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         assert self.data.reward_id is not None
-        query = Query(Reward.collection, service_id=self._client.service_id)
-        query.add_term(field=Reward.id_field, value=self.data.reward_id)
-        return InstanceProxy(Reward, query, client=self._client)
+        return InstanceProxy.by_id(
+            Reward, self.data.reward_id, client=self._client)
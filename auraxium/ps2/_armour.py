@@ -105,6 +105,8 @@ class ArmourInfo(Cached, cache_size=100, cache_ttu=60.0):
        is used for.
     """
 
+    __slots__ = ()
+
     collection = 'armor_info'
     data: ArmourInfoData
     id_field = 'armor_info_id'
@@ -1,11 +1,12 @@
 """Character class definition."""
 
+import functools
 import logging
 from typing import Any, ClassVar, Final, cast
 
 from ..base import Named
 from .._cache import TLRUCache
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import (CharacterAchievement, CharacterBattleRankData,
                            CharacterCertsData, CharacterData,
                            CharacterDirective, CharacterDirectiveObjective,
@@ -29,6 +30,49 @@ __all__ = [
 log = logging.getLogger('auraxium.ps2')
 
 
+@functools.lru_cache(maxsize=16)
+def _items_query(results: int) -> PreparedQuery:
+    """Return the prepared query used by :meth:`Character.items`."""
+    query = Query('characters_item').limit(results)
+    query.create_join(Item.collection).set_fields(Item.id_field)
+    return PreparedQuery(query, id='character_id')
+
+
+@functools.cache
+def _currency_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Character.currency`."""
+    return PreparedQuery(Query('characters_currency'), id='character_id')
+
+
+@functools.cache
+def _friends_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Character.friends`."""
+    query = Query('characters_friend')
+    query.create_join(Character.collection).set_list(True)
+    return PreparedQuery(query, id='character_id')
+
+
+@functools.cache
+def _online_status_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Character.online_status`."""
+    query = Query('characters_online_status')
+    return PreparedQuery(query, id='character_id')
+
+
+@functools.cache
+def _outfit_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Character.outfit`."""
+    return PreparedQuery(Query('outfit_member_extended'), id='character_id')
+
+
+@functools.cache
+def _world_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Character.world`."""
+    query = Query('characters_world')
+    query.create_join(World.collection).set_fields('world_id')
+    return PreparedQuery(query, id='character_id')
+
+
 # Monkey-patch the pydantic-generated CharacterNameData to inject a sensible
 # __str__ implementation.
 CharacterNameData.__str__ = lambda self: self.first or ''  # type: ignore
@@ -50,6 +94,8 @@ class Title(Named, cache_size=300, cache_ttu=300.0):
        English locale.
     """
 
+    __slots__ = ()
+
     collection = 'title'
     data: TitleData
     id_field = 'title_id'
@@ -147,6 +193,8 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
        The prestige (or A.S.P.) rank for the character.
     """
 
+    __slots__ = ()
+
     _cache: ClassVar[TLRUCache[int | str, 'Character']]
     collection = 'character'
     data: CharacterData
@@ -195,8 +243,7 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
         of this module.
         """
         collection: Final[str] = 'characters_currency'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
+        query = _currency_query().bind(id=self.id)
         payload = await self._client.request(query)
         data = extract_single(payload, collection)
         return int(str(data['quantity'])), int(str(data['prestige_currency']))
@@ -341,9 +388,8 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         assert self.data.faction_id is not None
-        query = Query(Faction.collection, service_id=self._client.service_id)
-        query.add_term(field=Faction.id_field, value=self.data.faction_id)
-        return InstanceProxy(Faction, query, client=self._client)
+        return InstanceProxy.by_id(
+            Faction, self.data.faction_id, client=self._client)
 
     async def friends(self) -> list['Character']:
         """Return the friends list of the character."""
@@ -353,11 +399,8 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
         # This is solved through a second query matching the IDs, though this
         # does slow this query down dramatically.
         collection: Final[str] = 'characters_friend'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=Character.id_field, value=self.id)
-        join = query.create_join(self.collection)
-        join.set_list(True)
-        payload = await self._client.request(query)
+        payload = await self._client.request(
+            _friends_query().bind(id=self.id))
         data = extract_single(payload, collection)
         character_ids: list[str] = [
             str(d['character_id'])
@@ -367,7 +410,7 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
                       character_id=','.join(character_ids))
         payload = await self._client.request(query)
         friends_data = extract_payload(payload, self.collection)
-        return [Character(d, client=self._client) for d in friends_data]
+        return Character.from_payloads(friends_data, client=self._client)
 
     @classmethod
     async def get_online(cls, id_: int, *args: int, client: RequestClient
@@ -389,12 +432,7 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'characters_item'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(results)
-        join = query.create_join(Item.collection)
-        join.set_fields(Item.id_field)
+        query = _items_query(results).bind(id=self.id)
         return SequenceProxy(Item, query, client=self._client)
 
     async def is_online(self) -> bool:
@@ -422,8 +460,7 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
         the server they are logged into.
         """
         collection: Final[str] = 'characters_online_status'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
+        query = _online_status_query().bind(id=self.id)
         payload = await self._client.request(query)
         data = extract_single(payload, collection)
         return int(str(data['online_status']))
@@ -433,9 +470,7 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        collection: Final[str] = 'outfit_member_extended'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
+        query = _outfit_query().bind(id=self.id)
         return InstanceProxy(Outfit, query, client=self._client)
 
     def outfit_member(self) -> InstanceProxy[OutfitMember]:
@@ -443,10 +478,7 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            OutfitMember.collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        return InstanceProxy(OutfitMember, query, client=self._client)
+        return InstanceProxy.by_id(OutfitMember, self.id, client=self._client)
 
     def profile(self) -> InstanceProxy[Profile]:
         """Return the last played profile of the character.
@@ -454,9 +486,8 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         assert self.data.profile_id is not None
-        query = Query(Profile.collection, service_id=self._client.service_id)
-        query.add_term(field=Profile.id_field, value=self.data.profile_id)
-        return InstanceProxy(Profile, query, client=self._client)
+        return InstanceProxy.by_id(
+            Profile, self.data.profile_id, client=self._client)
 
     async def skill(self, results: int = 1, **kwargs: Any) -> list[CensusData]:
         """Return skills unlocked by the player.
@@ -582,18 +613,12 @@ class Character(Named, cache_size=256, cache_ttu=30.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         title_id = self.data.title_id or -1
-        query = Query(Title.collection, service_id=self._client.service_id)
-        query.add_term(field=Title.id_field, value=title_id)
-        return InstanceProxy(Title, query, client=self._client)
+        return InstanceProxy.by_id(Title, title_id, client=self._client)
 
     def world(self) -> InstanceProxy[World]:
         """Return the world of the character.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        collection: Final[str] = 'characters_world'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        join = query.create_join(World.collection)
-        join.set_fields('world_id')
+        query = _world_query().bind(id=self.id)
         return InstanceProxy(World, query, client=self._client)
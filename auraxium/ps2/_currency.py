@@ -43,6 +43,8 @@ class Currency(Cached, cache_size=10, cache_ttu=3600.0):
        The maximum amount of this currency a character may hold.
     """
 
+    __slots__ = ()
+
     collection = 'currency'
     data: CurrencyData
     id_field = 'currency_id'
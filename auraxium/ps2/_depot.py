@@ -1,9 +1,10 @@
 """Bundles and special offer class definitions."""
 
+import functools
 from typing import Final
 
 from ..base import Named, Cached
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..endpoints import DBG_FILES
 from ..collections import MarketingBundleData, MarketingBundleSingleData
 from .._proxy import InstanceProxy
@@ -18,6 +19,14 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _items_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`MarketingBundle.items`."""
+    query = Query('marketing_bundle_item').limit(100)
+    query.create_join(Item.collection).set_fields(Item.id_field)
+    return PreparedQuery(query, id=MarketingBundle.id_field)
+
+
 class MarketingBundle(Named, cache_size=100, cache_ttu=60.0):
     """A marketing bundle containing multiple items.
 
@@ -63,6 +72,8 @@ class MarketingBundle(Named, cache_size=100, cache_ttu=60.0):
        timestamp.
     """
 
+    __slots__ = ()
+
     collection = 'marketing_bundle'
     data: MarketingBundleData
     id_field = 'marketing_bundle_id'
@@ -89,11 +100,7 @@ class MarketingBundle(Named, cache_size=100, cache_ttu=60.0):
         quantity awarded.
         """
         collection: Final[str] = 'marketing_bundle_item'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(100)
-        join = query.create_join(Item.collection)
-        join.set_fields(Item.id_field)
+        query = _items_query().bind(id=self.id)
         payload = await self._client.request(query)
         data = extract_payload(payload, collection)
         key_name = f'{Item.id_field}_join_{Item.collection}'
@@ -149,6 +156,8 @@ class MarketingBundleSingle(Cached, cache_size=100, cache_ttu=60.0):
        timestamp.
     """
 
+    __slots__ = ()
+
     collection = 'marketing_bundle_with_1_item'
     data: MarketingBundleSingleData
     id_field = 'marketing_bundle_id'
@@ -168,6 +177,5 @@ class MarketingBundleSingle(Cached, cache_size=100, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Item.collection, service_id=self._client.service_id)
-        query.add_term(field=Item.id_field, value=self.data.item_id)
-        return InstanceProxy(Item, query, client=self._client)
+        return InstanceProxy.by_id(
+            Item, self.data.item_id, client=self._client)
@@ -1,7 +1,9 @@
 """Directive class definitions."""
 
+import functools
+
 from ..base import ImageMixin, Named
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import (DirectiveData, DirectiveTierData,
                       DirectiveTreeCategoryData, DirectiveTreeData)
 from .._proxy import InstanceProxy, SequenceProxy
@@ -18,6 +20,34 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _trees_query() -> PreparedQuery:
+    """Return the query used by :meth:`DirectiveTreeCategory.trees`."""
+    query = Query(DirectiveTree.collection).limit(50)
+    return PreparedQuery(query, id='directive_tree_id')
+
+
+@functools.cache
+def _tree_directives_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`DirectiveTree.directives`."""
+    query = Query(Directive.collection).limit(400)
+    return PreparedQuery(query, id='directive_tree_id')
+
+
+@functools.cache
+def _tiers_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`DirectiveTree.tiers`."""
+    query = Query(DirectiveTier.collection).limit(4)
+    return PreparedQuery(query, id='directive_tree_id')
+
+
+@functools.cache
+def _tier_directives_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`DirectiveTier.directives`."""
+    query = Query(Directive.collection).limit(100)
+    return PreparedQuery(query, id='directive_tier_id')
+
+
 class DirectiveTreeCategory(Named, cache_size=10, cache_ttu=300.0):
     """A category of directive.
 
@@ -36,6 +66,8 @@ class DirectiveTreeCategory(Named, cache_size=10, cache_ttu=300.0):
        The localised name of the directive tree category.
     """
 
+    __slots__ = ()
+
     collection = 'directive_tree_category'
     data: DirectiveTreeCategoryData
     id_field = 'directive_tree_category_id'
@@ -50,9 +82,7 @@ class DirectiveTreeCategory(Named, cache_size=10, cache_ttu=300.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(
-            DirectiveTree.collection, service_id=self._client.service_id)
-        query.add_term(field='directive_tree_id', value=self.id).limit(50)
+        query = _trees_query().bind(id=self.id)
         return SequenceProxy(DirectiveTree, query, client=self._client)
 
 
@@ -106,6 +136,8 @@ class DirectiveTree(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'directive_tree'
     data: DirectiveTreeData
     id_field = 'directive_tree_id'
@@ -125,19 +157,16 @@ class DirectiveTree(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(DirectiveTreeCategory.collection,
-                      service_id=self._client.service_id)
-        query.add_term(field=DirectiveTreeCategory.id_field,
-                       value=self.data.directive_tree_category_id)
-        return InstanceProxy(DirectiveTreeCategory, query, client=self._client)
+        return InstanceProxy.by_id(
+            DirectiveTreeCategory, self.data.directive_tree_category_id,
+            client=self._client)
 
     def directives(self) -> SequenceProxy['Directive']:
         """Return the list of directives in this category.
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(Directive.collection, service_id=self._client.service_id)
-        query.add_term(field='directive_tree_id', value=self.id).limit(400)
+        query = _tree_directives_query().bind(id=self.id)
         return SequenceProxy(Directive, query, client=self._client)
 
     def tiers(self) -> SequenceProxy['DirectiveTier']:
@@ -145,9 +174,7 @@ class DirectiveTree(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(
-            DirectiveTier.collection, service_id=self._client.service_id)
-        query.add_term(field='directive_tree_id', value=self.id).limit(4)
+        query = _tiers_query().bind(id=self.id)
         return SequenceProxy(DirectiveTier, query, client=self._client)
 
 
@@ -219,6 +246,8 @@ class DirectiveTier(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'directive_tier'
     data: DirectiveTierData
     id_field = 'directive_tier_id'
@@ -240,8 +269,7 @@ class DirectiveTier(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(Directive.collection, service_id=self._client.service_id)
-        query.add_term(field='directive_tier_id', value=self.id).limit(100)
+        query = _tier_directives_query().bind(id=self.id)
         return SequenceProxy(Directive, query, client=self._client)
 
     async def rewards(self) -> list[Reward]:
@@ -256,11 +284,8 @@ class DirectiveTier(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            DirectiveTree.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=DirectiveTree.id_field, value=self.data.directive_tree_id)
-        return InstanceProxy(DirectiveTree, query, client=self._client)
+        return InstanceProxy.by_id(
+            DirectiveTree, self.data.directive_tree_id, client=self._client)
 
 
 class Directive(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
@@ -333,6 +358,8 @@ class Directive(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'directive'
     data: DirectiveData
     id_field = 'directive_id'
@@ -363,19 +390,13 @@ class Directive(Named, ImageMixin, cache_size=30, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            DirectiveTier.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=DirectiveTier.id_field, value=self.data.directive_tier_id)
-        return InstanceProxy(DirectiveTier, query, client=self._client)
+        return InstanceProxy.by_id(
+            DirectiveTier, self.data.directive_tier_id, client=self._client)
 
     def tree(self) -> InstanceProxy[DirectiveTree]:
         """Return the tree of the directive.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            DirectiveTree.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=DirectiveTree.id_field, value=self.data.directive_tree_id)
-        return InstanceProxy(DirectiveTree, query, client=self._client)
+        return InstanceProxy.by_id(
+            DirectiveTree, self.data.directive_tree_id, client=self._client)
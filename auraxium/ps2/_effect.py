@@ -2,7 +2,6 @@
 
 import enum
 from ..base import Cached
-from ..census import Query
 from ..collections import (EffectData, EffectTypeData, ZoneEffectData,
                       ZoneEffectTypeData)
 from .._proxy import InstanceProxy
@@ -71,6 +70,8 @@ class EffectType(Cached, cache_size=20, cache_ttu=60.0):
        effects of this type.
     """
 
+    __slots__ = ()
+
     collection = 'effect_type'
     data: EffectTypeData
     id_field = 'effect_type_id'
@@ -177,6 +178,8 @@ class Effect(Cached, cache_size=10, cache_ttu=60.0):
        corresponding :class:`EffectType` for details.
     """
 
+    __slots__ = ()
+
     collection = 'effect'
     data: EffectData
     id_field = 'effect_id'
@@ -209,10 +212,8 @@ class Effect(Cached, cache_size=10, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(ResistType.collection,
-                      service_id=self._client.service_id)
-        query.add_term(field=ResistType.id_field, value=self.resist_type_id)
-        return InstanceProxy(ResistType, query, client=self._client)
+        return InstanceProxy.by_id(
+            ResistType, self.resist_type_id, client=self._client)
 
     def target_type(self) -> TargetType | None:
         """Return the target type of this effect."""
@@ -222,11 +223,8 @@ class Effect(Cached, cache_size=10, cache_ttu=60.0):
 
     def type(self) -> InstanceProxy[EffectType]:
         """Return the effect type of this effect."""
-        query = Query(
-            EffectType.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=EffectType.id_field, value=self._client.service_id)
-        return InstanceProxy(EffectType, query, client=self._client)
+        return InstanceProxy.by_id(
+            EffectType, self.data.effect_type_id, client=self._client)
 
 
 class ZoneEffectType(Cached, cache_size=20, cache_ttu=60.0):
@@ -255,6 +253,8 @@ class ZoneEffectType(Cached, cache_size=20, cache_ttu=60.0):
        zone effects of this type.
     """
 
+    __slots__ = ()
+
     collection = 'zone_effect_type'
     data: ZoneEffectTypeData
     id_field = 'zone_effect_type_id'
@@ -334,6 +334,8 @@ class ZoneEffect(Cached, cache_size=10, cache_ttu=60.0):
        corresponding :class:`ZoneEffectType` for details.
     """
 
+    __slots__ = ()
+
     collection = 'zone_effect'
     data: ZoneEffectData
     id_field = 'zone_effect_id'
@@ -352,14 +354,10 @@ class ZoneEffect(Cached, cache_size=10, cache_ttu=60.0):
 
     def ability(self) -> InstanceProxy[Ability]:
         """Return the ability associated with this zone effect."""
-        query = Query(Ability.collection, service_id=self._client.service_id)
-        query.add_term(field=Ability.id_field, value=self.data.ability_id)
-        return InstanceProxy(Ability, query, client=self._client)
+        return InstanceProxy.by_id(
+            Ability, self.data.ability_id, client=self._client)
 
     def type(self) -> InstanceProxy[ZoneEffectType]:
         """Return the type of this zone effect."""
-        query = Query(
-            ZoneEffectType.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=ZoneEffectType.id_field, value=self.data.zone_effect_type_id)
-        return InstanceProxy(ZoneEffectType, query, client=self._client)
+        return InstanceProxy.by_id(
+            ZoneEffectType, self.data.zone_effect_type_id, client=self._client)
@@ -6,7 +6,6 @@ from typing import Any, cast
 import pydantic
 
 from ..base import Cached
-from ..census import Query
 from ..endpoints import DBG_FILES
 from ..errors import PayloadError
 from ..collections import (ExperienceAwardTypeData, ExperienceData,
@@ -58,6 +57,8 @@ class Experience(Cached, cache_size=100, cache_ttu=3600.0):
        The amount of experience points awarded.
     """
 
+    __slots__ = ()
+
     collection = 'experience'
     data: ExperienceData
     id_field = 'experience_id'
@@ -75,9 +76,8 @@ class Experience(Cached, cache_size=100, cache_ttu=3600.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         value = self.data.experience_award_type_id or -1
-        query = Query(ExperienceAwardType.collection, self._client.service_id)
-        query.add_term(field=ExperienceAwardType.id_field, value=value)
-        return InstanceProxy(ExperienceAwardType, query, client=self._client)
+        return InstanceProxy.by_id(
+            ExperienceAwardType, value, client=self._client)
 
 
 class ExperienceAwardType(Cached, cache_size=100, cache_ttu=3600.0):
@@ -96,6 +96,8 @@ class ExperienceAwardType(Cached, cache_size=100, cache_ttu=3600.0):
        designed to be user-facing.
     """
 
+    __slots__ = ()
+
     collection = 'experience_award_type'
     data: ExperienceAwardTypeData
     id_field = 'experience_award_type_id'
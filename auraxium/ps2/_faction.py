@@ -54,6 +54,8 @@ class Faction(Named, ImageMixin, cache_size=10):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'faction'
     data: FactionData
     id_field = 'faction_id'
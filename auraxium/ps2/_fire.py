@@ -1,10 +1,11 @@
 """Fire modes and group class definitions."""
 
 import enum
+import functools
 from typing import Any, Final, cast
 
 from ..base import Cached
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import FireGroupData, FireModeData
 from .._proxy import InstanceProxy, SequenceProxy
 from .._rest import extract_payload
@@ -20,6 +21,29 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _state_groups_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`FireMode.state_groups`."""
+    query = Query('player_state_group_2').limit(10)
+    return PreparedQuery(query, id='player_state_group_id')
+
+
+@functools.cache
+def _projectile_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`FireMode.projectile`."""
+    query = Query('fire_mode_to_projectile')
+    query.create_join(Projectile.collection).set_fields(Projectile.id_field)
+    return PreparedQuery(query, id=FireMode.id_field)
+
+
+@functools.cache
+def _fire_modes_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`FireGroup.fire_modes`."""
+    query = Query('fire_group_to_fire_mode').limit(20)
+    query.create_join(FireMode.collection).set_fields(FireMode.id_field)
+    return PreparedQuery(query, id=FireGroup.id_field)
+
+
 class FireModeType(enum.IntEnum):
     """Specifies the type of action taken when a weapon is fired.
 
@@ -742,6 +766,8 @@ class FireMode(Cached, cache_size=10, cache_ttu=3600.0):
        Localised description of the fire mode (e.g. "Automatic").
     """
 
+    __slots__ = ()
+
     collection = 'fire_mode_2'
     data: FireModeData
     id_field = 'fire_mode_id'
@@ -846,10 +872,8 @@ class FireMode(Cached, cache_size=10, cache_ttu=3600.0):
     async def state_groups(self) -> dict[PlayerState, PlayerStateGroup]:
         """Return the state-specific data for a fire mode."""
         collection: Final[str] = 'player_state_group_2'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field='player_state_group_id',
-                       value=self.data.player_state_group_id)
-        query.limit(10)
+        query = _state_groups_query().bind(
+            id=self.data.player_state_group_id)
         payload = await self._client.request(query)
         data = extract_payload(payload, collection)
         states: dict[PlayerState, PlayerStateGroup] = {}
@@ -861,11 +885,7 @@ class FireMode(Cached, cache_size=10, cache_ttu=3600.0):
 
     def projectile(self) -> InstanceProxy[Projectile]:
         """Return the projectile associated with this fire mode."""
-        collection: Final[str] = 'fire_mode_to_projectile'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        join = query.create_join(Projectile.collection)
-        join.set_fields(Projectile.id_field)
+        query = _projectile_query().bind(id=self.id)
         return InstanceProxy(Projectile, query, client=self._client)
 
 
@@ -915,6 +935,8 @@ class FireGroup(Cached, cache_size=10, cache_ttu=60.0):
        Whether a bolt-action weapon can be rechambered while in ADS.
     """
 
+    __slots__ = ()
+
     collection = 'fire_group'
     data: FireGroupData
     id_field = 'fire_group_id'
@@ -930,10 +952,5 @@ class FireGroup(Cached, cache_size=10, cache_ttu=60.0):
 
     def fire_modes(self) -> SequenceProxy[FireMode]:
         """Return the fire modes in the fire group."""
-        collection: Final[str] = 'fire_group_to_fire_mode'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(20)
-        join = query.create_join(FireMode.collection)
-        join.set_fields(FireMode.id_field)
+        query = _fire_modes_query().bind(id=self.id)
         return SequenceProxy(FireMode, query, client=self._client)
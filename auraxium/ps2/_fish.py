@@ -49,6 +49,8 @@ class Fish(Named, ImageMixin, cache_size=32, cache_ttu=3600.0):
         (Not yet documented)
     """
 
+    __slots__ = ()
+
     collection = 'fish'
     data: FishData
     id_field = 'fish_id'
@@ -1,9 +1,10 @@
 """Item and item attachment class definitions."""
 
+import functools
 from typing import Any, Final, TYPE_CHECKING, cast
 
 from ..base import Cached, ImageMixin, Named
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..errors import NotFoundError
 from ..collections import ItemCategoryData, ItemData, ItemTypeData
 from .._rest import extract_single
@@ -25,6 +26,37 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _attachments_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Item.attachments`."""
+    query = Query('item_attachment').limit(100)
+    query.create_join(Item.collection).set_fields(
+        'attachment_item_id', Item.id_field)
+    return PreparedQuery(query, id=Item.id_field)
+
+
+@functools.cache
+def _datasheet_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Item.datasheet`."""
+    return PreparedQuery(Query('weapon_datasheet'), id=Item.id_field)
+
+
+@functools.cache
+def _profiles_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Item.profiles`."""
+    query = Query('item_profile').limit(50)
+    query.create_join(Profile.collection).set_fields(Profile.id_field)
+    return PreparedQuery(query, id=Item.id_field)
+
+
+@functools.cache
+def _weapon_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Item.weapon`."""
+    query = Query('item_to_weapon')
+    query.create_join('weapon').set_fields('weapon_id')
+    return PreparedQuery(query, id=Item.id_field)
+
+
 class ItemCategory(Named, cache_size=32, cache_ttu=3600.0):
     """A category of item.
 
@@ -43,6 +75,8 @@ class ItemCategory(Named, cache_size=32, cache_ttu=3600.0):
        Localised name of the item category.
     """
 
+    __slots__ = ()
+
     collection = 'item_category'
     data: ItemCategoryData
     id_field = 'item_category_id'
@@ -79,6 +113,8 @@ class ItemType(Cached, cache_size=10, cache_ttu=60.0):
        The internal code used to describe this item type.
     """
 
+    __slots__ = ()
+
     collection = 'item_type'
     data: ItemTypeData
     id_field = 'item_type_id'
@@ -187,6 +223,8 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'item'
     data: ItemData
     id_field = 'item_id'
@@ -214,12 +252,7 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'item_attachment'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(100)
-        join = query.create_join(self.collection)
-        join.set_fields('attachment_item_id', self.id_field)
+        query = _attachments_query().bind(id=self.id)
         return SequenceProxy(Item, query, client=self._client)
 
     def category(self) -> InstanceProxy[ItemCategory]:
@@ -229,11 +262,8 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
         """
         if self.data.item_category_id is None:  # pragma: no cover
             raise ValueError(f'{self} does not define a category')
-        query = Query(
-            ItemCategory.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=ItemCategory.id_field, value=self.data.item_category_id)
-        return InstanceProxy(ItemCategory, query, client=self._client)
+        return InstanceProxy.by_id(
+            ItemCategory, self.data.item_category_id, client=self._client)
 
     def faction(self) -> InstanceProxy[Faction]:
         """Return the faction that has access to this item.
@@ -241,17 +271,14 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         value = self.data.faction_id or -1
-        query = Query(Faction.collection, service_id=self._client.service_id)
-        query.add_term(field=Faction.id_field, value=value)
-        return InstanceProxy(Faction, query, client=self._client)
+        return InstanceProxy.by_id(Faction, value, client=self._client)
 
     async def datasheet(self) -> 'WeaponDatasheet | None':
         """Return the datasheet for the weapon."""
         # pylint: disable=import-outside-toplevel
         from ._weapon import WeaponDatasheet
         collection: Final[str] = 'weapon_datasheet'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
+        query = _datasheet_query().bind(id=self.id)
         payload = await self._client.request(query)
         try:
             data = extract_single(payload, collection)
@@ -264,12 +291,7 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'item_profile'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(50)
-        join = query.create_join(Profile.collection)
-        join.set_fields(Profile.id_field)
+        query = _profiles_query().bind(id=self.id)
         return SequenceProxy(Profile, query, client=self._client)
 
     def type(self) -> InstanceProxy[ItemType]:
@@ -280,9 +302,8 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
         if self.data.item_type_id is None:
             raise ValueError(
                 f'{self} does not define a type')  # pragma: no cover
-        query = Query(ItemType.collection, service_id=self._client.service_id)
-        query.add_term(field=ItemType.id_field, value=self.data.item_type_id)
-        return InstanceProxy(ItemType, query, client=self._client)
+        return InstanceProxy.by_id(
+            ItemType, self.data.item_type_id, client=self._client)
 
     def weapon(self) -> InstanceProxy['Weapon']:
         """Return the weapon associated with this item, if any.
@@ -290,9 +311,5 @@ class Item(Named, ImageMixin, cache_size=128, cache_ttu=3600.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         from ._weapon import Weapon  # pylint: disable=import-outside-toplevel
-        collection: Final[str] = 'item_to_weapon'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        join = query.create_join('weapon')
-        join.set_fields('weapon_id')
+        query = _weapon_query().bind(id=self.id)
         return InstanceProxy(Weapon, query, client=self._client)
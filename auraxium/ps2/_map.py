@@ -1,9 +1,9 @@
 """Facility and map class definitions."""
 
-from typing import Final
+import functools
 
 from ..base import Cached, Named
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import FacilityTypeData, MapHexData, MapRegionData, RegionData
 from .._proxy import InstanceProxy, SequenceProxy
 from .._rest import RequestClient
@@ -19,6 +19,26 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _facility_query() -> PreparedQuery:
+    """Return the query used by :meth:`MapRegion.get_by_facility_id`."""
+    return PreparedQuery(Query(MapRegion.collection), id='facility_id')
+
+
+@functools.cache
+def _connected_query(field: str) -> PreparedQuery:
+    """Return the prepared query used by :meth:`MapRegion.get_connected`.
+
+    The given field is the side of the facility link to filter by.
+    """
+    query = Query('facility_link').limit(10)
+    query.create_join(MapRegion.collection).set_fields(
+        'facility_id_a', 'facility_id')
+    query.create_join(MapRegion.collection).set_fields(
+        'facility_id_b', 'facility_id')
+    return PreparedQuery(query, id=field)
+
+
 class FacilityType(Cached, cache_size=10, cache_ttu=3600.0):
     """A type of base/facility found in the game.
 
@@ -34,6 +54,8 @@ class FacilityType(Cached, cache_size=10, cache_ttu=3600.0):
        An internal description of this facility type.
     """
 
+    __slots__ = ()
+
     collection = 'facility_type'
     data: FacilityTypeData
     id_field = 'facility_type_id'
@@ -102,6 +124,8 @@ class MapHex(Cached, cache_size=100, cache_ttu=60.0):
        The name of the hex's type.
     """
 
+    __slots__ = ()
+
     collection = 'map_hex'
     data: MapHexData
     id_field = 'map_region_id'
@@ -117,9 +141,8 @@ class MapHex(Cached, cache_size=100, cache_ttu=60.0):
 
     def map_region(self) -> InstanceProxy['MapRegion']:
         """Return the map region associated with this map hex."""
-        query = Query(MapRegion.collection, service_id=self._client.service_id)
-        query.add_term(field=MapRegion.id_field, value=self.data.map_region_id)
-        return InstanceProxy(MapRegion, query, client=self._client)
+        return InstanceProxy.by_id(
+            MapRegion, self.data.map_region_id, client=self._client)
 
 
 class MapRegion(Cached, cache_size=100, cache_ttu=60.0):
@@ -203,6 +226,8 @@ class MapRegion(Cached, cache_size=100, cache_ttu=60.0):
        Unused.
     """
 
+    __slots__ = ()
+
     collection = 'map_region'
     data: MapRegionData
     id_field = 'map_region_id'
@@ -228,8 +253,7 @@ class MapRegion(Cached, cache_size=100, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(cls.collection, service_id=client.service_id,
-                      facility_id=facility_id)
+        query = _facility_query().bind(id=facility_id)
         return InstanceProxy(MapRegion, query, client=client)
 
     async def get_connected(self) -> set['MapRegion']:
@@ -238,25 +262,12 @@ class MapRegion(Cached, cache_size=100, cache_ttu=60.0):
             return set()
         # NOTE: This operation cannot be done in a single query as there is no
         # "or" operator.
-        collection: Final[str] = 'facility_link'
         connected: set['MapRegion'] = set()
-        # Set up the base query
-        query = Query(collection, service_id=self._client.service_id)
-        query.limit(10)
-        join = query.create_join(self.collection)
-        join.set_fields('facility_id_a', 'facility_id')
-        join = query.create_join(self.collection)
-        join.set_fields('facility_id_b', 'facility_id')
-        # Modified query A
-        query.add_term(field='facility_id_a', value=self.data.facility_id)
-        proxy: SequenceProxy[MapRegion] = SequenceProxy(
-            MapRegion, query, client=self._client)
-        connected.update(await proxy.flatten())
-        # Modified query B
-        query.data.terms = []
-        query.add_term(field='facility_id_b', value=self.data.facility_id)
-        proxy = SequenceProxy(MapRegion, query, client=self._client)
-        connected.update(await proxy.flatten())
+        for field in ('facility_id_a', 'facility_id_b'):
+            query = _connected_query(field).bind(id=self.data.facility_id)
+            proxy: SequenceProxy[MapRegion] = SequenceProxy(
+                MapRegion, query, client=self._client)
+            connected.update(await proxy.flatten())
         return connected
 
     def zone(self) -> InstanceProxy[Zone]:
@@ -264,9 +275,8 @@ class MapRegion(Cached, cache_size=100, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Zone.collection, service_id=self._client.service_id)
-        query.add_term(field=Zone.id_field, value=self.data.zone_id)
-        return InstanceProxy(Zone, query, client=self._client)
+        return InstanceProxy.by_id(
+            Zone, self.data.zone_id, client=self._client)
 
 
 class Region(Named, cache_size=100, cache_ttu=60.0):
@@ -294,6 +304,8 @@ class Region(Named, cache_size=100, cache_ttu=60.0):
        The localised name of the map region.
     """
 
+    __slots__ = ()
+
     collection = 'region'
     data: RegionData
     id_field = 'region_id'
@@ -310,15 +322,12 @@ class Region(Named, cache_size=100, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(MapRegion.collection, service_id=self._client.service_id)
-        query.add_term(field=MapRegion.id_field, value=self.id)
-        return InstanceProxy(MapRegion, query, client=self._client)
+        return InstanceProxy.by_id(MapRegion, self.id, client=self._client)
 
     def zone(self) -> InstanceProxy[Zone]:
         """Return the zone/continent of the region.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Zone.collection, service_id=self._client.service_id)
-        query.add_term(field=Zone.id_field, value=self.data.zone_id)
-        return InstanceProxy(Zone, query, client=self._client)
+        return InstanceProxy.by_id(
+            Zone, self.data.zone_id, client=self._client)
@@ -63,6 +63,8 @@ class MetagameEvent(Cached, cache_size=100, cache_ttu=60.0):
        percent.
     """
 
+    __slots__ = ()
+
     collection = 'metagame_event'
     data: MetagameEventData
     id_field = 'metagame_event_id'
@@ -1,8 +1,9 @@
 """Objective class definitions."""
 
-from typing import Final
+import functools
+
 from ..base import Cached
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import ObjectiveData, ObjectiveTypeData
 from .._rest import RequestClient
 from .._proxy import InstanceProxy, SequenceProxy
@@ -13,6 +14,22 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _group_query() -> PreparedQuery:
+    """Return the query used by :meth:`Objective.get_by_objective_group`."""
+    query = Query(Objective.collection).limit(1000)
+    return PreparedQuery(query, id='objective_group_id')
+
+
+@functools.cache
+def _set_query() -> PreparedQuery:
+    """Return the query used by :meth:`Objective.get_by_objective_set`."""
+    query = Query('objective_set_to_objective').limit(1000)
+    join = query.create_join(Objective.collection)
+    join.set_fields('objective_group_id').set_list(True)
+    return PreparedQuery(query, id='objective_set_id')
+
+
 class ObjectiveType(Cached, cache_size=10, cache_ttu=60.0):
     """A type of objective.
 
@@ -36,6 +53,8 @@ class ObjectiveType(Cached, cache_size=10, cache_ttu=60.0):
        objectives of this type.
     """
 
+    __slots__ = ()
+
     collection = 'objective_type'
     data: ObjectiveTypeData
     id_field = 'objective_type_id'
@@ -92,6 +111,8 @@ class Objective(Cached, cache_size=10, cache_ttu=60.0):
        details.
     """
 
+    __slots__ = ()
+
     collection = 'objective'
     data: ObjectiveData
     id_field = 'objective_id'
@@ -119,9 +140,7 @@ class Objective(Cached, cache_size=10, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(Objective.collection, service_id=client.service_id,
-                      objective_group_id=objective_group_id)
-        query.limit(1000)
+        query = _group_query().bind(id=objective_group_id)
         return SequenceProxy(Objective, query, client=client)
 
     @classmethod
@@ -132,12 +151,7 @@ class Objective(Cached, cache_size=10, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'objective_set_to_objective'
-        query = Query(collection, service_id=client.service_id,
-                      objective_set_id=objective_set_id)
-        query.limit(1000)
-        join = query.create_join(Objective.collection)
-        join.set_fields('objective_group_id').set_list(True)
+        query = _set_query().bind(id=objective_set_id)
         return SequenceProxy(Objective, query, client=client)
 
     def type(self) -> InstanceProxy[ObjectiveType]:
@@ -145,8 +159,5 @@ class Objective(Cached, cache_size=10, cache_ttu=60.0):
 
          This returns an :class:`auraxium.InstanceProxy`.
          """
-        query = Query(
-            ObjectiveType.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=ObjectiveType.id_field, value=self.data.objective_type_id)
-        return InstanceProxy(ObjectiveType, query, client=self._client)
+        return InstanceProxy.by_id(
+            ObjectiveType, self.data.objective_type_id, client=self._client)
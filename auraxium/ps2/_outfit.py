@@ -1,11 +1,12 @@
 """Outfit and outfit member class definitions."""
 
+import functools
 import logging
 from typing import Any, ClassVar, Final, TYPE_CHECKING, cast
 
 from ..base import Cached, Named
 from .._cache import TLRUCache
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import OutfitData, OutfitMemberData, OutfitRankData
 from .._proxy import InstanceProxy, SequenceProxy
 from .._rest import extract_payload
@@ -62,6 +63,8 @@ class OutfitMember(Cached, cache_size=100, cache_ttu=300.0):
        lower the value, the higher the rank.
     """
 
+    __slots__ = ()
+
     collection = 'outfit_member'
     data: OutfitMemberData
     id_field = 'character_id'
@@ -84,18 +87,29 @@ class OutfitMember(Cached, cache_size=100, cache_ttu=300.0):
         # extension of Character.
         # pylint: disable=import-outside-toplevel
         from ._character import Character
-        query = Query(Character.collection, service_id=self._client.service_id)
-        query.add_term(field=Character.id_field, value=self.data.character_id)
-        return InstanceProxy(Character, query, client=self._client)
+        return InstanceProxy.by_id(
+            Character, self.data.character_id, client=self._client)
 
     def outfit(self) -> InstanceProxy['Outfit']:
         """Return the character associated with this member.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Outfit.collection, service_id=self._client.service_id)
-        query.add_term(field=Outfit.id_field, value=self.data.outfit_id)
-        return InstanceProxy(Outfit, query, client=self._client)
+        return InstanceProxy.by_id(
+            Outfit, self.data.outfit_id, client=self._client)
+
+
+@functools.cache
+def _members_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Outfit.members`."""
+    query = Query(OutfitMember.collection).limit(5000)
+    return PreparedQuery(query, id='outfit_id')
+
+
+@functools.cache
+def _ranks_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Outfit.ranks`."""
+    return PreparedQuery(Query('outfit_rank').limit(20), id='outfit_id')
 
 
 class Outfit(Named, cache_size=20, cache_ttu=300.0):
@@ -150,6 +164,8 @@ class Outfit(Named, cache_size=20, cache_ttu=300.0):
        The number of members in the outfit.
     """
 
+    __slots__ = ()
+
     _cache: ClassVar[TLRUCache[int | str, 'Outfit']]
     collection = 'outfit'
     data: OutfitData
@@ -176,29 +192,21 @@ class Outfit(Named, cache_size=20, cache_ttu=300.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         assert self.data.leader_character_id is not None
-        query = Query(
-            OutfitMember.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=OutfitMember.id_field, value=self.data.leader_character_id)
-        return InstanceProxy(OutfitMember, query, client=self._client)
+        return InstanceProxy.by_id(
+            OutfitMember, self.data.leader_character_id, client=self._client)
 
     def members(self) -> SequenceProxy[OutfitMember]:
         """Return the members of the outfit.
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(
-            OutfitMember.collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(5000)
+        query = _members_query().bind(id=self.id)
         return SequenceProxy(OutfitMember, query, client=self._client)
 
     async def ranks(self) -> list[OutfitRankData]:
         """Return the list of ranks for the outfit."""
         collection: Final[str] = 'outfit_rank'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(20)
+        query = _ranks_query().bind(id=self.id)
         data = await self._client.request(query)
         payload = extract_payload(data, collection)
         return [OutfitRankData(**cast(Any, c)) for c in payload]
@@ -1,9 +1,9 @@
 """Profile and loadout class definitions."""
 
-from typing import Final
+import functools
 
 from ..base import Cached
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import LoadoutData, ProfileData
 from ..models.base import FallbackMixin
 from .._proxy import InstanceProxy, SequenceProxy
@@ -19,6 +19,22 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _armour_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Profile.armour_info`."""
+    query = Query('profile_armor_map').limit(20)
+    query.create_join(ArmourInfo.collection).set_fields(ArmourInfo.id_field)
+    return PreparedQuery(query, id=Profile.id_field)
+
+
+@functools.cache
+def _resist_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Profile.resist_info`."""
+    query = Query('profile_resist_map').limit(500)
+    query.create_join(ResistInfo.collection).set_fields(ResistInfo.id_field)
+    return PreparedQuery(query, id=Profile.id_field)
+
+
 class Profile(Cached, cache_size=200, cache_ttu=60.0):
     """An entity in the game world.
 
@@ -41,6 +57,8 @@ class Profile(Cached, cache_size=200, cache_ttu=60.0):
        The description of the profile.
     """
 
+    __slots__ = ()
+
     collection = 'profile_2'
     data: ProfileData
     id_field = 'profile_id'
@@ -55,12 +73,7 @@ class Profile(Cached, cache_size=200, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'profile_armor_map'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(20)
-        join = query.create_join(ArmourInfo.collection)
-        join.set_fields(ArmourInfo.id_field)
+        query = _armour_query().bind(id=self.id)
         return SequenceProxy(ArmourInfo, query, client=self._client)
 
     def resist_info(self) -> SequenceProxy[ResistInfo]:
@@ -68,12 +81,7 @@ class Profile(Cached, cache_size=200, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'profile_resist_map'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(500)
-        join = query.create_join(ResistInfo.collection)
-        join.set_fields(ResistInfo.id_field)
+        query = _resist_query().bind(id=self.id)
         return SequenceProxy(ResistInfo, query, client=self._client)
 
 
@@ -112,6 +120,8 @@ class Loadout(Cached, FallbackMixin, cache_size=20, cache_ttu=3600.0):
        A string describing the loadout for introspection purposes.
     """
 
+    __slots__ = ()
+
     collection = 'loadout'
     data: LoadoutData
     id_field = 'loadout_id'
@@ -128,12 +138,7 @@ class Loadout(Cached, FallbackMixin, cache_size=20, cache_ttu=3600.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'profile_armor_map'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=Profile.id_field, value=self.data.profile_id)
-        query.limit(20)
-        join = query.create_join(ArmourInfo.collection)
-        join.set_fields(ArmourInfo.id_field)
+        query = _armour_query().bind(id=self.data.profile_id)
         return SequenceProxy(ArmourInfo, query, client=self._client)
 
     def faction(self) -> InstanceProxy[Faction]:
@@ -141,30 +146,23 @@ class Loadout(Cached, FallbackMixin, cache_size=20, cache_ttu=3600.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Faction.collection, service_id=self._client.service_id)
-        query.add_term(field=Faction.id_field, value=self.data.faction_id)
-        return InstanceProxy(Faction, query, client=self._client)
+        return InstanceProxy.by_id(
+            Faction, self.data.faction_id, client=self._client)
 
     def profile(self) -> InstanceProxy[Profile]:
         """Return the profile of the loadout.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Profile.collection, service_id=self._client.service_id)
-        query.add_term(field=Profile.id_field, value=self.data.profile_id)
-        return InstanceProxy(Profile, query, client=self._client)
+        return InstanceProxy.by_id(
+            Profile, self.data.profile_id, client=self._client)
 
     def resist_info(self) -> SequenceProxy[ResistInfo]:
         """Return the resist info of the loadout.
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'profile_resist_map'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=Profile.id_field, value=self.data.profile_id)
-        query.limit(500)
-        join = query.create_join(ResistInfo.collection)
-        join.set_fields(ResistInfo.id_field)
+        query = _resist_query().bind(id=self.data.profile_id)
         return SequenceProxy(ResistInfo, query, client=self._client)
 
     @staticmethod
@@ -152,6 +152,8 @@ class Projectile(Cached, cache_size=100, cache_ttu=60.0):
        launch.
     """
 
+    __slots__ = ()
+
     collection = 'projectile'
     data: ProjectileData
     id_field = 'projectile_id'
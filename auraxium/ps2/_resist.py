@@ -1,7 +1,6 @@
 """Resistance mapping class definitions."""
 
 from ..base import Cached
-from ..census import Query
 from ..collections import ResistInfoData, ResistTypeData
 from .._proxy import InstanceProxy
 
@@ -29,6 +28,8 @@ class ResistType(Cached, cache_size=100, cache_ttu=60.0):
        A description of what this resist type is used for.
     """
 
+    __slots__ = ()
+
     collection = 'resist_type'
     data: ResistTypeData
     id_field = 'resist_type_id'
@@ -82,6 +83,8 @@ class ResistInfo(Cached, cache_size=100, cache_ttu=60.0):
        A description of this resist info entry.
     """
 
+    __slots__ = ()
+
     collection = 'resist_info'
     data: ResistInfoData
     id_field = 'resist_info_id'
@@ -100,8 +103,5 @@ class ResistInfo(Cached, cache_size=100, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            ResistType.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=ResistType.id_field, value=self.data.resist_type_id)
-        return InstanceProxy(ResistType, query, self._client)
+        return InstanceProxy.by_id(
+            ResistType, self.data.resist_type_id, client=self._client)
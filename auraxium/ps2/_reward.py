@@ -1,9 +1,9 @@
 """Reward and reward type class definitions."""
 
-from typing import Final
+import functools
 
 from ..base import Cached
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import RewardData, RewardTypeData
 from .._rest import RequestClient
 from .._proxy import InstanceProxy, SequenceProxy
@@ -14,6 +14,24 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _group_query() -> PreparedQuery:
+    """Return the query used by :meth:`Reward.get_by_reward_group`."""
+    query = Query('reward_group_to_reward').limit(100)
+    query.create_join(Reward.collection).set_fields(Reward.id_field)
+    return PreparedQuery(query, id='reward_group_id')
+
+
+@functools.cache
+def _set_query() -> PreparedQuery:
+    """Return the query used by :meth:`Reward.get_by_reward_set`."""
+    query = Query('reward_set_to_reward_group').limit(100)
+    join = query.create_join('reward_group_to_reward').set_list(True)
+    join.set_fields('reward_group_id')
+    join.create_join(Reward.collection).set_fields(Reward.id_field)
+    return PreparedQuery(query, id='reward_set_id')
+
+
 class RewardType(Cached, cache_size=10, cache_ttu=3600.0):
     """A type of reward.
 
@@ -47,6 +65,8 @@ class RewardType(Cached, cache_size=10, cache_ttu=3600.0):
        rewards of this type.
     """
 
+    __slots__ = ()
+
     collection = 'reward_type'
     data: RewardTypeData
     id_field = 'reward_type_id'
@@ -103,6 +123,8 @@ class Reward(Cached, cache_size=50, cache_ttu=60.0):
        corresponding :class:`~auraxium.ps2.RewardType` for details.
     """
 
+    __slots__ = ()
+
     collection = 'reward'
     data: RewardData
     id_field = 'reward_id'
@@ -126,12 +148,7 @@ class Reward(Cached, cache_size=50, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'reward_group_to_reward'
-        query = Query(collection, service_id=client.service_id)
-        query.add_term(field='reward_group_id', value=reward_group_id)
-        query.limit(100)
-        join = query.create_join(Reward.collection)
-        join.set_fields(Reward.id_field)
+        query = _group_query().bind(id=reward_group_id)
         return SequenceProxy(Reward, query, client=client)
 
     @classmethod
@@ -141,14 +158,7 @@ class Reward(Cached, cache_size=50, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'reward_set_to_reward_group'
-        query = Query(collection, service_id=client.service_id)
-        query.add_term(field='reward_set_id', value=reward_set_id)
-        query.limit(100)
-        join = query.create_join('reward_group_to_reward').set_list(True)
-        join.set_fields('reward_group_id')
-        nested = join.create_join(Reward.collection)
-        nested.set_fields(Reward.id_field)
+        query = _set_query().bind(id=reward_set_id)
         return SequenceProxy(Reward, query, client=client)
 
     def type(self) -> InstanceProxy[RewardType]:
@@ -156,8 +166,5 @@ class Reward(Cached, cache_size=50, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(
-            RewardType.collection, service_id=self._client.service_id)
-        query.add_term(
-            field=RewardType.id_field, value=self.data.reward_type_id)
-        return InstanceProxy(RewardType, query, client=self._client)
+        return InstanceProxy.by_id(
+            RewardType, self.data.reward_type_id, client=self._client)
@@ -1,7 +1,9 @@
 """Skill and skill line class definitions."""
 
+import functools
+
 from ..base import ImageMixin, Named
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import SkillData, SkillCategoryData, SkillLineData, SkillSetData
 from .._proxy import InstanceProxy, SequenceProxy
 from ..types import LocaleData
@@ -16,6 +18,27 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _categories_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`SkillSet.categories`."""
+    query = Query(SkillCategory.collection).limit(100)
+    return PreparedQuery(query, id=SkillSet.id_field)
+
+
+@functools.cache
+def _skill_lines_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`SkillCategory.skill_lines`."""
+    query = Query(SkillLine.collection).sort('skill_category_index')
+    return PreparedQuery(query, id=SkillCategory.id_field)
+
+
+@functools.cache
+def _skills_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`SkillLine.skills`."""
+    query = Query(Skill.collection).limit(20).sort('skill_line_index')
+    return PreparedQuery(query, id=SkillLine.id_field)
+
+
 class SkillSet(Named, ImageMixin, cache_size=100, cache_ttu=60.0):
     """A skill set for a particular vehicle or class.
 
@@ -70,6 +93,8 @@ class SkillSet(Named, ImageMixin, cache_size=100, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'skill_set'
     data: SkillSetData
     id_field = 'skill_set_id'
@@ -90,10 +115,7 @@ class SkillSet(Named, ImageMixin, cache_size=100, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(
-            SkillCategory.collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(100)
+        query = _categories_query().bind(id=self.id)
         return SequenceProxy(SkillCategory, query, client=self._client)
 
     def required_item(self) -> InstanceProxy[Item]:
@@ -102,9 +124,7 @@ class SkillSet(Named, ImageMixin, cache_size=100, cache_ttu=60.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         item_id = self.data.required_item_id or -1
-        query = Query(Item.collection, service_id=self._client.service_id)
-        query.add_term(field=Item.id_field, value=item_id)
-        return InstanceProxy(Item, query, client=self._client)
+        return InstanceProxy.by_id(Item, item_id, client=self._client)
 
 
 class SkillCategory(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
@@ -166,6 +186,8 @@ class SkillCategory(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'skill_category'
     data: SkillCategoryData
     id_field = 'skill_category_id'
@@ -187,9 +209,7 @@ class SkillCategory(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(SkillLine.collection, service_id=self._client.service_id)
-        query.add_term(field=SkillCategory.id_field, value=self.id)
-        query.sort('skill_category_index')
+        query = _skill_lines_query().bind(id=self.id)
         return SequenceProxy(SkillLine, query, client=self._client)
 
     def skill_set(self) -> InstanceProxy['SkillSet']:
@@ -197,9 +217,8 @@ class SkillCategory(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(SkillSet.collection, service_id=self._client.service_id)
-        query.add_term(field=SkillSet.id_field, value=self.data.skill_set_id)
-        return InstanceProxy(SkillSet, query, client=self._client)
+        return InstanceProxy.by_id(
+            SkillSet, self.data.skill_set_id, client=self._client)
 
 
 class SkillLine(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
@@ -260,6 +279,8 @@ class SkillLine(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'skill_line'
     data: SkillLineData
     id_field = 'skill_line_id'
@@ -282,20 +303,15 @@ class SkillLine(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         category_id = self.data.skill_category_id or -1
-        query = Query(
-            SkillCategory.collection, service_id=self._client.service_id)
-        query.add_term(field=SkillCategory.id_field, value=category_id)
-        return InstanceProxy(SkillCategory, query, client=self._client)
+        return InstanceProxy.by_id(
+            SkillCategory, category_id, client=self._client)
 
     def skills(self) -> SequenceProxy['Skill']:
         """Return the skills contained in this skill line in order.
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        query = Query(Skill.collection, service_id=self._client.service_id)
-        query.add_term(field=SkillLine.id_field, value=self.id)
-        query.limit(20)
-        query.sort('skill_line_index')
+        query = _skills_query().bind(id=self.id)
         return SequenceProxy(Skill, query, client=self._client)
 
 
@@ -362,6 +378,8 @@ class Skill(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'skill'
     data: SkillData
     id_field = 'skill_id'
@@ -385,15 +403,12 @@ class Skill(Named, ImageMixin, cache_size=50, cache_ttu=60.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         item_id = self.data.grant_item_id or -1
-        query = Query(Item.collection, service_id=self._client.service_id)
-        query.add_term(field=Item.id_field, value=item_id)
-        return InstanceProxy(Item, query, self._client)
+        return InstanceProxy.by_id(Item, item_id, client=self._client)
 
     def skill_line(self) -> InstanceProxy[SkillLine]:
         """Return the skill line containing this skill.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(SkillLine.collection, service_id=self._client.service_id)
-        query.add_term(field=SkillLine.id_field, value=self.data.skill_line_id)
-        return InstanceProxy(SkillLine, query, self._client)
+        return InstanceProxy.by_id(
+            SkillLine, self.data.skill_line_id, client=self._client)
@@ -1,9 +1,9 @@
 """Vehicle class definitions."""
 
-from typing import Final
+import functools
 
 from ..base import Cached, ImageMixin, Named
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import VehicleAttachmentData, VehicleData
 from .._rest import RequestClient
 from .._proxy import InstanceProxy, SequenceProxy
@@ -19,6 +19,36 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _factions_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Vehicle.factions`."""
+    query = Query('vehicle_faction').limit(5)
+    return PreparedQuery(query, id=Vehicle.id_field)
+
+
+@functools.cache
+def _by_faction_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Vehicle.get_by_faction`."""
+    query = Query('vehicle_faction').limit(500)
+    query.create_join(Vehicle.collection).set_fields(Vehicle.id_field)
+    return PreparedQuery(query, id=Faction.id_field)
+
+
+@functools.cache
+def _skill_sets_query(by_faction: bool) -> PreparedQuery:
+    """Return the prepared query used by :meth:`Vehicle.skill_sets`.
+
+    If by_faction is true, the query has an additional ``faction``
+    placeholder.
+    """
+    query = Query('vehicle_skill_set').limit(500).sort('display_index')
+    query.create_join(SkillSet.collection).set_fields(SkillSet.id_field)
+    prepared = PreparedQuery(query, id=Vehicle.id_field)
+    if by_faction:
+        prepared.add_placeholder('faction', Faction.id_field)
+    return prepared
+
+
 class Vehicle(Named, ImageMixin, cache_size=50, cache_ttu=3600.0):
     """A mountable vehicle in PlanetSide 2.
 
@@ -77,6 +107,8 @@ class Vehicle(Named, ImageMixin, cache_size=50, cache_ttu=3600.0):
        The base path to the image with the default :attr:`image_id`.
     """
 
+    __slots__ = ()
+
     collection = 'vehicle'
     data: VehicleData
     id_field = 'vehicle_id'
@@ -99,23 +131,15 @@ class Vehicle(Named, ImageMixin, cache_size=50, cache_ttu=3600.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'vehicle_faction'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=Vehicle.id_field, value=self.id)
-        query.limit(5)
+        query = _factions_query().bind(id=self.id)
         return SequenceProxy(Faction, query, client=self._client)
 
     @classmethod
     async def get_by_faction(cls, faction: Faction | int, *,
                              client: RequestClient) -> list['Vehicle']:
         """Return all vehicles available to the given faction."""
-        collection: Final[str] = 'vehicle_faction'
         faction_id = faction.id if isinstance(faction, Faction) else faction
-        query = Query(collection, service_id=client.service_id)
-        query.add_term(field=Faction.id_field, value=faction_id)
-        query.limit(500)
-        join = query.create_join(cls.collection)
-        join.set_fields(cls.id_field)
+        query = _by_faction_query().bind(id=faction_id)
         proxy: SequenceProxy['Vehicle'] = SequenceProxy(
             cls, query, client=client)
         return await proxy.flatten()
@@ -132,16 +156,11 @@ class Vehicle(Named, ImageMixin, cache_size=50, cache_ttu=3600.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'vehicle_skill_set'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        if faction is not None:
+        if faction is None:
+            query = _skill_sets_query(False).bind(id=self.id)
+        else:
             faction = faction.id if isinstance(faction, Faction) else faction
-            query.add_term(field=Faction.id_field, value=faction)
-        query.limit(500)
-        query.sort('display_index')
-        join = query.create_join(SkillSet.collection)
-        join.set_fields(SkillSet.id_field)
+            query = _skill_sets_query(True).bind(id=self.id, faction=faction)
         return SequenceProxy(SkillSet, query, client=self._client)
 
 
@@ -185,6 +204,8 @@ class VehicleAttachment(Cached, cache_size=250, cache_ttu=180.0):
        The slot the attachment goes into.
     """
 
+    __slots__ = ()
+
     collection = 'vehicle_attachment'
     data: VehicleAttachmentData
     id_field = 'vehicle_attachment_id'
@@ -202,9 +223,8 @@ class VehicleAttachment(Cached, cache_size=250, cache_ttu=180.0):
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Faction.collection, service_id=self._client.service_id)
-        query.add_term(field=Faction.id_field, value=self.data.faction_id)
-        return InstanceProxy(Faction, query, client=self._client)
+        return InstanceProxy.by_id(
+            Faction, self.data.faction_id, client=self._client)
 
     def item(self) -> InstanceProxy[Item]:
         """Return the attachable item for the vehicle.
@@ -212,15 +232,13 @@ class VehicleAttachment(Cached, cache_size=250, cache_ttu=180.0):
         This returns an :class:`auraxium.InstanceProxy`.
         """
         assert self.data.item_id is not None
-        query = Query(Item.collection, service_id=self._client.service_id)
-        query.add_term(field=Item.id_field, value=self.data.item_id)
-        return InstanceProxy(Item, query, client=self._client)
+        return InstanceProxy.by_id(
+            Item, self.data.item_id, client=self._client)
 
     def vehicle(self) -> InstanceProxy[Vehicle]:
         """Return the vehicle the item may be attached to.
 
         This returns an :class:`auraxium.InstanceProxy`.
         """
-        query = Query(Vehicle.collection, service_id=self._client.service_id)
-        query.add_term(field=Vehicle.id_field, value=self.data.vehicle_id)
-        return InstanceProxy(Vehicle, query, client=self._client)
+        return InstanceProxy.by_id(
+            Vehicle, self.data.vehicle_id, client=self._client)
@@ -1,14 +1,14 @@
 """Weapon class definition."""
 
+import functools
 import logging
 from typing import Any, Final, cast
 
 from ..base import Cached
-from ..census import Query
-from ..errors import NotFoundError
+from ..census import PreparedQuery, Query
 from ..collections import WeaponAmmoSlot, WeaponData, WeaponDatasheet
 from .._proxy import InstanceProxy, SequenceProxy
-from .._rest import extract_payload, extract_single
+from .._rest import extract_payload
 
 from ._fire import FireGroup
 from ._item import Item
@@ -22,6 +22,38 @@ __all__ = [
 log = logging.getLogger('auraxium')
 
 
+@functools.cache
+def _ammo_slots_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Weapon.ammo_slots`."""
+    query = Query('weapon_ammo_slot').limit(10).sort('weapon_slot_index')
+    return PreparedQuery(query, id=Weapon.id_field)
+
+
+@functools.cache
+def _attachments_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Weapon.attachments`."""
+    query = Query('weapon_to_attachment').limit(100)
+    join = query.create_join(Item.collection)
+    join.set_fields(Item.id_field).set_outer(False)
+    return PreparedQuery(query, id='weapon_group_id')
+
+
+@functools.cache
+def _fire_groups_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Weapon.fire_groups`."""
+    query = Query('weapon_to_fire_group').limit(20)
+    query.create_join(FireGroup.collection).set_fields(FireGroup.id_field)
+    return PreparedQuery(query, id=Weapon.id_field)
+
+
+@functools.cache
+def _item_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`Weapon.item`."""
+    query = Query('item_to_weapon')
+    query.create_join('item').set_fields('item_id', None)
+    return PreparedQuery(query, id=Weapon.id_field)
+
+
 class Weapon(Cached, cache_size=128, cache_ttu=3600.0):
     """A weapon available to a player.
 
@@ -108,6 +140,8 @@ class Weapon(Cached, cache_size=128, cache_ttu=3600.0):
        The hitbox height for melee weapons.
     """
 
+    __slots__ = ()
+
     collection = 'weapon'
     data: WeaponData
     id_field = 'weapon_id'
@@ -143,9 +177,7 @@ class Weapon(Cached, cache_size=128, cache_ttu=3600.0):
     async def ammo_slots(self) -> list[WeaponAmmoSlot]:
         """Return the ammo slots for the weapon."""
         collection: Final[str] = 'weapon_ammo_slot'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(10).sort('weapon_slot_index')
+        query = _ammo_slots_query().bind(id=self.id)
         payload = await self._client.request(query)
         data = extract_payload(payload, collection)
         return [WeaponAmmoSlot(**cast(Any, d)) for d in data]
@@ -155,47 +187,25 @@ class Weapon(Cached, cache_size=128, cache_ttu=3600.0):
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'weapon_to_attachment'
         group_id = self.data.weapon_group_id or -1
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field='weapon_group_id', value=group_id)
-        query.limit(100)
-        join = query.create_join(Item.collection)
-        join.set_fields(Item.id_field)
-        join.set_outer(False)
+        query = _attachments_query().bind(id=group_id)
         return SequenceProxy(Item, query, client=self._client)
 
     async def datasheet(self) -> WeaponDatasheet | None:
         """Return the datasheet for the weapon."""
-        collection: Final[str] = 'weapon_datasheet'
         if (item := await self.item()) is None:  # pragma: no cover
             raise RuntimeError(f'Invalid item for weapon ID: {self.id}')
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=Item.id_field, value=item.id)
-        payload = await self._client.request(query)
-        try:
-            data = extract_single(payload, collection)
-        except NotFoundError:
-            return None
-        return WeaponDatasheet(**cast(Any, data))
+        return await item.datasheet()
 
     def fire_groups(self) -> SequenceProxy[FireGroup]:
         """Return the fire groups for this weapon.
 
         This returns a :class:`auraxium.SequenceProxy`.
         """
-        collection: Final[str] = 'weapon_to_fire_group'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        query.limit(20)
-        join = query.create_join(FireGroup.collection)
-        join.set_fields(FireGroup.id_field)
+        query = _fire_groups_query().bind(id=self.id)
         return SequenceProxy(FireGroup, query, client=self._client)
 
     def item(self) -> InstanceProxy[Item]:
         """Return the item associated with this weapon."""
-        query = Query('item_to_weapon', service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
-        join = query.create_join('item')
-        join.set_fields('item_id', None)
+        query = _item_query().bind(id=self.id)
         return InstanceProxy(Item, query, client=self._client)
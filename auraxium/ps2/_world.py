@@ -1,10 +1,11 @@
 """World class definition."""
 
 import datetime
+import functools
 from typing import Any, Final
 
 from ..base import Named
-from ..census import Query
+from ..census import PreparedQuery, Query
 from ..collections import WorldData
 from .._rest import extract_payload, extract_single
 from ..types import CensusData, LocaleData
@@ -16,6 +17,13 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _map_query() -> PreparedQuery:
+    """Return the prepared query used by :meth:`World.map`."""
+    query = PreparedQuery(Query('map').limit(3000), id=World.id_field)
+    return query.add_placeholder('zones', 'zone_ids')
+
+
 class World(Named, cache_size=20, cache_ttu=3600.0):
     """A world (or server) in the game.
 
@@ -41,6 +49,8 @@ class World(Named, cache_size=20, cache_ttu=3600.0):
        A description of the world's server region.
     """
 
+    __slots__ = ()
+
     collection = 'world'
     data: WorldData
     id_field = 'world_id'
@@ -73,13 +83,10 @@ class World(Named, cache_size=20, cache_ttu=3600.0):
                   *args: int | Zone) -> list[CensusData]:
         """Return the map status of a given zone."""
         collection: Final[str] = 'map'
-        query = Query(collection, service_id=self._client.service_id)
-        query.add_term(field=self.id_field, value=self.id)
         zone_ids: list[int] = [zone if isinstance(zone, int) else zone.id]
         zone_ids.extend(z if isinstance(z, int) else z.id for z in args)
         value = ','.join(str(z) for z in zone_ids)
-        query.add_term(field='zone_ids', value=value)
-        query.limit(3000)
+        query = _map_query().bind(id=self.id, zones=value)
         payload = await self._client.request(query)
         data = extract_payload(payload, collection=collection)
         return data
@@ -54,6 +54,8 @@ class Zone(Named, cache_size=20, cache_ttu=3600.0):
        Localised name of the zone.
     """
 
+    __slots__ = ()
+
     collection = 'zone'
     data: ZoneData
     id_field = 'zone_id'
@@ -6,7 +6,6 @@ same time.
 """
 
 import asyncio
-import datetime
 
 import auraxium
 from auraxium import event, ps2
@@ -19,57 +18,53 @@ async def main() -> None:
     """Main script method."""
     # Instantiate the event client
     client = auraxium.event.EventClient(service_id='s:example')
-
-    # This dictionary is used to track recent deaths
-    cache: dict[int, tuple[int, datetime.datetime]] = {}
-
-    @client.trigger(event.Death)
-    async def on_death(evt: event.Death) -> None:
-        """Run whenever a death event is received."""
-        now = evt.timestamp
-        victim_id = evt.character_id
-        killer_id = evt.attacker_character_id
-
-        # Ignore deaths not caused by enemy players
-        if killer_id == 0 or victim_id == killer_id:
+    # Keep a reference to running tasks so they are not garbage collected
+    reports: set[asyncio.Task[None]] = set()
+
+    async def report(first: event.Event, second: event.Event) -> None:
+        """Print the names of the players involved in a mutual death."""
+        assert isinstance(first, event.Death)
+        killer_id, victim_id = first.attacker_character_id, first.character_id
+
+        # Get the names of the players involved
+        ids = ','.join((str(i) for i in (killer_id, victim_id)))
+        results = await client.find(ps2.Character, character_id=ids)
+        if len(results) < 2:
+            # Ignore events if you cannot resolve the player names
             return
+        victim, killer = results
 
-        # Remove outdated kills from cache
-        for cache_killer, cache_data in list(cache.items()):
-            cache_victim, cache_timestamp = cache_data
-            age = now - cache_timestamp
-            if age.total_seconds() > MUTUAL_DEATH_WINDOW:
-                del cache[cache_killer]
+        # Get the name of the server these players are on
+        server = await victim.world()
 
-        # Check remaining cache items for mutual deaths
-        for cache_killer, cache_data in cache.items():
-            cache_victim, _ = cache_data
-            if (cache_killer, cache_victim) == (victim_id, killer_id):
-                # Mutual death found!
+        print(f'{second.timestamp}: [{server}] - Mutual death between '
+              f'{victim.name} and {killer.name}')
 
-                # Get the names of the players involved
-                ids = ','.join((str(i) for i in (killer_id, victim_id)))
-                results = await client.find(ps2.Character, character_id=ids)
-                if not results:
-                    # Ignore events if you cannot resolve the player names
-                    return
-                victim, killer = results
+    def on_match(first: event.Event, second: event.Event) -> None:
+        # Look up the player names without blocking the correlator
+        task = client.loop.create_task(report(first, second))
+        reports.add(task)
+        task.add_done_callback(reports.discard)
 
-                # Get the name of the server these players are on
-                server = await victim.world()
+    # The correlator remembers recent kills by (killer, victim) and reports
+    # a match as soon as the victim kills their killer in return. Matched
+    # kills are consumed, so each mutual death is only reported once.
+    correlator = event.Correlator(
+        MUTUAL_DEATH_WINDOW,
+        index=lambda e: (e.attacker_character_id, e.character_id),
+        probe=lambda e: (e.character_id, e.attacker_character_id),
+        on_match=on_match)
 
-                print(f'{now}: [{server}] - Mutual death between '
-                      f'{victim.name} and {killer.name}')
-
-                # Remove cache item as it was "consumed" for this mutual death
-                del cache[cache_killer]
-                return
-
-        # No-op; this mostly serves to fix "unused name" errors in some linters
-        _ = on_death
+    @client.trigger(event.Death)
+    def on_death(evt: event.Death) -> None:
+        """Run whenever a death event is received."""
+        # Ignore deaths not caused by enemy players
+        if evt.attacker_character_id in (0, evt.character_id):
+            return
+        correlator.add(evt)
 
-        # No match found, add current event to cache instead
-        cache[killer_id] = victim_id, now
+    # No-op; this mostly serves to fix "unused name" errors in some linters
+    _ = on_death
 
 if __name__ == '__main__':
 
@@ -78,5 +73,5 @@ if __name__ == '__main__':
     # as the `main()` method finishes.
 
     loop = asyncio.new_event_loop()
-    loop.create_task(main())
+    main_task = loop.create_task(main())
     loop.run_forever()
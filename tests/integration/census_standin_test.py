@@ -0,0 +1,112 @@
+"""Test the REST client against the local Census stand-in server."""
+
+import asyncio
+import unittest
+
+import auraxium
+from auraxium import ps2
+from auraxium.census import PreparedQuery, Query
+from tools.census_server import CensusStandIn
+
+
+class TestCensusStandIn(unittest.IsolatedAsyncioTestCase):
+    """Run queries against the fixture-backed Census stand-in."""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.standin = CensusStandIn()
+        self.runner = await self.standin.start()
+        port = self.runner.addresses[0][1]
+        self.client = auraxium.Client(endpoints=f'http://127.0.0.1:{port}')
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.runner.cleanup()
+        await super().asyncTearDown()
+
+    async def test_find(self) -> None:
+        """Test search terms and result pagination."""
+        worlds = await self.client.find(ps2.World, results=100)
+        self.assertEqual(len(worlds), len(self.standin.collections['world']))
+        page = await self.client.find(ps2.World, results=2, offset=1)
+        self.assertListEqual([w.id for w in page],
+                             [w.id for w in worlds[1:3]])
+        filtered = await self.client.find(
+            ps2.World, results=100, world_id='>10')
+        self.assertTrue(filtered)
+        self.assertTrue(all(w.id > 10 for w in filtered))
+        self.assertEqual(await self.client.count(ps2.World),
+                         len(worlds))
+
+    async def test_get_by_name(self) -> None:
+        """Test nested search terms."""
+        payload = self.standin.collections['character'][0]
+        character = await self.client.get_by_name(
+            ps2.Character, payload['name']['first'].upper())
+        assert character is not None
+        self.assertEqual(str(character.id), payload['character_id'])
+
+    async def test_join(self) -> None:
+        """Test joined collections being injected into the results."""
+        query = Query('outfit_member', service_id=self.client.service_id)
+        query.limit(20).create_join('character').set_fields('character_id')
+        data = await self.client.request(query)
+        members = data['outfit_member_list']
+        assert isinstance(members, list)
+        ids = {c['character_id'] for c in self.standin.collections['character']}
+        for member in members:
+            joined = 'character_id_join_character' in member
+            self.assertEqual(joined, member['character_id'] in ids)
+
+    async def test_prepared_query(self) -> None:
+        """Test requests for prepared and bound queries."""
+        world_id = self.standin.collections['world'][0]['world_id']
+        prepared = PreparedQuery(Query('world'), id='world_id')
+        data = await self.client.request(prepared.bind(id=world_id))
+        query = Query('world', service_id=self.client.service_id,
+                      world_id=world_id)
+        self.assertEqual(data, await self.client.request(query))
+        proxy = auraxium.InstanceProxy.by_id(
+            ps2.World, int(world_id), client=self.client)
+        world = await proxy
+        assert world is not None
+        self.assertEqual(world.id, int(world_id))
+        self.assertEqual(proxy.query.url(), query.url())
+        # Changes to the materialised query apply to later requests
+        self.assertIs(proxy.query, proxy.query)
+        proxy = auraxium.InstanceProxy.by_id(
+            ps2.World, int(world_id), client=self.client)
+        proxy.query.show('world_id')
+        world = await proxy
+        assert world is not None
+        self.assertSetEqual(set(world.data.model_fields_set), {'world_id'})
+
+    async def test_response_cache(self) -> None:
+        """Test caching of raw responses."""
+        cache = auraxium.ResponseCache(ttl=60.0)
+        cache.set_ttl(0.0, collection='zone')
+        self.client.response_cache = cache
+        requests = self.standin.requests
+        query = Query('world', service_id=self.client.service_id).limit(10)
+        first = await self.client.request(query)
+        second = await self.client.request(query)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.standin.requests, requests + 1)
+        # Collections with no lifetime are not cached
+        zone = Query('zone', service_id=self.client.service_id)
+        _ = await self.client.request(zone)
+        _ = await self.client.request(zone)
+        self.assertEqual(self.standin.requests, requests + 3)
+        # Concurrent requests share a single response
+        cache.clear()
+        results = await asyncio.gather(
+            *(self.client.request(query) for _ in range(5)))
+        self.assertEqual(self.standin.requests, requests + 4)
+        self.assertTrue(all(r == first for r in results))
+        self.assertEqual(len({id(r) for r in results}), 5)
+
+    async def test_unknown_collection(self) -> None:
+        """Test the error returned for unknown collections."""
+        with self.assertRaises(auraxium.errors.UnknownCollectionError):
+            await self.client.request(Query('bogus'))
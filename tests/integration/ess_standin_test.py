@@ -0,0 +1,37 @@
+"""Test the event client against the local ESS stand-in server."""
+
+import asyncio
+import unittest
+
+from auraxium import event
+from tools.ess_server import StandInServer
+
+
+class TestStandInServer(unittest.IsolatedAsyncioTestCase):
+    """Receive synthetic events through a real websocket connection."""
+
+    async def test_receive_events(self) -> None:
+        """Test subscribed events being received and dispatched."""
+        standin = StandInServer({'Death': 200.0, 'PlayerLogin': 200.0},
+                                worlds=[1, 10])
+        server = await standin.start()
+        port = next(iter(server.sockets)).getsockname()[1]
+        client = event.EventClient(
+            ess_endpoint=f'ws://127.0.0.1:{port}/streaming')
+        received: list[event.Event] = []
+        try:
+            client.add_trigger(event.Trigger(
+                event.Death, worlds=[10], action=received.append))
+            await asyncio.wait_for(client.wait_ready(), timeout=5.0)
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                if len(received) >= 5:
+                    break
+        finally:
+            await client.close()
+            standin.stop()
+            server.close()
+            await server.wait_closed()
+        self.assertGreaterEqual(len(received), 5)
+        self.assertTrue(all(isinstance(e, event.Death) and e.world_id == 10
+                            for e in received))
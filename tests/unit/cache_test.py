@@ -5,7 +5,9 @@ import logging
 import unittest
 from typing import Any
 
-from auraxium._cache import TLRUCache
+import yarl
+
+from auraxium._cache import ResponseCache, TLRUCache
 
 
 class CacheFilter(logging.Filter):
@@ -178,6 +180,83 @@ class TestCacheInterface(unittest.TestCase):
         self.assertDictEqual(cache.items(), test_dict)
 
 
+class TestResponseCache(unittest.TestCase):
+    """Test the class interface of the ResponseCache class."""
+
+    url = yarl.URL('https://census.daybreakgames.com/s:example/get/ps2:v2/'
+                   'leaderboard?name=Kills&c:limit=10')
+
+    def test_key(self) -> None:
+        """Test ResponseCache.key()"""
+        other = yarl.URL(str(self.url).replace('s:example', 's:other'))
+        self.assertEqual(ResponseCache.key(self.url), ResponseCache.key(other))
+        self.assertEqual(
+            ResponseCache.key(self.url),
+            'https://census.daybreakgames.com/get/ps2:v2/'
+            'leaderboard?name=Kills&c:limit=10')
+
+    def test_get(self) -> None:
+        """Test ResponseCache.add() and ResponseCache.get()"""
+        cache = ResponseCache()
+        self.assertIsNone(cache.get(self.url))
+        data = {'leaderboard_list': [{'character_id': '1'}], 'returned': 1}
+        cache.add(self.url, data)
+        self.assertIn(self.url, cache)
+        cached = cache.get(self.url)
+        self.assertEqual(cached, data)
+        # Every hit returns a new copy
+        self.assertIsNot(cached, data)
+        assert cached is not None
+        cached['returned'] = 0
+        self.assertEqual(cache.get(self.url), data)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_lifetime(self) -> None:
+        """Test ResponseCache.lifetime() and ResponseCache.set_ttl()"""
+        cache = ResponseCache(ttl=10.0)
+        count = yarl.URL(str(self.url).replace('/get/', '/count/'))
+        self.assertEqual(cache.lifetime(self.url), 10.0)
+        cache.set_ttl(20.0, verb='count')
+        self.assertEqual(cache.lifetime(count), 20.0)
+        cache.set_ttl(30.0, collection='leaderboard')
+        self.assertEqual(cache.lifetime(self.url), 30.0)
+        self.assertEqual(cache.lifetime(count), 30.0)
+        cache.set_ttl(40.0, collection='leaderboard', verb='count')
+        self.assertEqual(cache.lifetime(count), 40.0)
+        with self.assertRaises(ValueError):
+            cache.set_ttl(1.0)
+        # Responses with no lifetime are not cached
+        cache.set_ttl(0.0, collection='leaderboard', verb='get')
+        cache.add(self.url, {'returned': 0})
+        self.assertNotIn(self.url, cache)
+
+    def test_expired(self) -> None:
+        """Test expiration of cached responses"""
+        cache = ResponseCache()
+        cache.add(self.url, {'returned': 0})
+        # pylint: disable=protected-access
+        key = cache.key(self.url)
+        cache._data[key] = (0.0, cache._data[key][1])
+        self.assertNotIn(self.url, cache)
+        self.assertEqual(cache.remove_expired(), 1)
+        self.assertIsNone(cache.get(self.url))
+
+    def test_lru(self) -> None:
+        """Test the LRU size bound of the cache"""
+        cache = ResponseCache(size=2)
+        urls = [self.url.update_query(c=str(i)) for i in range(3)]
+        cache.add(urls[0], {'returned': 0})
+        cache.add(urls[1], {'returned': 1})
+        _ = cache.get(urls[0])
+        cache.add(urls[2], {'returned': 2})
+        self.assertEqual(len(cache), 2)
+        self.assertIn(urls[0], cache)
+        self.assertNotIn(urls[1], cache)
+        with self.assertRaises(ValueError):
+            ResponseCache(size=0)
+
+
 def _age_up(cache: TLRUCache[Any, Any], item: int, age: float) -> None:
     """Set a cache item's age to the given number of seconds.
 
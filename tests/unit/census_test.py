@@ -243,6 +243,71 @@ class TestQueryInterface(unittest.TestCase):
         comparison = yarl.URL(f'{ENDPOINT}s:example/get/ps2:v2')
         self.assertEqual(url, comparison)
 
+    def test_url_template(self) -> None:
+        """Test Query.url_template()"""
+        query = census.Query('character', name__first_lower='higby')
+        query.show('name', 'faction_id').limit(10)
+        query.create_join('outfit_member').set_inject_at('outfit')
+        template = query.url_template()
+        self.assertIsInstance(template, census.URLTemplate)
+        self.assertEqual(template.url(), query.url())
+        url = template.url(census.SearchTerm('battle_rank.value', 100),
+                           faction_id='<3', world__name='Ém & Co+')
+        query.add_term('battle_rank.value', 100)
+        query.add_term('faction_id', '<3', parse_modifier=True)
+        query.add_term('world.name', 'Ém & Co+')
+        self.assertEqual(url, query.url())
+        self.assertEqual(str(url), str(query.url()))
+        # Templates are not affected by later changes to the query
+        self.assertNotEqual(template.url(), query.url())
+        self.assertEqual(census.Query().url_template().url(),
+                         census.Query().url())
+        self.assertEqual(census.Query('item').url_template('count').url(),
+                         census.Query('item').url('count'))
+
+
+class TestPreparedQueryInterface(unittest.TestCase):
+    """Test the class interface of the PreparedQuery class."""
+
+    def test_bind(self) -> None:
+        """Test PreparedQuery.bind()"""
+        query = census.Query('characters_item', service_id='s:test')
+        query.limit(5000).create_join('item').set_fields('item_id')
+        prepared = census.PreparedQuery(query, id='character_id')
+        prepared.add_placeholder(
+            'min_id', 'item_id', census.SearchModifier.GREATER_THAN)
+        bound = prepared.bind(id=123, min_id=456)
+        self.assertTupleEqual(bound.values, (123, 456))
+        self.assertEqual(bound, prepared.bind(min_id=456, id=123))
+        self.assertEqual(hash(bound), hash(prepared.bind(id=123, min_id=456)))
+        self.assertNotEqual(bound, prepared.bind(id=123, min_id=789))
+        self.assertEqual(len({bound, prepared.bind(id=123, min_id=456)}), 1)
+        # The bound query is equivalent to adding the terms manually
+        query.add_term('character_id', 123)
+        query.add_term('item_id', '>456', parse_modifier=True)
+        self.assertEqual(bound.url(), query.url())
+        self.assertEqual(bound.query().url(), query.url())
+        self.assertEqual(bound.url('count'), query.url('count'))
+        # The prepared query is independent of the original
+        self.assertEqual(len(prepared.query.data.terms), 0)
+        with self.assertRaises(ValueError):
+            prepared.bind(id=123)
+        with self.assertRaises(ValueError):
+            prepared.bind(id=123, min_id=456, other=789)
+        with self.assertRaises(ValueError):
+            prepared.add_placeholder('id', 'outfit_id')
+
+    def test_url(self) -> None:
+        """Test BoundQuery.url() with a custom service ID and endpoint"""
+        prepared = census.PreparedQuery(census.Query('world'), id='world_id')
+        bound = prepared.bind(id=1)
+        url = bound.url(service_id='s:test', endpoint=endpoints.DBG_CENSUS)
+        self.assertEqual(
+            url, census.Query('world', service_id='s:test', world_id=1).url())
+        url = bound.url(endpoint=endpoints.SANCTUARY_CENSUS)
+        self.assertEqual(url.path, '/get/ps2:v2/world')
+        self.assertIs(prepared.template(), prepared.template())
+
 
 class TestJoinedQueryInterface(unittest.TestCase):
     """Test the class interface of the JoinedQuery class."""
@@ -0,0 +1,683 @@
+"""Unit tests for the event client's trigger dispatching."""
+
+import asyncio
+import datetime
+import json
+import os
+import tempfile
+import time
+import unittest
+from typing import Any
+
+import auraxium
+from auraxium import event, ps2
+from auraxium.census import Query
+from auraxium.event._backfill import backfill, convert_payload
+from auraxium.event._connection import split_subscription
+
+
+def death_evt_factory(attacker: int = 1, victim: int = 2,
+                      world: int = 1) -> event.Death:
+    """Create a death event."""
+    timestamp: Any = int(datetime.datetime.now(
+        datetime.timezone.utc).timestamp())
+    return event.Death(
+        event_name='Death', timestamp=timestamp, world_id=world,
+        attacker_character_id=attacker, attacker_fire_mode_id=0,
+        attacker_loadout_id=0, attacker_vehicle_id=0, attacker_weapon_id=0,
+        attacker_team_id=2, character_id=victim, character_loadout_id=0,
+        is_critical=False, is_headshot=False, team_id=1, vehicle_id=0,
+        zone_id=2)
+
+
+def experience_msg_factory(character_id: int = 1,
+                           experience_id: int = 1) -> str:
+    """Return a raw GainExperience event message."""
+    return json.dumps({
+        'service': 'event', 'type': 'serviceMessage', 'payload': {
+            'event_name': 'GainExperience', 'timestamp': '1700000000',
+            'world_id': '1', 'zone_id': '2',
+            'character_id': str(character_id), 'amount': '10',
+            'experience_id': str(experience_id), 'loadout_id': '1',
+            'other_id': '0'}})
+
+
+class EventClientTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base class providing an offline event client."""
+
+    client: auraxium.EventClient
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.client = auraxium.EventClient()
+        # Prevent the client from connecting to the live endpoint
+        self.client._open = True  # pylint: disable=protected-access
+
+    async def asyncTearDown(self) -> None:
+        # pylint: disable=protected-access
+        self.client._open = False
+        await self.client.close()
+        await super().asyncTearDown()
+
+
+class TestBatchTrigger(EventClientTestCase):
+    """Test the batched delivery of events."""
+
+    async def test_flush_on_size(self) -> None:
+        """Test batches being flushed once they are full."""
+        batches: list[list[event.Event]] = []
+        trigger = event.BatchTrigger(
+            event.Death, batch_size=3, batch_window=0.0,
+            action=batches.append)
+        self.client.add_trigger(trigger)
+        for _ in range(7):
+            self.client.dispatch(death_evt_factory())
+        await asyncio.sleep(0)
+        self.assertListEqual([len(b) for b in batches], [3, 3])
+        self.assertEqual(len(trigger.buffer), 1)
+
+    async def test_flush_on_window(self) -> None:
+        """Test partial batches being flushed after the window expires."""
+        batches: list[list[event.Event]] = []
+        trigger = event.BatchTrigger(
+            event.Death, batch_size=100, batch_window=0.01,
+            action=batches.append)
+        self.client.add_trigger(trigger)
+        self.client.dispatch(death_evt_factory())
+        self.client.dispatch(death_evt_factory())
+        await asyncio.sleep(0.05)
+        self.assertListEqual([len(b) for b in batches], [2])
+
+    async def test_flush_on_remove(self) -> None:
+        """Test pending batches being delivered when removing a trigger."""
+        batches: list[list[event.Event]] = []
+
+        @self.client.batch_trigger(event.Death, batch_size=10)
+        async def on_deaths(events: list[event.Event]) -> None:
+            batches.append(events)
+        _ = on_deaths
+
+        self.client.dispatch(death_evt_factory())
+        self.client.remove_trigger('on_deaths', keep_websocket_alive=True)
+        await asyncio.sleep(0)
+        self.assertListEqual([len(b) for b in batches], [1])
+
+    async def test_single_shot(self) -> None:
+        """Test single-shot batch triggers removing themselves."""
+        trigger = event.BatchTrigger(
+            event.Death, batch_size=2, single_shot=True,
+            action=lambda _: None)
+        self.client.add_trigger(trigger)
+        self.client.dispatch(death_evt_factory())
+        self.assertListEqual(self.client.triggers, [trigger])
+        self.client.dispatch(death_evt_factory())
+        self.assertListEqual(self.client.triggers, [])
+
+    async def test_flush_on_close(self) -> None:
+        """Test all pending batches being delivered when closing."""
+        batches: list[str] = []
+        for name in ('a', 'b'):
+            self.client.add_trigger(event.BatchTrigger(
+                event.Death, name=name, batch_size=10, single_shot=True,
+                action=lambda _, n=name: batches.append(n)))
+        self.client.dispatch(death_evt_factory())
+        await self.client.close()
+        await asyncio.sleep(0)
+        self.assertListEqual(sorted(batches), ['a', 'b'])
+        self.assertListEqual(self.client.triggers, [])
+
+    def test_invalid_size(self) -> None:
+        """Test the batch size validation."""
+        with self.assertRaises(ValueError):
+            event.BatchTrigger(event.Death, batch_size=0)
+
+
+class TestConcurrencyLimits(EventClientTestCase):
+    """Test the per-trigger call-back limits."""
+
+    async def _blocking_trigger(self, **kwargs: Any
+                                ) -> tuple[auraxium.Trigger, asyncio.Event,
+                                           list[event.Event]]:
+        """Add a trigger whose action blocks until released."""
+        release = asyncio.Event()
+        received: list[event.Event] = []
+
+        async def action(evt: event.Event) -> None:
+            received.append(evt)
+            await release.wait()
+
+        trigger = auraxium.Trigger(event.Death, action=action, **kwargs)
+        self.client.add_trigger(trigger)
+        return trigger, release, received
+
+    async def test_max_running(self) -> None:
+        """Test call-backs waiting for a free slot."""
+        trigger, release, received = await self._blocking_trigger(
+            max_running=2)
+        for _ in range(5):
+            self.client.dispatch(death_evt_factory())
+        await asyncio.sleep(0)
+        self.assertEqual(len(received), 2)
+        self.assertEqual(trigger.stats.running, 2)
+        self.assertEqual(trigger.stats.queued, 3)
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertEqual(len(received), 5)
+        self.assertEqual(trigger.stats.completed, 5)
+        self.assertEqual(trigger.stats.queued, 0)
+        self.assertEqual(trigger.stats.running, 0)
+
+    async def test_drop_newest(self) -> None:
+        """Test the default overflow policy."""
+        trigger, release, received = await self._blocking_trigger(
+            max_running=1, max_queued=1)
+        events = [death_evt_factory(attacker=i) for i in range(4)]
+        for evt in events:
+            self.client.dispatch(evt)
+        self.assertEqual(trigger.stats.dropped, 2)
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertListEqual(received, events[:2])
+
+    async def test_drop_oldest(self) -> None:
+        """Test discarding the oldest queued event."""
+        trigger, release, received = await self._blocking_trigger(
+            max_running=1, max_queued=1,
+            overflow=event.OverflowPolicy.DROP_OLDEST)
+        events = [death_evt_factory(attacker=i) for i in range(4)]
+        for evt in events:
+            self.client.dispatch(evt)
+        self.assertEqual(trigger.stats.dropped, 2)
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertListEqual(received, [events[0], events[3]])
+
+    def test_invalid_limits(self) -> None:
+        """Test the validation of the concurrency limits."""
+        with self.assertRaises(ValueError):
+            auraxium.Trigger(event.Death, max_running=0)
+        with self.assertRaises(ValueError):
+            auraxium.Trigger(event.Death, max_queued=-1)
+
+
+class TestSharding(EventClientTestCase):
+    """Test the distribution of subscriptions across connections."""
+
+    def test_split_subscription(self) -> None:
+        """Test splitting subscription messages by world."""
+        data = {'action': 'subscribe', 'eventNames': ['Death'],
+                'characters': ['all'], 'worlds': ['1', '10', '13', '17']}
+        parts = split_subscription(data, event.ShardKey.WORLD, 2)
+        self.assertListEqual(parts[0]['worlds'], ['10'])
+        self.assertListEqual(parts[1]['worlds'], ['1', '13', '17'])
+        self.assertListEqual(parts[0]['eventNames'], ['Death'])
+        # Unsplittable subscriptions go to the first shard
+        parts = split_subscription(data, event.ShardKey.CHARACTER, 2)
+        self.assertListEqual(list(parts), [0])
+
+    async def test_subscription_routing(self) -> None:
+        """Test subscriptions being queued for the matching shards."""
+        # pylint: disable=protected-access
+        client = auraxium.EventClient(shards=2)
+        try:
+            client._open = True
+            client.add_trigger(auraxium.Trigger(event.Death, worlds=[1, 10]))
+            queued = [[m['worlds'] for m in c._subscription_delta()]
+                      for c in client.connections]
+            self.assertListEqual(queued, [[['10']], [['1']]])
+        finally:
+            client._open = False
+            await client.close()
+
+    async def test_overlapping_shards(self) -> None:
+        """Test events received through multiple shards firing once."""
+        # pylint: disable=protected-access
+        client = auraxium.EventClient(shards=2)
+        try:
+            client._open = True
+            self.assertIsNotNone(client.deduplicator)
+            everywhere: list[event.Event] = []
+            world_1: list[event.Event] = []
+            client.add_trigger(auraxium.Trigger(
+                event.GainExperience, action=everywhere.append))
+            client.add_trigger(auraxium.Trigger(
+                event.GainExperience, worlds=[1], action=world_1.append))
+            # The first shard carries the 'all' subscription, the
+            # second the one for world 1; both receive the event
+            first, second = client.connections
+            client._process_payload(experience_msg_factory(), first)
+            client._process_payload(experience_msg_factory(), second)
+            client._process_payload(experience_msg_factory(2), second)
+            client._process_payload(experience_msg_factory(2), first)
+            await asyncio.sleep(0)
+            self.assertEqual(len(everywhere), 2)
+            self.assertEqual(len(world_1), 2)
+        finally:
+            client._open = False
+            await client.close()
+
+    async def test_subscription_delta(self) -> None:
+        """Test only changes to the subscription being sent."""
+        # pylint: disable=protected-access
+        connection = self.client.connections[0]
+        first = auraxium.Trigger(event.Death, characters=[1, 2])
+        self.client.add_trigger(first)
+        self.client.add_trigger(auraxium.Trigger(
+            event.Death, characters=[2, 3]))
+        # Both triggers are combined into a single message
+        message, = connection._subscription_delta()
+        self.assertEqual(message['action'], 'subscribe')
+        self.assertListEqual(message['characters'], ['1', '2', '3'])
+        self.assertListEqual(message['eventNames'], ['Death'])
+        self.assertListEqual(connection._subscription_delta(), [])
+        # Removing a trigger only clears the values no longer needed
+        self.client.remove_trigger(first, keep_websocket_alive=True)
+        message, = connection._subscription_delta()
+        self.assertDictEqual(message, {
+            'action': 'clearSubscribe', 'service': 'event',
+            'characters': ['1']})
+        # Adding and removing a trigger in quick succession is a no-op
+        trigger = auraxium.Trigger(event.GainExperience, characters=[4])
+        self.client.add_trigger(trigger)
+        self.client.remove_trigger(trigger, keep_websocket_alive=True)
+        self.assertListEqual(connection._subscription_delta(), [])
+
+    async def test_websocket_attribute(self) -> None:
+        """Test the websocket attribute of the first connection."""
+        connection = self.client.connections[0]
+        self.assertIsNone(self.client.websocket)
+        websocket: Any = object()
+        self.client.websocket = websocket
+        self.assertIs(connection.websocket, websocket)
+        self.assertIs(self.client.websocket, websocket)
+        self.client.websocket = None
+        self.assertIsNone(connection.websocket)
+
+    async def test_invalid_shards(self) -> None:
+        """Test the shard count validation."""
+        with self.assertRaises(ValueError):
+            auraxium.EventClient(shards=0)
+
+
+class TestDeduplication(EventClientTestCase):
+    """Test the deduplication of events from redundant connections."""
+
+    def test_deduplicator(self) -> None:
+        """Test repeated events from the same source being kept."""
+        dedup = event.Deduplicator(window=10.0)
+        payload: Any = {'event_name': 'Death', 'timestamp': '1'}
+        self.assertTrue(dedup.accept(payload, 'a'))
+        self.assertFalse(dedup.accept(payload, 'b'))
+        self.assertTrue(dedup.accept(payload, 'a'))
+        self.assertFalse(dedup.accept(payload, 'b'))
+        self.assertEqual(dedup.duplicates, 2)
+        dedup.window = -1.0
+        self.assertTrue(dedup.accept({'event_name': 'Death'}, 'b'))
+        self.assertEqual(len(dedup), 1)
+
+    async def test_redundant_connections(self) -> None:
+        """Test events being dispatched once across two connections."""
+        # pylint: disable=protected-access
+        client = auraxium.EventClient(
+            ess_endpoint=['wss://a.example', 'wss://b.example'],
+            redundancy=2)
+        try:
+            client._open = True
+            self.assertEqual(len(client.connections), 2)
+            self.assertSetEqual(
+                {str(c.endpoint) for c in client.connections},
+                {'wss://a.example', 'wss://b.example'})
+            received: list[event.Event] = []
+            client.add_trigger(auraxium.Trigger(
+                event.GainExperience, action=received.append))
+            first, second = client.connections
+            client._process_payload(experience_msg_factory(), first)
+            client._process_payload(experience_msg_factory(), second)
+            client._process_payload(experience_msg_factory(2), second)
+            client._process_payload(experience_msg_factory(2), first)
+            await asyncio.sleep(0)
+            self.assertEqual(len(received), 2)
+        finally:
+            client._open = False
+            await client.close()
+
+
+class TestBackfill(EventClientTestCase):
+    """Test the recovery of events missed during a disconnect."""
+
+    _death: dict[str, Any] = {
+        'attacker_character_id': '1', 'attacker_fire_mode_id': '7',
+        'attacker_vehicle_id': '0', 'attacker_weapon_id': '80',
+        'character_id': '2', 'character_loadout_id': '4',
+        'is_critical': '0', 'is_headshot': '1', 'timestamp': '1700000005',
+        'world_id': '1', 'zone_id': '2', 'table_type': 'deaths'}
+
+    def test_convert_payload(self) -> None:
+        """Test converting REST event payloads to event models."""
+        death = convert_payload(self._death)
+        assert isinstance(death, event.Death)
+        self.assertTrue(death.is_headshot)
+        self.assertEqual(death.team_id, 0)
+        control = convert_payload({
+            'duration_held': '3600', 'facility_id': '1000',
+            'faction_new': '2', 'faction_old': '3', 'outfit_id': '0',
+            'timestamp': '1700000000', 'world_id': '1', 'zone_id': '2',
+            'table_type': 'facility_control'})
+        assert isinstance(control, event.FacilityControl)
+        self.assertEqual(control.new_faction_id, 2)
+        self.assertEqual(control.old_faction_id, 3)
+        self.assertIsNone(convert_payload({'table_type': 'achievements'}))
+
+    async def test_backfill(self) -> None:
+        """Test the queries run to recover missed events."""
+        queries: list[Query] = []
+        death = self._death
+
+        class StandIn:
+            """Stand-in for a Client, not worth building a real mock for."""
+
+            service_id = 's:example'
+
+            async def request(self, query: Query) -> Any:
+                """Record the query and return a fixed response."""
+                queries.append(query)
+                collection = query.data.collection
+                if collection == 'characters_event':
+                    # Kills are returned for both the victim and attacker
+                    return {f'{collection}_list': [death, death]}
+                return {f'{collection}_list': []}
+
+        subscriptions = [
+            {'eventNames': ['Death', 'PlayerLogin'], 'characters': ['1', '2']},
+            {'eventNames': ['FacilityControl'], 'worlds': ['1']}]
+        events = await backfill(StandIn(), subscriptions,  # type: ignore
+                                1700000000.5, 1700000010.5)
+        self.assertEqual(len(events), 1)
+        self.assertListEqual(
+            [q.data.collection for q in queries],
+            ['characters_event', 'world_event'])
+        terms = {t.field: t.value for t in queries[0].data.terms}
+        self.assertEqual(terms['type'], 'DEATH,KILL')
+        self.assertEqual(terms['after'], 1699999999)
+        self.assertEqual(terms['before'], 1700000011)
+
+    async def test_hold_live_events(self) -> None:
+        """Test live events being held back while backfilling."""
+        # pylint: disable=protected-access
+        received: list[event.Event] = []
+        self.client.add_trigger(auraxium.Trigger(
+            event.Death, action=received.append))
+        connection = self.client.connections[0]
+        self.client._backfilling[connection.shard] = [death_evt_factory(3)]
+        self.client._process_payload(json.dumps({
+            'service': 'event', 'type': 'serviceMessage',
+            'payload': {**self._death, 'event_name': 'Death',
+                        'attacker_loadout_id': '1', 'attacker_team_id': '1',
+                        'team_id': '2'}}), connection)
+        await asyncio.sleep(0)
+        self.assertListEqual(received, [])
+        self.assertEqual(len(self.client._backfilling[connection.shard]), 2)
+        # Nothing to recover for a trigger without characters, so this
+        # only releases the held events in timestamp order
+        await self.client._backfill_gap(connection.shard, 0.0, 1.0)
+        await asyncio.sleep(0)
+        self.assertListEqual([e.attacker_character_id for e in received
+                              if isinstance(e, event.Death)], [1, 3])
+        self.assertDictEqual(self.client._backfilling, {})
+
+    async def test_boundary_events(self) -> None:
+        """Test events at the edges of a gap not being delivered twice."""
+        # pylint: disable=protected-access
+        death = self._death
+        received: list[event.Event] = []
+
+        async def request(query: Query) -> Any:
+            """Return the events at both edges and one within the gap."""
+            collection = query.data.collection
+            return {f'{collection}_list': [
+                {**death, 'attacker_character_id': '3',
+                 'timestamp': '1700000011'},
+                {**death, 'attacker_character_id': '4',
+                 'timestamp': '1700000008'},
+                death]}
+
+        def live(attacker: int, timestamp: int) -> str:
+            """Return an event stream message for a death."""
+            return json.dumps({
+                'service': 'event', 'type': 'serviceMessage',
+                'payload': {**death, 'event_name': 'Death',
+                            'attacker_character_id': str(attacker),
+                            'timestamp': str(timestamp),
+                            'attacker_loadout_id': '1',
+                            'attacker_team_id': '1', 'team_id': '2'}})
+
+        self.client.request = request  # type: ignore
+        self.client.backfill = True
+        self.client.add_trigger(auraxium.Trigger(
+            event.Death, characters=[1, 2], action=received.append))
+        connection = self.client.connections[0]
+        # Dispatched live in the second before the disconnect
+        self.client._process_payload(live(1, 1700000005), connection)
+        # Held back in the second after the reconnect
+        self.client._backfilling[connection.shard] = []
+        self.client._process_payload(live(3, 1700000011), connection)
+        await self.client._backfill_gap(
+            connection.shard, 1700000005.5, 1700000010.5)
+        await asyncio.sleep(0)
+        self.assertListEqual([e.attacker_character_id for e in received
+                              if isinstance(e, event.Death)], [1, 4, 3])
+        # The live copies are kept over the recovered ones
+        held = received[-1]
+        assert isinstance(held, event.Death)
+        self.assertEqual(held.team_id, 2)
+
+
+class TestEnrichment(EventClientTestCase):
+    """Test the resolution of objects referenced by events."""
+
+    queries: list[Query]
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        ps2.Experience._cache.clear()  # pylint: disable=protected-access
+        self.queries = []
+        path = os.path.join(os.path.dirname(__file__), '..', 'data', 'rest',
+                            'datatype_payloads', 'experience.json')
+        with open(path, encoding='utf-8') as file_:
+            payloads = json.load(file_)['experience_list']
+
+        async def request(query: Query, verb: str = 'get') -> Any:
+            _ = verb
+            self.queries.append(query)
+            await asyncio.sleep(0.01)
+            ids = str(query.data.terms[0].value).split(',')
+            return {'experience_list': [
+                p for p in payloads if p['experience_id'] in ids]}
+
+        self.client.request = request  # type: ignore
+
+    async def test_resolve(self) -> None:
+        """Test references being resolved with one query per type."""
+        enricher = event.Enricher(
+            self.client, fields={'experience_id': ps2.Experience})
+        events = [self._event(i) for i in (1, 2, 2, 9999)]
+        await enricher.resolve(events)
+        self.assertEqual(len(self.queries), 1)
+        experience = events[1].refs['experience_id']
+        assert isinstance(experience, ps2.Experience)
+        self.assertEqual(experience.id, 2)
+        self.assertIs(events[2].refs['experience_id'], experience)
+        self.assertIsNone(events[3].refs['experience_id'])
+        # Cached objects do not require another query
+        await enricher.resolve([self._event(1)])
+        self.assertEqual(len(self.queries), 1)
+
+    def test_refs(self) -> None:
+        """Test the references of an event only being stored if used."""
+        # pylint: disable=protected-access
+        evt = self._event(1)
+        with self.assertRaises(AttributeError):
+            _ = evt._refs
+        self.assertDictEqual(evt.refs, {})
+        evt.refs['experience_id'] = None
+        self.assertIs(evt.refs, evt._refs)
+        self.assertEqual(evt, self._event(1))
+
+    async def test_shared_lookups(self) -> None:
+        """Test concurrent batches sharing lookups in progress."""
+        enricher = event.Enricher(
+            self.client, fields={'experience_id': ps2.Experience})
+        first, second = self._event(3), self._event(3)
+        await asyncio.gather(enricher.resolve([first]),
+                             enricher.resolve([second]))
+        self.assertEqual(len(self.queries), 1)
+        self.assertIs(first.refs['experience_id'],
+                      second.refs['experience_id'])
+
+    async def test_callback_errors(self) -> None:
+        """Test failing call-backs not affecting other events."""
+        received: list[int] = []
+
+        def callback(evt: event.Event) -> None:
+            assert isinstance(evt, event.GainExperience)
+            if evt.experience_id == 1:
+                raise RuntimeError('Trigger condition failed')
+            received.append(evt.experience_id)
+
+        enricher = event.Enricher(
+            self.client, fields={}, max_batch=2, callback=callback)
+        with self.assertLogs('auraxium.ess', 'ERROR'):
+            for experience_id in (1, 2, 3, 4):
+                enricher.submit(self._event(experience_id))
+            await enricher.flush()
+        self.assertListEqual(received, [2, 3, 4])
+
+    async def test_client_enrichment(self) -> None:
+        """Test events being resolved before dispatch."""
+        # pylint: disable=protected-access
+        client = auraxium.EventClient(enrich=True)
+        client._open = True
+        client.request = self.client.request  # type: ignore
+        assert client.enricher is not None
+        client.enricher.fields = {'experience_id': ps2.Experience}
+        received: list[event.Event] = []
+        client.add_trigger(auraxium.Trigger(
+            event.GainExperience, action=received.append))
+        for experience_id in (4, 5, 4):
+            client._process_payload(experience_msg_factory(1, experience_id))
+        await asyncio.sleep(0)
+        self.assertListEqual(received, [])
+        await client.enricher.flush()
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.queries), 1)
+        self.assertListEqual(
+            [e.refs['experience_id'].id for e in received], [4, 5, 4])
+        client._open = False
+        await client.close()
+
+    @staticmethod
+    def _event(experience_id: int) -> event.GainExperience:
+        """Create an experience event."""
+        payload = json.loads(experience_msg_factory(1, experience_id))
+        return event.GainExperience(**payload['payload'])
+
+
+class TestMetrics(EventClientTestCase):
+    """Test the event processing metrics."""
+
+    async def test_snapshot(self) -> None:
+        """Test the counters and timings of a snapshot."""
+        self.client.add_trigger(auraxium.Trigger(
+            event.GainExperience, action=lambda _: None, name='xp',
+            max_running=1))
+        for _ in range(3):
+            self.client._process_payload(  # pylint: disable=protected-access
+                experience_msg_factory())
+        snapshot = self.client.metrics.snapshot()
+        self.assertEqual(snapshot.messages, 3)
+        self.assertEqual(snapshot.events, 3)
+        self.assertGreater(snapshot.event_rate, 0.0)
+        self.assertGreater(snapshot.decode_time, 0.0)
+        self.assertGreater(snapshot.dispatch_time, 0.0)
+        # The recorded messages use a fixed timestamp in the past
+        self.assertGreater(snapshot.event_age[50], 1000.0)
+        self.assertDictEqual(snapshot.queue_depths, {'xp': 2})
+        await asyncio.sleep(0.01)
+        snapshot = self.client.metrics.snapshot()
+        self.assertEqual(snapshot.events, 0)
+        self.assertDictEqual(snapshot.event_age, {})
+        self.assertListEqual(list(snapshot.callback_times), ['xp'])
+
+    async def test_periodic_reports(self) -> None:
+        """Test snapshots being passed to a call-back periodically."""
+        snapshots: list[event.MetricsSnapshot] = []
+        self.client.metrics.start(snapshots.append, interval=0.01)
+        await asyncio.sleep(0.05)
+        self.client.metrics.stop()
+        count = len(snapshots)
+        self.assertGreater(count, 1)
+        await asyncio.sleep(0.03)
+        self.assertEqual(len(snapshots), count)
+        with self.assertRaises(ValueError):
+            self.client.metrics.start(snapshots.append, interval=0.0)
+
+
+class TestReplay(EventClientTestCase):
+    """Test recording and replaying raw event stream messages."""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        handle, self.path = tempfile.mkstemp(suffix='.jsonl.gz')
+        os.close(handle)
+
+    async def asyncTearDown(self) -> None:
+        os.remove(self.path)
+        await super().asyncTearDown()
+
+    async def test_record_and_replay(self) -> None:
+        """Test replaying messages recorded by a client."""
+        # pylint: disable=protected-access
+        connection = self.client.connections[0]
+        with event.Recorder(self.path) as recorder:
+            self.client.recorder = recorder
+            for id_ in range(3):
+                self.client._process_payload(
+                    experience_msg_factory(id_), connection)
+            # Replayed messages without a source are not recorded
+            self.client._process_payload(experience_msg_factory())
+        self.client.recorder = None
+        self.assertEqual(recorder.frames, 3)
+        received: list[event.Event] = []
+        self.client.add_trigger(auraxium.Trigger(
+            event.GainExperience, action=received.append))
+        count = await event.replay(self.client, self.path, speed=None)
+        await asyncio.sleep(0)
+        self.assertEqual(count, 3)
+        self.assertListEqual(
+            [e.character_id for e in received
+             if isinstance(e, event.GainExperience)], [0, 1, 2])
+
+    async def test_replay_speed(self) -> None:
+        """Test delays between messages being scaled during replay."""
+        with event.Recorder(self.path) as recorder:
+            recorder.write(experience_msg_factory(), timestamp=100.0)
+            recorder.write(experience_msg_factory(), timestamp=100.2)
+        start = time.perf_counter()
+        await event.replay(self.client, self.path, speed=4.0)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        with self.assertRaises(ValueError):
+            await event.replay(self.client, self.path, speed=0.0)
+
+    def test_truncated(self) -> None:
+        """Test reading a recording with an incomplete final frame."""
+        with event.Recorder(self.path) as recorder:
+            recorder.write('{}', timestamp=1.0)
+            recorder.write('{}', timestamp=2.0)
+        with open(self.path, 'rb') as file_:
+            data = file_.read()
+        with open(self.path, 'wb') as file_:
+            file_.write(data[:-10])
+        self.assertLessEqual(len(list(event.read_frames(self.path))), 2)
@@ -0,0 +1,119 @@
+"""Unit tests for the event correlation operator."""
+
+import unittest
+from typing import Any
+
+from auraxium import event
+
+
+def death_evt_factory(attacker: int, victim: int,
+                      timestamp: float) -> event.Death:
+    """Create a death event."""
+    ts: Any = timestamp
+    return event.Death(
+        event_name='Death', timestamp=ts, world_id=1,
+        attacker_character_id=attacker, attacker_fire_mode_id=0,
+        attacker_loadout_id=0, attacker_vehicle_id=0, attacker_weapon_id=0,
+        attacker_team_id=2, character_id=victim, character_loadout_id=0,
+        is_critical=False, is_headshot=False, team_id=1, vehicle_id=0,
+        zone_id=2)
+
+
+def _mutual(**kwargs: Any) -> event.Correlator:
+    """Return a correlator detecting mutual deaths."""
+    return event.Correlator(
+        5.0, index=lambda e: (getattr(e, 'attacker_character_id'),
+                              getattr(e, 'character_id')),
+        probe=lambda e: (getattr(e, 'character_id'),
+                         getattr(e, 'attacker_character_id')),
+        **kwargs)
+
+
+class TestCorrelator(unittest.TestCase):
+    """Test pairing related events."""
+
+    def test_match(self) -> None:
+        """Test matching events being paired and consumed."""
+        pairs: list[tuple[event.Event, event.Event]] = []
+        correlator = _mutual(on_match=lambda a, b: pairs.append((a, b)))
+        first = death_evt_factory(1, 2, 1000.0)
+        second = death_evt_factory(2, 1, 1003.0)
+        self.assertIsNone(correlator.add(first))
+        self.assertIsNone(correlator.add(death_evt_factory(3, 4, 1001.0)))
+        self.assertIs(correlator.add(second), first)
+        self.assertListEqual(pairs, [(first, second)])
+        self.assertEqual(len(correlator), 1)
+        # The first kill was consumed by the match
+        self.assertIsNone(correlator.add(death_evt_factory(2, 1, 1004.0)))
+        self.assertEqual(correlator.matches, 1)
+
+    def test_window(self) -> None:
+        """Test events outside the window not being matched."""
+        correlator = _mutual()
+        correlator.add(death_evt_factory(1, 2, 1000.0))
+        self.assertIsNone(correlator.add(death_evt_factory(2, 1, 1006.0)))
+        # The first event expired, the second one is now indexed instead
+        self.assertEqual(len(correlator), 1)
+
+    def test_max_size(self) -> None:
+        """Test the oldest events being evicted when full."""
+        correlator = _mutual(max_size=2)
+        for attacker in range(3):
+            correlator.add(death_evt_factory(attacker, 10, 1000.0))
+        self.assertEqual(len(correlator), 2)
+        self.assertIsNone(correlator.add(death_evt_factory(10, 0, 1001.0)))
+        self.assertIsNotNone(correlator.add(death_evt_factory(10, 2, 1001.0)))
+
+    def test_evict_consumed(self) -> None:
+        """Test evictions skipping consumed events with the same key."""
+        correlator = _mutual(max_size=2)
+        correlator.add(death_evt_factory(1, 2, 1000.0))
+        self.assertIsNotNone(correlator.add(death_evt_factory(2, 1, 1000.0)))
+        # Another kill with the same key and timestamp
+        correlator.add(death_evt_factory(1, 2, 1000.0))
+        correlator.add(death_evt_factory(3, 2, 1000.0))
+        correlator.add(death_evt_factory(4, 2, 1000.0))
+        latest = death_evt_factory(1, 2, 1000.0)
+        correlator.add(latest)
+        self.assertEqual(len(correlator), 2)
+        self.assertIsNone(correlator.add(death_evt_factory(2, 3, 1001.0)))
+        self.assertIs(correlator.add(death_evt_factory(2, 1, 1001.0)), latest)
+
+    def test_clear(self) -> None:
+        """Test clearing the correlator resetting its window."""
+        correlator = _mutual()
+        correlator.add(death_evt_factory(1, 2, 2000.0))
+        correlator.clear()
+        self.assertEqual(len(correlator), 0)
+        # Earlier timestamps, e.g. from a replay, are indexed again
+        first = death_evt_factory(1, 2, 1000.0)
+        correlator.add(first)
+        self.assertEqual(len(correlator), 1)
+        self.assertIs(correlator.add(death_evt_factory(2, 1, 1001.0)), first)
+
+    def test_skip(self) -> None:
+        """Test key functions returning None to skip events."""
+        correlator = event.Correlator(
+            30.0, index=lambda e: (getattr(e, 'character_id')
+                                   if isinstance(e, event.Death) else None),
+            probe=lambda e: None if isinstance(e, event.Death) else 2,
+            consume=False)
+        death = death_evt_factory(1, 2, 1000.0)
+        correlator.add(death)
+        correlator.add(death_evt_factory(1, 2, 1001.0))
+        self.assertEqual(len(correlator), 2)
+        timestamp: Any = 1010.0
+        revive = event.GainExperience(
+            event_name='GainExperience', timestamp=timestamp, world_id=1,
+            zone_id=2, amount=100, character_id=3, experience_id=7,
+            loadout_id=1, other_id=2)
+        self.assertIs(correlator.add(revive), death)
+        self.assertIs(correlator.add(revive), death)
+        self.assertEqual(len(correlator), 2)
+
+    def test_invalid(self) -> None:
+        """Test the argument validation."""
+        with self.assertRaises(ValueError):
+            event.Correlator(-1.0, index=lambda _: None)
+        with self.assertRaises(ValueError):
+            event.Correlator(1.0, index=lambda _: None, max_size=0)
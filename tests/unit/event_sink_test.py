@@ -0,0 +1,99 @@
+"""Unit tests for the columnar event sink."""
+
+import os
+import tempfile
+import unittest
+from typing import Any, cast
+
+import pydantic
+
+from auraxium import event
+from auraxium.event._sink import _Buffer  # pylint: disable=protected-access
+
+
+def death_evt_factory(attacker: int, timestamp: int,
+                      vehicle_id: int | None = None) -> event.Death:
+    """Create a death event."""
+    time_: Any = timestamp
+    return event.Death(
+        event_name='Death', timestamp=time_, world_id=1,
+        attacker_character_id=attacker, attacker_fire_mode_id=0,
+        attacker_loadout_id=0, attacker_vehicle_id=0, attacker_weapon_id=0,
+        attacker_team_id=2, character_id=2, character_loadout_id=0,
+        is_critical=False, is_headshot=attacker % 2 == 0, team_id=1,
+        vehicle_id=vehicle_id, zone_id=2)
+
+
+class TestColumnarSink(unittest.TestCase):
+    """Test the columnar event sink and reader."""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = self._dir.name
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Test reading back the events written by the sink."""
+        with event.ColumnarSink(self.path, events=[event.Death],
+                                chunk_size=2) as sink:
+            sink.add(death_evt_factory(1, 1700000000, vehicle_id=5))
+            sink.add(death_evt_factory(2, 1700000001))
+            self.assertEqual(sink.rows, 2)
+            sink.add(death_evt_factory(3, 1700000002))
+            self.assertEqual(sink.rows, 2)
+        self.assertEqual(sink.rows, 3)
+        chunks = list(event.read_chunks(sink.path(event.Death)))
+        self.assertListEqual([len(c['timestamp']) for c in chunks], [2, 1])
+        first = chunks[0]
+        self.assertListEqual(list(first['attacker_character_id']), [1, 2])
+        self.assertListEqual(list(first['timestamp']),
+                             [1700000000, 1700000001])
+        self.assertListEqual(list(first['is_headshot']), [False, True])
+        self.assertListEqual(list(first['vehicle_id']), [5, None])
+        self.assertListEqual(list(first['event_name']), ['Death', 'Death'])
+
+    def test_column_selection(self) -> None:
+        """Test reading only a subset of the columns."""
+        with event.ColumnarSink(self.path) as sink:
+            sink.add(death_evt_factory(1, 1700000000))
+        chunk, = event.read_chunks(sink.path('Death'), columns=['zone_id'])
+        self.assertListEqual(list(chunk), ['zone_id'])
+        self.assertListEqual(list(chunk['zone_id']), [2])
+
+    def test_ignored_types(self) -> None:
+        """Test events of other types being ignored."""
+        with event.ColumnarSink(self.path, events=['GainExperience']) as sink:
+            sink.add(death_evt_factory(1, 1700000000))
+        self.assertEqual(sink.rows, 0)
+        self.assertListEqual(os.listdir(self.path), [])
+        self.assertSetEqual(sink.trigger().events, {'GainExperience'})
+
+    def test_nullable_strings(self) -> None:
+        """Test missing values of nullable string columns."""
+
+        class Note(pydantic.BaseModel):
+            """Stand-in for an event type with an optional string."""
+            text: str | None = None
+
+        buffer = _Buffer(cast(type[event.Event], Note))
+        buffer.append(cast(event.Event, Note(text='a')))
+        buffer.append(cast(event.Event, Note()))
+        path = os.path.join(self.path, 'Note.cols')
+        with open(path, 'wb') as file_:
+            file_.write(buffer.encode('Note', 6))
+        chunk, = event.read_chunks(path)
+        self.assertListEqual(list(chunk['text']), ['a', None])
+
+    def test_invalid(self) -> None:
+        """Test invalid sink arguments and files."""
+        with self.assertRaises(ValueError):
+            event.ColumnarSink(self.path, events=['NotAnEvent'])
+        with self.assertRaises(ValueError):
+            event.ColumnarSink(self.path, chunk_size=0)
+        path = os.path.join(self.path, 'invalid.cols')
+        with open(path, 'wb') as file_:
+            file_.write(b'\x00' * 16)
+        with self.assertRaises(ValueError):
+            list(event.read_chunks(path))
@@ -0,0 +1,83 @@
+"""Unit tests for the windowed event aggregations."""
+
+import unittest
+from typing import Any
+
+from auraxium import event
+
+
+def exp_evt_factory(timestamp: float, character: int = 1,
+                    amount: int = 10) -> event.GainExperience:
+    """Create an experience gain event."""
+    ts: Any = timestamp
+    return event.GainExperience(
+        event_name='GainExperience', timestamp=ts, world_id=1, zone_id=2,
+        amount=amount, character_id=character, experience_id=1,
+        loadout_id=1, other_id=0)
+
+
+class TestSlidingWindow(unittest.TestCase):
+    """Test the sliding window aggregation."""
+
+    def test_aggregates(self) -> None:
+        """Test counts, sums and rankings."""
+        window = event.SlidingWindow(60.0, key='character_id', value='amount')
+        for char, amount in ((1, 10), (2, 50), (1, 20), (3, 5)):
+            window.add(exp_evt_factory(1000.0, char, amount))
+        self.assertEqual(window.count(1), 2)
+        self.assertEqual(window.sum(1), 30.0)
+        self.assertEqual(window.count(4), 0)
+        self.assertListEqual(window.top(2), [(1, 2), (2, 1)])
+        self.assertListEqual(window.top(1, by_sum=True), [(2, 50.0)])
+        self.assertAlmostEqual(window.rate(1), 2 / 60.0)
+
+    def test_expiry(self) -> None:
+        """Test events leaving the window."""
+        window = event.SlidingWindow(10.0, key=lambda e: e.world_id)
+        window.add(exp_evt_factory(1000.0))
+        window.add(exp_evt_factory(1005.0))
+        self.assertEqual(window.count(1), 2)
+        window.add(exp_evt_factory(1010.0))
+        self.assertEqual(window.count(1), 2)
+        window.expire(1100.0)
+        self.assertEqual(len(window), 0)
+        self.assertListEqual(window.keys(), [])
+
+    def test_invalid_size(self) -> None:
+        """Test the window size validation."""
+        with self.assertRaises(ValueError):
+            event.SlidingWindow(0.0, key='character_id')
+
+
+class TestTumblingWindow(unittest.TestCase):
+    """Test the tumbling window aggregation."""
+
+    def test_close(self) -> None:
+        """Test windows being closed by later events."""
+        results: list[event.WindowResult] = []
+        window = event.TumblingWindow(
+            60.0, key='character_id', value='amount',
+            on_close=results.append)
+        window.add(exp_evt_factory(1200.0, 1, 10))
+        window.add(exp_evt_factory(1259.0, 2, 30))
+        self.assertListEqual(results, [])
+        window.add(exp_evt_factory(1260.0, 1, 5))
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual((result.start, result.end), (1200.0, 1260.0))
+        self.assertListEqual(result.top(1, by_sum=True), [(2, 30.0)])
+        self.assertEqual(window.sum(1), 5.0)
+        self.assertEqual(window.start, 1260.0)
+
+    def test_late_events(self) -> None:
+        """Test events for closed windows being discarded."""
+        window = event.TumblingWindow(60.0, key='character_id')
+        window.add(exp_evt_factory(1260.0))
+        window.add(exp_evt_factory(1200.0))
+        self.assertEqual(window.late, 1)
+        result = window.flush()
+        assert result is not None
+        self.assertDictEqual(result.counts, {1: 1})
+        self.assertIsNone(window.flush())
+        window.add(exp_evt_factory(1230.0))
+        self.assertEqual(window.late, 2)
@@ -1,13 +1,16 @@
 """Unit tests for basic object model functionality and validation."""
 
+import collections
 import typing
 import unittest
+import unittest.mock
 
 import auraxium
-from auraxium import census, endpoints
+from auraxium import census, endpoints, ps2
+from auraxium.base import Ps2Object
 from auraxium._cache import TLRUCache
 from auraxium.errors import PayloadError
-from auraxium.ps2 import DirectiveTreeCategory, Item, Loadout
+from auraxium.ps2 import DirectiveTreeCategory, Effect, Item, Loadout
 from auraxium.types import LocaleData
 
 
@@ -98,6 +101,18 @@ class TestPs2Object(unittest.TestCase):
         with self.assertRaises(AttributeError):
             _ = loadout.not_a_real_attribute
 
+    def test_slots(self) -> None:
+        """Ensure object types do not use per-instance dictionaries."""
+        loadout = Loadout({
+            'loadout_id': '1', 'profile_id': '2', 'faction_id': '3',
+            'code_name': 'Test'}, client=self.client)
+        with self.assertRaises(TypeError):
+            vars(loadout)
+        for type_ in vars(ps2).values():
+            if isinstance(type_, type) and issubclass(type_, Ps2Object):
+                with self.subTest(type_=type_.__name__):
+                    self.assertNotIn('__dict__', dir(type_))
+
     def test_query_factory(self) -> None:
         """Make sure generated queries match the object parameters."""
         loadout = Loadout({
@@ -106,6 +121,81 @@ class TestPs2Object(unittest.TestCase):
         ref = census.Query('loadout', 'ps2:v2', loadout_id=12)
         self.assertEqual(loadout.query().url(), ref.url())
 
+    def test_proxy_query(self) -> None:
+        """Make sure proxies look up the object they refer to."""
+        effect = Effect({'effect_id': '1', 'effect_type_id': '3',
+                         'resist_type_id': '2'}, client=self.client)
+        proxy = effect.type()
+        ref = census.Query('effect_type', 'ps2:v2', effect_type_id=3)
+        self.assertEqual(proxy.query.url(), ref.url())
+
+    def test_prepared_proxies(self) -> None:
+        """Make sure join proxies share their prepared queries."""
+        loadout = Loadout({
+            'loadout_id': '12', 'profile_id': '2', 'faction_id': '3',
+            'code_name': 'Test'}, client=self.client)
+        # pylint: disable=protected-access
+        proxy = loadout.resist_info()
+        self.assertEqual(proxy._query, loadout.resist_info()._query)
+        ref = census.Query('profile_resist_map', 'ps2:v2', profile_id=2)
+        ref.limit(500).create_join('resist_info').set_fields('resist_info_id')
+        self.assertEqual(proxy.query.url(), ref.url())
+
+    def test_from_payloads(self) -> None:
+        """Test instantiating multiple objects at once."""
+        payloads = [{'loadout_id': str(i), 'profile_id': '2',
+                     'faction_id': '3', 'code_name': f'Test {i}'}
+                    for i in range(3)]
+        loadouts = Loadout.from_payloads(payloads, client=self.client)
+        cache: TLRUCache[int, Loadout] = getattr(Loadout, '_cache')
+        self.assertIs(cache.get(1), loadouts[1])
+        self.assertListEqual([o.id for o in loadouts], [0, 1, 2])
+        self.assertListEqual(
+            loadouts, [Loadout(p, client=self.client) for p in payloads])
+        self.assertEqual(loadouts[2].code_name, 'Test 2')
+        # Invalid payloads raise the same errors as regular instantiation
+        with self.assertRaises(PayloadError):
+            Loadout.from_payloads([*payloads, {'wrong_id': '1'}],
+                                  client=self.client)
+        with self.assertRaises(PayloadError):
+            Loadout.from_payloads([*payloads, {'loadout_id': '4'}],
+                                  client=self.client)
+
+    def test_lazy_validation(self) -> None:
+        """Test deferring payload validation until first access."""
+        Loadout.set_lazy_validation()
+        self.addCleanup(Loadout.set_lazy_validation, False)
+        payload = {'loadout_id': '1', 'profile_id': '2', 'faction_id': '3',
+                   'code_name': 'Test'}
+        loadout = Loadout(payload, client=self.client)
+        self.assertIsNotNone(getattr(loadout, '_raw'))
+        self.assertEqual(loadout.profile_id, 2)
+        self.assertIsNone(getattr(loadout, '_raw'))
+        self.assertEqual(loadout.code_name, 'Test')
+        # Invalid payloads are only reported once used
+        invalid = Loadout({'loadout_id': '4'}, client=self.client)
+        self.assertEqual(invalid.id, 4)
+        with self.assertRaises(PayloadError):
+            _ = invalid.profile_id
+        lazy = Loadout.from_payloads([payload, {'loadout_id': '4'}],
+                                     client=self.client)
+        self.assertListEqual([o.id for o in lazy], [1, 4])
+        self.assertEqual(lazy[0].faction_id, 3)
+        # Partial validation only validates the fields accessed
+        Loadout.set_lazy_validation(partial=True)
+        loadout = Loadout({**payload, 'faction_id': 'invalid'},
+                          client=self.client)
+        self.assertEqual(loadout.profile_id, 2)
+        self.assertIsNotNone(getattr(loadout, '_raw'))
+        with self.assertRaises(PayloadError):
+            _ = loadout.faction_id
+        with self.assertRaises(PayloadError):
+            _ = loadout.data
+        with self.assertRaises(PayloadError):
+            _ = invalid.profile_id
+        with self.assertRaises(AttributeError):
+            _ = Loadout(payload, client=self.client).not_a_real_attribute
+
 
 class TestCachedObject(unittest.TestCase):
     """Test cache modification hooks for cacheable types."""
@@ -148,6 +238,68 @@ class TestNamedObject(unittest.TestCase):
             client=self.client)
         self.assertSequenceEqual(str(cat), 'Test_en')
 
+    def test_localized_fields(self) -> None:
+        """Test conversion of localised strings to LocaleData."""
+        names = {s: f'Test_{s}' for s in LocaleData.model_fields}
+        cat = DirectiveTreeCategory(
+            {'directive_tree_category_id': '12', 'name': names},
+            client=self.client)
+        self.assertIsInstance(cat.name, LocaleData)
+        self.assertEqual(cat.name.de, 'Test_de')
+        # Converted values are reused for subsequent accesses
+        self.assertIs(cat.name, cat.name)
+
+    def test_interning(self) -> None:
+        """Test sharing identical localised strings between objects."""
+        DirectiveTreeCategory.set_interning()
+        self.addCleanup(DirectiveTreeCategory.set_interning, False)
+        names = {s: f'Shared_{s}' for s in LocaleData.model_fields}
+        first, second = (DirectiveTreeCategory(
+            {'directive_tree_category_id': str(i), 'name': dict(names)},
+            client=self.client) for i in (1, 2))
+        self.assertIs(first.data.name, second.data.name)
+        self.assertIs(first.name, second.name)
+        self.assertEqual(first.name.en, 'Shared_en')
+        other = DirectiveTreeCategory(
+            {'directive_tree_category_id': '3',
+             'name': {**names, 'en': 'Other'}}, client=self.client)
+        self.assertIsNot(first.name, other.name)
+        # Payloads are interned before validation, also when validated
+        # lazily or in bulk
+        DirectiveTreeCategory.set_lazy_validation()
+        self.addCleanup(DirectiveTreeCategory.set_lazy_validation, False)
+        lazy = DirectiveTreeCategory(
+            {'directive_tree_category_id': '4', 'name': dict(names)},
+            client=self.client)
+        self.assertIs(lazy.data.name, first.data.name)
+        DirectiveTreeCategory.set_lazy_validation(False)
+        bulk = DirectiveTreeCategory.from_payloads(
+            [{'directive_tree_category_id': '5', 'name': dict(names)}],
+            client=self.client)
+        self.assertIs(bulk[0].data.name, first.data.name)
+
+    def test_intern_limit(self) -> None:
+        """Test the least recently used interned values being dropped."""
+        DirectiveTreeCategory.set_interning()
+        self.addCleanup(DirectiveTreeCategory.set_interning, False)
+
+        def create(index: int) -> DirectiveTreeCategory:
+            """Return a category with a unique localised name."""
+            names = {s: f'Limit_{index}' for s in LocaleData.model_fields}
+            return DirectiveTreeCategory(
+                {'directive_tree_category_id': str(index), 'name': names},
+                client=self.client)
+
+        with unittest.mock.patch('auraxium.base._INTERN_LIMIT', 2), \
+                unittest.mock.patch('auraxium.base._INTERNED',
+                                    collections.OrderedDict()):
+            first, second = create(1), create(2)
+            create(1)
+            # The second value is now the least recently used one
+            create(3)
+            self.assertIs(create(1).data.name, first.data.name)
+            self.assertIsNot(create(2).data.name, second.data.name)
+
 
 class TestImageMixin(unittest.TestCase):
     """Test the ImageMixin helper class interface."""
@@ -0,0 +1,52 @@
+"""Unit tests for the shared payload base classes."""
+
+import unittest
+
+import pydantic
+
+from auraxium.models.base import RESTPayload
+
+
+class Inner(RESTPayload):
+    """Nested payload used for testing."""
+
+    value: int | None
+
+
+class Outer(RESTPayload):
+    """Top-level payload used for testing."""
+
+    name: str | None
+    inner: Inner
+    items: list[Inner] = []
+
+
+class TestRESTPayload(unittest.TestCase):
+    """Test the conversion of NULL strings in REST payloads."""
+
+    def test_top_level(self) -> None:
+        """Test NULL strings being converted at the top level."""
+        payload = Outer.model_validate(
+            {'name': 'NULL', 'inner': {'value': '1'}})
+        self.assertIsNone(payload.name)
+        self.assertEqual(payload.inner.value, 1)
+        payload = Outer.model_validate(
+            {'name': 'Test', 'inner': {'value': '2'}})
+        self.assertEqual(payload.name, 'Test')
+
+    def test_nested(self) -> None:
+        """Test NULL strings being converted in nested payloads."""
+        payload = Outer.model_validate({
+            'name': 'NULL', 'inner': {'value': 'NULL'},
+            'items': [{'value': 'NULL'}, {'value': '3'}]})
+        self.assertIsNone(payload.inner.value)
+        self.assertListEqual([i.value for i in payload.items], [None, 3])
+
+    def test_invalid(self) -> None:
+        """Test non-dict input still failing validation."""
+        for data in ('NULL', None, ['NULL'], 1):
+            with self.subTest(data=data):
+                with self.assertRaises(pydantic.ValidationError):
+                    Outer.model_validate(data)
+        with self.assertRaises(pydantic.ValidationError):
+            Outer.model_validate({'name': 'Test', 'inner': 'NULL'})
@@ -165,6 +165,50 @@ class TriggerTest(unittest.TestCase):
         self.assertSequenceEqual(
             data['logicalAndCharactersWithWorlds'], 'false')
 
+    def test_field_filter(self) -> None:
+        """Test field filters as trigger conditions."""
+        filter_ = auraxium.event.FieldFilter('zone_id', 2, 4)
+        self.assertSetEqual(set(filter_.values), {2, 4})
+        trigger = auraxium.Trigger(
+            auraxium.event.Death, conditions=[filter_])
+        self.assertTrue(trigger.check(self.death_evt_factory(1, 2, 1)))
+        # Missing fields never match
+        trigger = auraxium.Trigger(auraxium.event.Death, conditions=[
+            auraxium.event.FieldFilter('experience_id', 2)])
+        self.assertFalse(trigger.check(self.death_evt_factory(1, 2, 1)))
+
+    def test_filter_pushdown(self) -> None:
+        """Test field filters narrowing the subscription."""
+        field_filter = auraxium.event.FieldFilter
+        trigger = auraxium.Trigger(auraxium.event.Death, conditions=[
+            field_filter('world_id', 1, 17), field_filter('zone_id', 2),
+            field_filter('attacker_character_id', 5, 6)])
+        data = json.loads(trigger.generate_subscription())
+        self.assertListEqual(data['worlds'], ['1', '17'])
+        self.assertListEqual(data['characters'], ['5', '6'])
+        self.assertSequenceEqual(
+            data['logicalAndCharactersWithWorlds'], 'true')
+        # World filters are intersected with the trigger's worlds
+        trigger = auraxium.Trigger(
+            auraxium.event.Death, worlds=[1, 10],
+            conditions=[field_filter('world_id', 10, 13)])
+        data = json.loads(trigger.generate_subscription())
+        self.assertListEqual(data['worlds'], ['10'])
+        # The smaller character list is used
+        trigger = auraxium.Trigger(
+            auraxium.event.Death, characters=[1, 2, 3],
+            conditions=[field_filter('character_id', 4)])
+        data = json.loads(trigger.generate_subscription())
+        self.assertListEqual(data['characters'], ['4'])
+        # Experience IDs are pushed down into the event names
+        trigger = auraxium.Trigger(
+            auraxium.event.GainExperience, auraxium.event.Death,
+            conditions=[field_filter('experience_id', 1, 2)])
+        data = json.loads(trigger.generate_subscription())
+        self.assertSetEqual(set(data['eventNames']), {
+            'Death', 'GainExperience_experience_id_1',
+            'GainExperience_experience_id_2'})
+
     def test_regression_66_string_event_with_world_filter(self) -> None:
         """https://github.com/leonhard-s/auraxium/issues/66"""
         trigger = auraxium.Trigger('ContinentLock', worlds=[1])
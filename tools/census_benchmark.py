@@ -0,0 +1,176 @@
+"""Latency benchmark for the REST client.
+
+This starts the fixture-backed Census stand-in (see
+``census_server.py``) and measures the time taken by common client
+operations against it. Since the stand-in responds near-instantly by
+default, the numbers mostly reflect the client-side overhead of
+request handling, URL generation and model parsing.
+
+Example usage:
+
+    python tools/census_benchmark.py --iterations 500
+    python tools/census_benchmark.py --latency 0.02 --concurrency 50
+    python tools/census_benchmark.py --debug-logging
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# Allow running the script from the repository root without installing
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable=wrong-import-position
+import auraxium  # noqa: E402
+from auraxium import ps2  # noqa: E402
+from auraxium.census import PreparedQuery, Query  # noqa: E402
+from census_server import CensusStandIn  # noqa: E402
+
+
+def _report(name: str, timings: list[float]) -> None:
+    """Print summary statistics for a list of durations in seconds."""
+    timings = sorted(timings)
+    p95 = timings[min(int(len(timings) * 0.95), len(timings) - 1)]
+    print(f'{name:<28} {len(timings):>6}  '
+          f'mean {statistics.fmean(timings) * 1e6:>9.1f} us  '
+          f'p50 {timings[len(timings) // 2] * 1e6:>9.1f} us  '
+          f'p95 {p95 * 1e6:>9.1f} us')
+
+
+async def _measure(name: str, iterations: int,
+                   func: Callable[[], Awaitable[Any]]) -> None:
+    """Time a coroutine function over a number of iterations."""
+    timings: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    _report(name, timings)
+
+
+def _measure_sync(name: str, iterations: int,
+                  func: Callable[[], Any]) -> None:
+    """Time a regular function over a number of iterations."""
+    timings: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    _report(name, timings)
+
+
+async def run(iterations: int, concurrency: int, latency: float,
+              error_rate: float) -> None:
+    """Run all benchmarks against a local stand-in server."""
+    standin = CensusStandIn(latency=latency, error_rate=error_rate)
+    runner = await standin.start()
+    port = runner.addresses[0][1]
+    endpoint = f'http://127.0.0.1:{port}'
+    items = standin.collections['item']
+    item_id = int(items[0]['item_id'])
+    character = standin.collections['character'][0]
+    try:
+        async with auraxium.Client(endpoints=endpoint) as client:
+            # Client-side processing only
+            query = Query('item', service_id=client.service_id,
+                          endpoint=client.endpoint, item_id=item_id)
+            query.limit(20).show('item_id', 'name')
+            _measure_sync('URL generation', iterations, query.url)
+            joined = Query('item', service_id=client.service_id,
+                           endpoint=client.endpoint)
+            joined.limit(20).show('item_id', 'name', 'item_category_id')
+            joined.create_join('item_category').set_inject_at('category')
+            _measure_sync('URL generation (with join)', iterations,
+                          lambda: joined.url(skip_checks=True))
+            template = joined.url_template(skip_checks=True)
+            _measure_sync('URL template (with join)', iterations,
+                          lambda: template.url(item_id=item_id))
+            prepared = PreparedQuery(joined, id='item_id')
+            _measure_sync('Prepared query (with join)', iterations,
+                          lambda: prepared.bind(id=item_id).url())
+            _measure_sync('Model parsing (Item)', iterations,
+                          lambda: ps2.Item(items[0], client=client))
+            _measure_sync(f'Bulk model parsing (x{len(items)})', iterations,
+                          lambda: ps2.Item.from_payloads(items, client=client))
+            ps2.Item.set_lazy_validation()
+            _measure_sync(f'Lazy model parsing (x{len(items)})', iterations,
+                          lambda: ps2.Item.from_payloads(items, client=client))
+            ps2.Item.set_lazy_validation(False)
+            bulk = ps2.Item.from_payloads(
+                [{**items[i % len(items)], 'item_id': str(i)}
+                 for i in range(10_000)], client=client)
+            _measure_sync('Sort by name (x10000)', max(iterations // 10, 1),
+                          lambda: sorted(bulk, key=lambda i: str(i.name)))
+            # Full requests
+            await _measure('Client.find (20 items)', iterations,
+                           lambda: client.find(ps2.Item, results=20))
+            await _measure('Client.get_by_id', iterations,
+                           lambda: client.get_by_id(ps2.Item, item_id))
+            await _measure(
+                'Client.get_by_name', iterations,
+                lambda: client.get_by_name(
+                    ps2.Character, character['name']['first']))
+            item = await client.get_by_id(ps2.Item, item_id)
+            assert item is not None
+            await _measure('InstanceProxy.resolve', iterations,
+                           lambda: item.category().resolve())
+            join = Query('outfit_member', service_id=client.service_id)
+            join.limit(20).create_join('character').set_fields(
+                'character_id')
+            await _measure('Query with join', iterations,
+                           lambda: client.request(join))
+            client.response_cache = auraxium.ResponseCache()
+            await _measure('Cached query with join', iterations,
+                           lambda: client.request(join))
+            client.response_cache = None
+
+            # Concurrent requests
+            async def batch() -> None:
+                await asyncio.gather(*(
+                    client.get_by_id(ps2.Item, int(i['item_id']))
+                    for i in items[:concurrency]))
+
+            await _measure(f'Concurrent get_by_id (x{concurrency})',
+                           max(iterations // 10, 1), batch)
+    finally:
+        await runner.cleanup()
+    print(f'Requests served: {standin.requests}')
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='The number of times to run each operation.')
+    parser.add_argument('--concurrency', type=int, default=20,
+                        help='The number of concurrent requests to issue '
+                             'in the batch benchmark.')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Mean delay in seconds added to responses.')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests to answer with an '
+                             'error. These are retried by the client.')
+    parser.add_argument('--debug-logging', action='store_true',
+                        help='Enable DEBUG logging for the client, writing '
+                             'all records to the null device.')
+    args = parser.parse_args()
+    if args.debug_logging:
+        # Records are formatted and written, but not displayed
+        handler = logging.StreamHandler(
+            open(os.devnull, 'w', encoding='utf-8'))
+        logger = logging.getLogger('auraxium')
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+    asyncio.run(run(args.iterations, args.concurrency, args.latency,
+                    args.error_rate))
+
+
+if __name__ == '__main__':
+    main()
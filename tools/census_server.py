@@ -0,0 +1,332 @@
+"""Local stand-in for the Census REST API.
+
+This script serves the payload fixtures in ``tests/data/rest`` through
+an HTTP interface emulating the Census API's URL format, i.e.
+``/s:<service_id>/get/ps2:v2/<collection>?<terms>``. The service ID
+segment is optional.
+
+Supported features:
+
+- Search terms, including search modifiers, comma-separated lists of
+  values and nested fields (e.g. ``name.first_lower=...``)
+- The ``get`` and ``count`` verbs
+- ``c:limit``, ``c:start``, ``c:show``, ``c:hide``, ``c:sort``,
+  ``c:case``, ``c:join`` (including nested joins) and ``c:timing``
+- Injectable latency and error rates
+
+Example usage:
+
+    python tools/census_server.py --port 8080 --latency 0.05
+
+Then point a client at it:
+
+    client = Client(endpoints='http://127.0.0.1:8080')
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+_FIXTURES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'tests', 'data', 'rest')
+_NAMESPACES = ('ps2', 'ps2:v2')
+# Search modifier literals prefixed to term values
+_MODIFIERS = ('<', '[', '>', ']', '^', '*', '!')
+
+_Item = dict[str, Any]
+
+
+def load_fixtures(directory: str = _FIXTURES) -> dict[str, list[_Item]]:
+    """Load all payload fixtures, keyed by collection."""
+    collections: dict[str, list[_Item]] = {}
+    for subdir in ('datatype_payloads', 'enum_payloads'):
+        path = os.path.join(directory, subdir)
+        for filename in sorted(os.listdir(path)):
+            collection, ext = os.path.splitext(filename)
+            if ext != '.json':
+                continue
+            with open(os.path.join(path, filename), encoding='utf-8') as file_:
+                data = json.load(file_)
+            collections[collection] = data[f'{collection}_list']
+    return collections
+
+
+def _get_field(item: _Item, field: str) -> Any:
+    """Return the value of a (possibly nested) field."""
+    value: Any = item
+    for key in field.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _compare(value: Any, literal: str, case: bool) -> int | None:
+    """Compare a field value to a term literal.
+
+    Returns a negative number, zero or a positive number if the value
+    is less than, equal to, or greater than the literal. Returns
+    :obj:`None` for missing values.
+    """
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    try:
+        diff = float(value) - float(literal)
+    except ValueError:
+        lhs, rhs = str(value), literal
+        if not case:
+            lhs, rhs = lhs.lower(), rhs.lower()
+        return (lhs > rhs) - (lhs < rhs)
+    return (diff > 0) - (diff < 0)
+
+
+def match_term(item: _Item, field: str, raw: str, case: bool) -> bool:
+    """Return whether an item matches a single search term."""
+    modifier = raw[0] if raw[:1] in _MODIFIERS else ''
+    literals = raw[len(modifier):].split(',')
+    value = _get_field(item, field)
+    for literal in literals:
+        if modifier in ('^', '*'):
+            text, lit = str(value), literal
+            if not case:
+                text, lit = text.lower(), lit.lower()
+            if value is not None and (
+                    text.startswith(lit) if modifier == '^' else lit in text):
+                return True
+            continue
+        result = _compare(value, literal, case)
+        if result is None:
+            continue
+        if {'': result == 0, '!': result != 0, '<': result < 0,
+                '[': result <= 0, '>': result > 0,
+                ']': result >= 0}[modifier]:
+            return True
+    return False
+
+
+def _filter_fields(item: _Item, show: list[str], hide: list[str],
+                   keep: tuple[str, ...] = ()) -> _Item:
+    """Apply c:show or c:hide to a single item.
+
+    The fields in `keep`, such as the injected results of joins, are
+    never removed.
+    """
+    if show:
+        return {k: v for k, v in item.items() if k in show or k in keep}
+    if hide:
+        return {k: v for k, v in item.items() if k not in hide}
+    return item
+
+
+def _split_top_level(string: str, separator: str = ',') -> list[str]:
+    """Split a string, ignoring separators within parentheses."""
+    parts: list[str] = []
+    depth = 0
+    current = ''
+    for char in string:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    if current:
+        parts.append(current)
+    return parts
+
+
+def parse_join(string: str) -> dict[str, Any]:
+    """Parse a single c:join specification, including inner joins."""
+    inner: list[dict[str, Any]] = []
+    if '(' in string:
+        index = string.index('(')
+        inner = [parse_join(j)
+                 for j in _split_top_level(string[index + 1:-1])]
+        string = string[:index]
+    collection, *options = string.split('^')
+    join: dict[str, Any] = {
+        'collection': collection.removeprefix('type:'), 'list': False,
+        'outer': True, 'show': [], 'hide': [], 'terms': [], 'joins': inner}
+    for option in options:
+        key, _, value = option.partition(':')
+        if key in ('on', 'to', 'inject_at'):
+            join[key] = value
+        elif key in ('list', 'outer'):
+            join[key] = value == '1'
+        elif key in ('show', 'hide'):
+            join[key] = value.split('\'')
+        elif key == 'terms':
+            join['terms'] = [t.split('=', 1) for t in value.split('\'')]
+    join.setdefault('on', f'{join["collection"]}_id')
+    join.setdefault('to', join['on'])
+    join.setdefault('inject_at', f'{join["on"]}_join_{join["collection"]}')
+    return join
+
+
+class CensusStandIn:
+    """Fixture-backed emulation of the Census REST API.
+
+    .. attribute:: error_rate
+
+       The fraction of requests answered with an HTTP 503
+       ``service_unavailable`` error.
+
+    .. attribute:: latency
+
+       The mean delay in seconds added to every response.
+
+    .. attribute:: requests
+
+       The number of requests served.
+    """
+
+    def __init__(self, collections: dict[str, list[_Item]] | None = None,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0) -> None:
+        self.collections: dict[str, list[_Item]] = (
+            load_fixtures() if collections is None else collections)
+        self.error_rate: float = error_rate
+        self.jitter: float = jitter
+        self.latency: float = latency
+        self.requests: int = 0
+        self._rng = random.Random(seed)
+
+    def app(self) -> web.Application:
+        """Return an :class:`aiohttp.web.Application` serving the API."""
+        app = web.Application()
+        app.router.add_get(
+            r'/{service_id:s:[^/]+}/{verb}/{namespace}/{collection:.*}',
+            self.handle)
+        app.router.add_get(
+            r'/{verb:get|count}/{namespace}/{collection:.*}', self.handle)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0
+                    ) -> web.AppRunner:
+        """Start serving in the background.
+
+        Use port 0 to pick any free port; the actual port can be read
+        from the returned runner's addresses.
+        """
+        runner = web.AppRunner(self.app(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handle a single API request."""
+        self.requests += 1
+        start = time.perf_counter()
+        if self.latency > 0.0:
+            delay = self.latency * (1.0 + self.jitter * (
+                2.0 * self._rng.random() - 1.0))
+            await asyncio.sleep(max(delay, 0.0))
+        if self.error_rate > 0.0 and self._rng.random() < self.error_rate:
+            return web.json_response(
+                {'error': 'service_unavailable'}, status=503)
+        verb = request.match_info['verb']
+        namespace = request.match_info['namespace']
+        collection = request.match_info['collection'].strip('/')
+        if (verb not in ('get', 'count') or namespace not in _NAMESPACES
+                or collection not in self.collections):
+            return web.json_response({'error': 'No data found.'})
+        params = request.rel_url.query
+        case = params.get('c:case', '1') != '0'
+        results = self._search(collection, params, case)
+        if verb == 'count':
+            return web.json_response({'count': len(results)})
+        if sort := params.get('c:sort'):
+            for key in reversed(sort.split(',')):
+                field, _, order = key.partition(':')
+                results.sort(key=lambda i, f=field: str(_get_field(i, f)),
+                             reverse=order == '-1')
+        offset = int(params.get('c:start', 0))
+        limit = int(params.get('c:limit', 1))
+        results = results[offset:offset + limit]
+        joins = [parse_join(j)
+                 for j in _split_top_level(params.get('c:join', ''))]
+        for join in joins:
+            results = self._apply_join(join, results)
+        show = params['c:show'].split(',') if 'c:show' in params else []
+        hide = params['c:hide'].split(',') if 'c:hide' in params else []
+        keep = tuple(j['inject_at'] for j in joins)
+        results = [_filter_fields(i, show, hide, keep) for i in results]
+        data: dict[str, Any] = {
+            f'{collection}_list': results, 'returned': len(results)}
+        if params.get('c:timing') in ('1', 'true'):
+            elapsed = (time.perf_counter() - start) * 1000.0
+            data['timing'] = {'total-ms': str(int(elapsed))}
+        return web.json_response(data)
+
+    def _search(self, collection: str, params: Any, case: bool
+                ) -> list[_Item]:
+        """Return all items of a collection matching the query terms."""
+        terms = [(k, v) for k, v in params.items() if not k.startswith('c:')]
+        return [item for item in self.collections[collection]
+                if all(match_term(item, k, v, case) for k, v in terms)]
+
+    def _apply_join(self, join: dict[str, Any], parents: list[_Item]
+                    ) -> list[_Item]:
+        """Inject the joined items into each parent item."""
+        children = self.collections.get(join['collection'], [])
+        output: list[_Item] = []
+        for parent in parents:
+            value = _get_field(parent, join['on'])
+            matches = [
+                c for c in children
+                if value is not None and str(c.get(join['to'])) == str(value)
+                and all(match_term(c, k, v, True) for k, v in join['terms'])]
+            for inner in join['joins']:
+                matches = self._apply_join(inner, matches)
+            keep = tuple(j['inject_at'] for j in join['joins'])
+            matches = [_filter_fields(c, join['show'], join['hide'], keep)
+                       for c in matches]
+            if not matches:
+                if join['outer']:
+                    output.append(parent)
+                continue
+            output.append({**parent, join['inject_at']: (
+                matches if join['list'] else matches[0])})
+        return output
+
+
+async def main(host: str, port: int, latency: float, jitter: float,
+               error_rate: float) -> None:
+    """Run the stand-in server until interrupted."""
+    standin = CensusStandIn(latency=latency, jitter=jitter,
+                            error_rate=error_rate)
+    runner = await standin.start(host, port)
+    print(f'Serving {len(standin.collections)} collections on '
+          f'http://{host}:{port}')
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    _parser = argparse.ArgumentParser()
+    _parser.add_argument('--host', default='127.0.0.1',
+                         help='The interface to listen on.')
+    _parser.add_argument('--port', type=int, default=8080,
+                         help='The port to listen on.')
+    _parser.add_argument('--latency', type=float, default=0.0,
+                         help='Mean delay in seconds added to responses.')
+    _parser.add_argument('--jitter', type=float, default=0.0,
+                         help='Relative random variation of the latency.')
+    _parser.add_argument('--error-rate', type=float, default=0.0,
+                         help='Fraction of requests to answer with an '
+                              'HTTP 503 error.')
+    _args = _parser.parse_args()
+    asyncio.run(main(_args.host, _args.port, _args.latency, _args.jitter,
+                     _args.error_rate))
@@ -0,0 +1,142 @@
+"""Throughput benchmark for the event client.
+
+By default, this starts a local ESS stand-in (see ``ess_server.py``),
+connects an :class:`auraxium.event.EventClient` to it and reports the
+number of events per second the client received and dispatched.
+
+Alternatively, ``--replay`` feeds a recording created with
+:class:`auraxium.event.Recorder` into the client at maximum speed,
+measuring the dispatch and trigger logic without any networking.
+
+Example usage:
+
+    python tools/ess_benchmark.py --rate GainExperience=5000 --duration 10
+    python tools/ess_benchmark.py --replay stream.jsonl.gz
+
+Use ``--min-rate`` to exit with a non-zero status if the measured
+throughput is too low, e.g. to catch regressions in CI.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Allow running the script from the repository root without installing
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable=wrong-import-position
+from auraxium import event  # noqa: E402
+from ess_server import EVENT_TYPES, StandInServer, parse_rates  # noqa: E402
+
+
+def _make_client(endpoint: str, events: list[str], triggers: int,
+                 shards: int = 1, offline: bool = False
+                 ) -> tuple[event.EventClient, list[int]]:
+    """Create a client with the given number of counting triggers."""
+    client = event.EventClient(ess_endpoint=endpoint, shards=shards)
+    if offline:
+        # Prevent the client from connecting when adding triggers
+        client._open = True  # pylint: disable=protected-access
+    counter = [0]
+
+    def count(_: event.Event) -> None:
+        counter[0] += 1
+
+    for index in range(triggers):
+        client.add_trigger(event.Trigger(
+            *events, action=count, name=f'bench_{index}'))
+    return client, counter
+
+
+async def run_live(rates: dict[str, float], worlds: list[int],
+                   duration: float, triggers: int, shards: int) -> float:
+    """Benchmark the client against the local stand-in server."""
+    standin = StandInServer(rates, worlds)
+    server = await standin.start()
+    port = next(iter(server.sockets)).getsockname()[1]
+    client, counter = _make_client(
+        f'ws://127.0.0.1:{port}/streaming', list(rates), triggers, shards)
+    try:
+        await asyncio.wait_for(client.wait_ready(), timeout=10.0)
+        # Allow the subscriptions to be sent before measuring
+        await asyncio.sleep(0.5)
+        start_sent, start_count = standin.sent, counter[0]
+        client.metrics.snapshot()
+        start = time.perf_counter()
+        await asyncio.sleep(duration)
+        elapsed = time.perf_counter() - start
+        sent = standin.sent - start_sent
+        received = (counter[0] - start_count) // max(triggers, 1)
+        metrics = client.metrics.snapshot()
+    finally:
+        await client.close()
+        standin.stop()
+        server.close()
+        await server.wait_closed()
+    print(f'Sent:     {sent} events ({sent / elapsed:.0f}/s), '
+          f'{standin.dropped} dropped by the server')
+    print(f'Received: {received} events ({received / elapsed:.0f}/s)')
+    print(f'Decode:   {metrics.decode_time * 1e6:.1f} us/event, '
+          f'dispatch: {metrics.dispatch_time * 1e6:.1f} us/event')
+    return received / elapsed
+
+
+async def run_replay(path: str, triggers: int) -> float:
+    """Benchmark the client's dispatch logic using a recording."""
+    client, counter = _make_client(
+        'ws://127.0.0.1:1/streaming', list(EVENT_TYPES), triggers,
+        offline=True)
+    try:
+        start = time.perf_counter()
+        frames = await event.replay(client, path, speed=None)
+        # Let any remaining call-backs run
+        await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+    finally:
+        client._open = False  # pylint: disable=protected-access
+        await client.close()
+    print(f'Replayed: {frames} messages in {elapsed:.3f} s '
+          f'({frames / elapsed:.0f}/s)')
+    print(f'Call-backs run: {counter[0]}')
+    return frames / elapsed
+
+
+def main() -> int:
+    """Run the benchmark and return the process exit code."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rate', action='append', default=[],
+                        metavar='EVENT=RATE',
+                        help='Events per second and world to generate. '
+                             'Defaults to GainExperience=1000.')
+    parser.add_argument('--worlds', type=int, nargs='+', default=[1],
+                        help='The world IDs to generate events for.')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='The number of seconds to measure for.')
+    parser.add_argument('--triggers', type=int, default=1,
+                        help='The number of triggers to register.')
+    parser.add_argument('--shards', type=int, default=1,
+                        help='The number of websocket connections to use.')
+    parser.add_argument('--replay', metavar='FILE',
+                        help='Replay a recording instead of using the '
+                             'stand-in server.')
+    parser.add_argument('--min-rate', type=float, default=0.0,
+                        help='Fail if fewer events per second are '
+                             'processed.')
+    args = parser.parse_args()
+    if args.replay:
+        rate = asyncio.run(run_replay(args.replay, args.triggers))
+    else:
+        rates = parse_rates(args.rate or ['GainExperience=1000'])
+        rate = asyncio.run(run_live(rates, args.worlds, args.duration,
+                                    args.triggers, args.shards))
+    if rate < args.min_rate:
+        print(f'Throughput below minimum of {args.min_rate:.0f}/s')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
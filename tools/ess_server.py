@@ -0,0 +1,319 @@
+"""Local stand-in for the event streaming service.
+
+This script runs a websocket server speaking the subset of the ESS
+protocol used by :class:`auraxium.event.EventClient`. It generates
+synthetic events at configurable rates, allowing the client to be
+tested and benchmarked without network access.
+
+Example usage:
+
+    python tools/ess_server.py --port 8765 --rate Death=50 \\
+        --rate GainExperience=2000 --worlds 1 10 13
+
+Then point a client at it:
+
+    client = EventClient(ess_endpoint='ws://127.0.0.1:8765/streaming')
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import time
+import types
+import typing
+from typing import Any
+
+import websockets
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+from auraxium.models import Event
+
+# Event types by name, e.g. "Death"
+EVENT_TYPES: dict[str, type[Event]] = {
+    t.__name__: t for t in Event.__subclasses__()}
+
+# Interval in seconds at which synthetic events are generated
+_TICK = 0.01
+
+
+def _field_value(annotation: Any, rng: random.Random) -> str:
+    """Return a random payload value for the given field type."""
+    if isinstance(annotation, types.UnionType) or (
+            typing.get_origin(annotation) is typing.Union):
+        annotation = next(a for a in typing.get_args(annotation)
+                          if a is not type(None))
+    if annotation is bool:
+        return rng.choice(('0', '1'))
+    if annotation is int:
+        return str(rng.randrange(1, 10_000))
+    if annotation is float:
+        return f'{rng.random():.3f}'
+    return 'synthetic'
+
+
+def make_payload(event_name: str, world_id: int,
+                 rng: random.Random) -> dict[str, str]:
+    """Generate a synthetic event payload.
+
+    All fields of the corresponding event model are populated with
+    random values of the appropriate type.
+    """
+    model = EVENT_TYPES[event_name]
+    payload = {name: _field_value(field.annotation, rng)
+               for name, field in model.model_fields.items()}
+    payload.update(
+        event_name=event_name, world_id=str(world_id),
+        timestamp=str(int(datetime.datetime.now(
+            datetime.timezone.utc).timestamp())))
+    if 'character_id' in payload:
+        # Use a distinct range to make character filters easy to test
+        payload['character_id'] = str(
+            5_400_000_000_000_000_000 + rng.randrange(1000))
+    return payload
+
+
+class _Subscription:
+    """The subscription state of a single client connection."""
+
+    def __init__(self) -> None:
+        self.characters: set[str] = set()
+        self.events: set[str] = set()
+        self.logical_and: bool = False
+        self.worlds: set[str] = set()
+
+    def update(self, message: dict[str, Any]) -> None:
+        """Apply a subscribe or clearSubscribe message."""
+        if message.get('all') in (True, 'true'):
+            self.characters.clear()
+            self.events.clear()
+            self.worlds.clear()
+            return
+        if message.get('action') == 'subscribe':
+            self.characters.update(message.get('characters', []))
+            self.events.update(message.get('eventNames', []))
+            self.worlds.update(message.get('worlds', []))
+            self.logical_and = str(message.get(
+                'logicalAndCharactersWithWorlds', False)).lower() == 'true'
+        else:
+            self.characters.difference_update(message.get('characters', []))
+            self.events.difference_update(message.get('eventNames', []))
+            self.worlds.difference_update(message.get('worlds', []))
+
+    def ack(self) -> dict[str, Any]:
+        """Return the subscription echo sent after each update."""
+        data: dict[str, Any] = {
+            'characterCount': len(self.characters),
+            'eventNames': sorted(self.events),
+            'logicalAndCharactersWithWorlds': self.logical_and,
+            'worlds': sorted(self.worlds)}
+        if 'all' in self.characters:
+            data['characters'] = ['all']
+        return {'subscription': data}
+
+    def matches(self, payload: dict[str, str]) -> bool:
+        """Return whether an event matches the subscription."""
+        if not ({'all', payload['event_name']} & self.events):
+            return False
+        world = bool({'all', payload['world_id']} & self.worlds)
+        character = bool(self.characters) and (
+            'all' in self.characters
+            or payload.get('character_id') in self.characters
+            or payload.get('attacker_character_id') in self.characters)
+        if self.logical_and:
+            return world and character
+        return world or character
+
+
+class StandInServer:
+    """Websocket server imitating the event streaming service.
+
+    Each client has a bounded queue of outgoing messages. Events are
+    dropped for clients that fall too far behind, similar to how the
+    real service treats slow consumers.
+
+    .. attribute:: connections
+
+       The number of clients currently connected.
+
+    .. attribute:: dropped
+
+       The number of event messages dropped due to full client queues.
+
+    .. attribute:: rates
+
+       The number of events generated per second, by event name and
+       world ID.
+
+    .. attribute:: sent
+
+       The number of event messages sent across all clients.
+    """
+
+    def __init__(self, rates: dict[str, float], worlds: list[int],
+                 heartbeat_interval: float = 30.0, queue_size: int = 10_000,
+                 seed: int = 0) -> None:
+        unknown = set(rates) - set(EVENT_TYPES)
+        if unknown:
+            raise ValueError(f'Unknown event types: {", ".join(unknown)}')
+        self.connections: int = 0
+        self.dropped: int = 0
+        self.rates: dict[tuple[str, int], float] = {
+            (e, w): r for e, r in rates.items() for w in worlds}
+        self.sent: int = 0
+        self._clients: dict[
+            ServerConnection, tuple[_Subscription, asyncio.Queue[str]]] = {}
+        self._heartbeat_interval = heartbeat_interval
+        self._queue_size = queue_size
+        self._rng = random.Random(seed)
+        self._tasks: list[asyncio.Task[None]] = []
+        self._worlds = worlds
+
+    async def handler(self, websocket: ServerConnection) -> None:
+        """Handle a single client connection."""
+        subscription = _Subscription()
+        queue: asyncio.Queue[str] = asyncio.Queue(self._queue_size)
+        self._clients[websocket] = subscription, queue
+        self.connections += 1
+        writer = asyncio.create_task(self._writer(websocket, queue))
+        queue.put_nowait(json.dumps({
+            'connected': 'true', 'service': 'push',
+            'type': 'connectionStateChanged'}))
+        queue.put_nowait(json.dumps({
+            'send this for help': {'service': 'event', 'action': 'help'}}))
+        for world in self._worlds:
+            queue.put_nowait(json.dumps({
+                'detail': f'EventServerEndpoint_Standin_{world}',
+                'online': 'true', 'service': 'event',
+                'type': 'serviceStateChange'}))
+        try:
+            async for message in websocket:
+                data = json.loads(message)
+                if data.get('action') in ('subscribe', 'clearSubscribe'):
+                    subscription.update(data)
+                    self._send(queue, json.dumps(subscription.ack()))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            del self._clients[websocket]
+            self.connections -= 1
+            writer.cancel()
+
+    async def generate(self) -> None:
+        """Generate events and send them to all subscribed clients."""
+        credit = {key: 0.0 for key in self.rates}
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(_TICK)
+            now = time.perf_counter()
+            # NOTE: The elapsed time is capped to keep the generator from
+            # spiralling if it cannot keep up with the requested rates.
+            elapsed, last = min(now - last, 10 * _TICK), now
+            for key, rate in self.rates.items():
+                credit[key] += rate * elapsed
+                count = int(credit[key])
+                credit[key] -= count
+                for _ in range(count):
+                    self._broadcast(make_payload(*key, self._rng))
+
+    async def heartbeat(self) -> None:
+        """Periodically send heartbeat messages to all clients."""
+        online = {f'EventServerEndpoint_Standin_{w}': 'true'
+                  for w in self._worlds}
+        message = json.dumps({
+            'online': online, 'service': 'event', 'type': 'heartbeat'})
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            for _, queue in self._clients.values():
+                self._send(queue, message)
+
+    def _broadcast(self, payload: dict[str, str]) -> None:
+        """Queue an event payload for all matching clients."""
+        message: str | None = None
+        for subscription, queue in self._clients.values():
+            if not subscription.matches(payload):
+                continue
+            if message is None:
+                message = json.dumps({
+                    'payload': payload, 'service': 'event',
+                    'type': 'serviceMessage'})
+            if self._send(queue, message):
+                self.sent += 1
+            else:
+                self.dropped += 1
+
+    @staticmethod
+    def _send(queue: asyncio.Queue[str], message: str) -> bool:
+        """Queue a message, returning whether there was room for it."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    @staticmethod
+    async def _writer(websocket: ServerConnection,
+                      queue: asyncio.Queue[str]) -> None:
+        """Send queued messages to a client until it disconnects."""
+        try:
+            while True:
+                await websocket.send(await queue.get())
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> Server:
+        """Start serving and generating events in the background.
+
+        Use port 0 to pick any free port; the actual port can be read
+        from the returned server's sockets.
+        """
+        server = await serve(self.handler, host, port)
+        loop = asyncio.get_running_loop()
+        self._tasks.extend((loop.create_task(self.generate()),
+                            loop.create_task(self.heartbeat())))
+        return server
+
+    def stop(self) -> None:
+        """Stop generating events."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+
+def parse_rates(values: list[str]) -> dict[str, float]:
+    """Parse ``EventName=rate`` command line arguments."""
+    rates: dict[str, float] = {}
+    for value in values:
+        name, _, rate = value.partition('=')
+        rates[name] = float(rate)
+    return rates
+
+
+async def main(host: str, port: int, rates: dict[str, float],
+               worlds: list[int]) -> None:
+    """Run the stand-in server until interrupted."""
+    standin = StandInServer(rates, worlds)
+    server = await standin.start(host, port)
+    print(f'Serving on ws://{host}:{port}/streaming')
+    try:
+        await server.serve_forever()
+    finally:
+        standin.stop()
+
+
+if __name__ == '__main__':
+    _parser = argparse.ArgumentParser()
+    _parser.add_argument('--host', default='127.0.0.1',
+                         help='The interface to listen on.')
+    _parser.add_argument('--port', type=int, default=8765,
+                         help='The port to listen on.')
+    _parser.add_argument('--rate', action='append', default=[],
+                         metavar='EVENT=RATE',
+                         help='Events per second and world to generate. '
+                              'May be given multiple times.')
+    _parser.add_argument('--worlds', type=int, nargs='+', default=[1],
+                         help='The world IDs to generate events for.')
+    _args = _parser.parse_args()
+    asyncio.run(main(_args.host, _args.port, parse_rates(_args.rate),
+                     _args.worlds))
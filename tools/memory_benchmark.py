@@ -0,0 +1,101 @@
+"""Memory benchmark for the object model.
+
+This instantiates a large number of objects of common types from the
+Census fixtures (see ``census_server.py``) and reports the memory
+allocated per object, including its data class instance and any cache
+entries. The payloads themselves are created beforehand and are not
+counted.
+
+Example usage:
+
+    python tools/memory_benchmark.py --count 100000
+    python tools/memory_benchmark.py --type Character --lazy
+    python tools/memory_benchmark.py --type Item --intern
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any, cast
+
+# Allow running the script from the repository root without installing
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable=wrong-import-position
+import auraxium  # noqa: E402
+from auraxium import ps2  # noqa: E402
+from auraxium.base import Ps2Object  # noqa: E402
+from census_server import load_fixtures  # noqa: E402
+
+_DEFAULT_TYPES = ('Achievement', 'Character', 'Item', 'Outfit', 'Vehicle',
+                  'Weapon', 'World', 'Zone')
+
+
+def _payloads(template: list[dict[str, Any]], id_field: str,
+              count: int) -> list[dict[str, Any]]:
+    """Return independent copies of the given payloads with unique IDs."""
+    encoded = [json.dumps(p) for p in template]
+    payloads: list[dict[str, Any]] = []
+    for index in range(count):
+        payload = json.loads(encoded[index % len(encoded)])
+        payload[id_field] = str(index + 1)
+        payloads.append(payload)
+    return payloads
+
+
+def _measure(type_: type[Ps2Object], payloads: list[dict[str, Any]],
+             client: auraxium.Client) -> float:
+    """Return the memory allocated per object in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [type_(p, client=client) for p in payloads]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / len(payloads)
+
+
+def run(types: list[str], count: int, lazy: bool, intern: bool) -> None:
+    """Instantiate objects of the given types and print their size."""
+    fixtures = load_fixtures()
+    # Objects only store the client; no requests are made
+    client = cast(auraxium.Client, object())
+    if lazy:
+        Ps2Object.set_lazy_validation()
+    if intern:
+        Ps2Object.set_interning()
+    for name in types:
+        type_: type[Ps2Object] = getattr(ps2, name)
+        if not (template := fixtures.get(type_.collection)):
+            print(f'{name:<16} no fixture data')
+            continue
+        payloads = _payloads(template, type_.id_field, count)
+        size = _measure(type_, payloads, client)
+        print(f'{name:<16} {count:>8} objects  {size:>8.0f} bytes/object')
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=10_000,
+                        help='The number of objects to create per type.')
+    parser.add_argument('--type', action='append', dest='types',
+                        help='The object type to measure, e.g. "Character". '
+                             'May be repeated.')
+    parser.add_argument('--lazy', action='store_true',
+                        help='Enable lazy validation for all types.')
+    parser.add_argument('--intern', action='store_true',
+                        help='Enable interning of localised strings for all '
+                             'types.')
+    args = parser.parse_args()
+    run(args.types or list(_DEFAULT_TYPES), args.count, args.lazy,
+        args.intern)
+
+
+if __name__ == '__main__':
+    main()
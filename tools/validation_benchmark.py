@@ -0,0 +1,88 @@
+"""Validation benchmark for the collection models.
+
+This validates the fixture payloads of every collection (see
+``census_server.py``) against their model in
+:mod:`auraxium.collections` and reports the time taken per instance.
+Since payloads are kept in memory, the numbers reflect the cost of
+pydantic validation alone, including any validators defined on
+:class:`auraxium.models.base.RESTPayload`.
+
+Example usage:
+
+    python tools/validation_benchmark.py --iterations 500
+    python tools/validation_benchmark.py --collection item --collection zone
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from typing import Any
+
+# Allow running the script from the repository root without installing
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable=wrong-import-position
+from auraxium.models.base import RESTPayload  # noqa: E402
+from census_server import load_fixtures  # noqa: E402
+
+
+def _model(collection: str) -> type[RESTPayload] | None:
+    """Return the collection model for a collection, if any."""
+    try:
+        module = importlib.import_module(f'auraxium.collections.{collection}')
+    except ImportError:
+        return None
+    name = ''.join(s.capitalize() for s in collection.split('_'))
+    return getattr(module, name, None)
+
+
+def _measure(model: type[RESTPayload], payloads: list[dict[str, Any]],
+             iterations: int) -> float:
+    """Return the best time in seconds to validate a payload."""
+    timings: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for payload in payloads:
+            model.model_validate(payload)
+        timings.append((time.perf_counter() - start) / len(payloads))
+    return min(timings)
+
+
+def run(iterations: int, collections: list[str] | None) -> None:
+    """Validate the fixtures of all collections and print the timings."""
+    fixtures = load_fixtures()
+    total = 0.0
+    count = 0
+    for collection in sorted(fixtures):
+        if collections and collection not in collections:
+            continue
+        payloads = fixtures[collection]
+        if (model := _model(collection)) is None or not payloads:
+            continue
+        timing = _measure(model, payloads, iterations)
+        print(f'{model.__name__:<28} {len(model.model_fields):>4} fields  '
+              f'{timing * 1e6:>8.2f} us')
+        total += timing
+        count += 1
+    if count:
+        print(f'{"Mean":<28} {"":>11}  {total / count * 1e6:>8.2f} us')
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='The number of times to validate each '
+                             'collection\'s payloads.')
+    parser.add_argument('--collection', action='append', dest='collections',
+                        help='Only benchmark the given collection. May be '
+                             'repeated.')
+    args = parser.parse_args()
+    run(args.iterations, args.collections)
+
+
+if __name__ == '__main__':
+    main()